@@ -0,0 +1,16 @@
+# Scripted scenario benchmarks (python -m benchmarks.run) and
+# microbenchmarks (python -m benchmarks.micro).
+#
+# Both run headlessly under SDL's dummy drivers from the repo root, where
+# the game loads its assets from.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
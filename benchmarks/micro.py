@@ -0,0 +1,291 @@
+"""Microbenchmarks for hot functions, with a baseline and regression check.
+
+    python -m benchmarks.micro                         # run all, print a table
+    python -m benchmarks.micro scratch particles       # only names containing these
+    python -m benchmarks.micro --save                  # write benchmarks/baseline.json
+    python -m benchmarks.micro --compare               # flag regressions vs. the baseline
+    python -m benchmarks.micro --compare -t 0.2        # ... beyond 20%
+
+Each benchmark builds its fixture once, warms up, then times ``REPEATS``
+batches of calls and reports per-call statistics from the batch times.
+Fixtures whose calls change their state can also give a reset, run
+untimed before every batch so each batch does the same work.
+Comparisons use the median, which holds up best to scheduler noise;
+``--compare`` exits with status 1 if anything regressed. The baseline is
+machine-specific, so it isn't checked in.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import ROOT
+import pygame
+
+pygame.init()
+SCREEN = pygame.display.set_mode((1800, 900))
+
+from game.config import TICKET_TYPES, load_symbol_images, load_ticket_images
+from game.effects import DrunkEffect
+from game.particles import ParticleSystem
+from game.ticket import create_ticket
+from game.ticket_mat import TicketMatManager
+from game.ui.side_menu import SideMenuManager
+
+load_symbol_images()
+load_ticket_images()
+
+BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+WARMUP_SECONDS = 0.2
+BATCH_SECONDS = 0.05        # target length of one timed batch
+REPEATS = 15
+DEFAULT_THRESHOLD = 0.10
+SEED = 1234
+
+BENCHMARKS = {}
+
+
+def bench(name):
+    """Register ``fixture() -> fn`` or ``fixture() -> (fn, reset)``; *fn*
+    is the call being timed and *reset* restores its state between batches.
+    """
+    def register(fixture):
+        BENCHMARKS[name] = fixture
+        return fixture
+    return register
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def _points(rect, n=997):
+    rng = random.Random(SEED)
+    return [(rect.x + rng.randrange(rect.width), rect.y + rng.randrange(rect.height))
+            for _ in range(n)]
+
+
+@bench("ticket.scratch")
+def _scratch():
+    # Scratching uncovers the ticket, so each batch starts on a fresh one
+    state = {}
+
+    def reset():
+        state["ticket"] = create_ticket("basic", 0, 0, 340, 280)
+        state["i"] = 0
+
+    reset()
+    points = _points(state["ticket"].get_rect())
+
+    def run():
+        i = state["i"] = (state["i"] + 1) % len(points)
+        state["ticket"].scratch(*points[i])
+    return run, reset
+
+
+@bench("ticket.update_scratch_percent")
+def _scratch_percent():
+    ticket = create_ticket("basic", 0, 0, 340, 280)
+    return ticket._update_scratch_percent
+
+
+@bench("match3.update_cells_revealed")
+def _cells_revealed():
+    # Unscratched, so every cell is sampled on every call
+    ticket = create_ticket("match3", 0, 0, 340, 280)
+    return ticket._update_cells_revealed
+
+
+def _create(ticket_type):
+    def fixture():
+        return lambda: create_ticket(ticket_type, 0, 0, 340, 280)
+    return fixture
+
+
+for _type in ("basic", "match3", "number_match_gold"):
+    bench(f"create_ticket.{TICKET_TYPES[_type].get('ticket_class', 'standard')}")(_create(_type))
+
+
+@bench("mat.get_ticket_at_point")
+def _ticket_at_point():
+    mat = TicketMatManager()
+    for ticket_type in ("basic", "match3", "jackpot", "number_match_gold"):
+        mat.add_ticket(create_ticket(ticket_type, 0, 0, 340, 280))
+    for _ in range(120):
+        mat.update(1 / 60)       # let the deal animations land
+    points = _points(mat.mat_rect)
+    state = {"i": 0}
+
+    def run():
+        i = state["i"] = (state["i"] + 1) % len(points)
+        mat.get_ticket_at_point(points[i])
+    return run
+
+
+def _particle_field(n=1500):
+    particles = ParticleSystem()
+    particles.rng = np.random.default_rng(SEED)
+    while particles.count < n:
+        particles.add_win_particles(900, 450, 100, 80)
+        particles.add_sparkles(900, 450, 25)
+        particles.add_scratch_particles(700, 400, (180, 180, 190), 10)
+        particles.add_smoke(1100, 500)
+    # Immortal and weightless, so the field stays the same while timed
+    count = particles.count
+    particles.life[:count] = 1e9
+    particles.max_life[:count] = 1e9
+    particles.gravity[:count] = 0
+    return particles
+
+
+@bench("particles.update")
+def _particles_update():
+    particles = _particle_field()
+    return lambda: particles.update(1 / 120)
+
+
+@bench("particles.draw")
+def _particles_draw():
+    particles = _particle_field()
+    particles.update(1 / 120)
+    return lambda: particles.draw(SCREEN)
+
+
+@bench("drunk.post_process")
+def _post_process():
+    drunk = DrunkEffect()
+    drunk.enabled = True
+    for _ in range(10):
+        drunk.update(1 / 60)     # fill the smear trail
+    frame = SCREEN.copy()
+
+    def run():
+        drunk.update(1 / 60)
+        drunk.post_process(SCREEN, frame)
+    return run
+
+
+@bench("side_panel.draw")
+def _side_panel_draw():
+    menus = SideMenuManager(1800, 900)
+    menus.open_panel("ticket_shop")
+    menus.setup_ticket_shop(TICKET_TYPES, list(TICKET_TYPES))
+    panel = menus.panels["ticket_shop"]
+    for _ in range(120):
+        panel.animate(1 / 60)    # fully slid out
+    return lambda: panel.draw(SCREEN)
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+def measure(fn, reset=None):
+    """Per-call timing stats (microseconds) for *fn*; *reset*, if given,
+    runs untimed before the warm-up and each batch."""
+    # Warm up and size the batches
+    if reset:
+        reset()
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < WARMUP_SECONDS:
+        fn()
+        calls += 1
+    per_call = (time.perf_counter() - start) / calls
+    batch = max(1, int(BATCH_SECONDS / per_call))
+
+    samples = []
+    perf = time.perf_counter
+    for _ in range(REPEATS):
+        if reset:
+            reset()
+        t0 = perf()
+        for _ in range(batch):
+            fn()
+        samples.append((perf() - t0) / batch * 1e6)
+
+    quartiles = statistics.quantiles(samples, n=4)
+    return {
+        "median_us": round(statistics.median(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3),
+        "iqr_us": round(quartiles[2] - quartiles[0], 3),
+        "min_us": round(min(samples), 3),
+        "calls_per_batch": batch,
+        "repeats": REPEATS,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Rows of (name, baseline median, current median, change, regressed)."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, None, result["median_us"], None, False))
+            continue
+        change = result["median_us"] / base["median_us"] - 1
+        rows.append((name, base["median_us"], result["median_us"], change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("filters", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--save", action="store_true", help="write results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("-b", "--baseline", default=BASELINE, help="baseline file")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown counted as a regression (default 0.10)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    names = [n for n in BENCHMARKS if not args.filters or any(f in n for f in args.filters)]
+    results = {}
+    for name in names:
+        random.seed(SEED)
+        fixture = BENCHMARKS[name]()
+        fn, reset = fixture if isinstance(fixture, tuple) else (fixture, None)
+        results[name] = measure(fn, reset)
+        if not args.json:
+            r = results[name]
+            print(f"{name:<34}{r['median_us']:>12.2f} us  ±{r['iqr_us']:.2f} (IQR)")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressed = False
+        print(f"\n{'benchmark':<34}{'baseline':>12}{'current':>12}{'change':>9}")
+        for name, base, current, change, bad in compare(results, baseline, args.threshold):
+            if base is None:
+                print(f"{name:<34}{'-':>12}{current:>12.2f}{'new':>9}")
+                continue
+            flag = "  REGRESSION" if bad else ""
+            print(f"{name:<34}{base:>12.2f}{current:>12.2f}{change:>+8.1%}{flag}")
+            regressed = regressed or bad
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Run the benchmark scenarios headlessly and report JSON.
+
+    python -m benchmarks.run                      # every scenario
+    python -m benchmarks.run jackpot_storm -f 900 # one scenario, 900 frames
+    python -m benchmarks.run -o results.json      # also write the report
+
+Each scenario runs in its own process under SDL's dummy video driver, so
+peak RSS is per scenario and no state leaks between runs. A scenario runs
+twice: a timed pass (frames/sec and per-frame percentiles of update +
+draw) and a pass under tracemalloc for peak Python allocations. Pygame
+surface pixels live outside the Python heap and only show up in RSS.
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks import ROOT
+import main
+from benchmarks.scenarios import SCENARIOS
+
+FRAME_DT = 1 / 60
+SEED = 1234
+
+
+def _new_game(scenario):
+    random.seed(SEED)
+    game = main.Game(persist=False)
+    game.particles.rng = np.random.default_rng(SEED)
+    scenario.setup(game)
+    return game
+
+
+def _frames(game, scenario, frames, times=None):
+    perf = time.perf_counter
+    for i in range(frames):
+        t0 = perf()
+        scenario.frame(game, i)
+        game.step(FRAME_DT)
+        game.draw()
+        if times is not None:
+            times[i] = perf() - t0
+
+
+def run_scenario(name, frames=None, memory=True):
+    """Run one scenario in this process and return its result dict."""
+    scenario = SCENARIOS[name]
+    frames = frames or scenario.frames
+
+    game = _new_game(scenario)
+    times = np.zeros(frames)
+    _frames(game, scenario, frames, times)
+    ms = times * 1000
+    result = {
+        "scenario": name,
+        "description": scenario.description,
+        "frames": frames,
+        "fps": round(frames / times.sum(), 1),
+        "frame_ms": {
+            "mean": round(float(ms.mean()), 3),
+            "p50": round(float(np.percentile(ms, 50)), 3),
+            "p95": round(float(np.percentile(ms, 95)), 3),
+            "p99": round(float(np.percentile(ms, 99)), 3),
+            "max": round(float(ms.max()), 3),
+        },
+    }
+
+    if memory:
+        del game
+        tracemalloc.start()
+        game = _new_game(scenario)
+        _frames(game, scenario, frames)
+        result["peak_python_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    # ru_maxrss is in kilobytes on Linux
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def _run_isolated(name, frames, memory):
+    cmd = [sys.executable, "-m", "benchmarks.run", "--child", name]
+    if frames:
+        cmd += ["--frames", str(frames)]
+    if not memory:
+        cmd.append("--no-memory")
+    out = subprocess.run(cmd, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"any of: {', '.join(SCENARIOS)}")
+    parser.add_argument("-f", "--frames", type=int, help="frames per scenario")
+    parser.add_argument("-o", "--output", help="also write the JSON report here")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--inline", action="store_true",
+                        help="run in this process instead of one process per scenario")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    memory = not args.no_memory
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, memory)))
+        return
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        if args.inline:
+            result = run_scenario(name, args.frames, memory)
+        else:
+            result = _run_isolated(name, args.frames, memory)
+        results.append(result)
+        print(f"{name:<22}{result['fps']:>9.1f} fps   p95 {result['frame_ms']['p95']:7.2f} ms",
+              file=sys.stderr)
+
+    report = {"frame_dt": FRAME_DT, "seed": SEED, "results": results}
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main_cli()
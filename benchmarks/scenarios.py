@@ -0,0 +1,161 @@
+"""Fixed benchmark scenarios.
+
+Each scenario sets a game up once (``setup``) and then scripts it frame by
+frame (``frame``) — setting ``game.input`` or calling game actions, the
+same way a headless policy would. Scenarios are deterministic apart from
+the game's own randomness, which ``benchmarks.run`` seeds.
+"""
+
+import math
+
+import pygame
+
+from game.ticket import create_ticket
+from game.ticket_mat import MAX_TICKETS_ON_MAT
+from game.ticket_registry import LIFECYCLE_STASHED
+
+
+RICH = 1_000_000_000
+
+
+class Scenario:
+    name = ""
+    description = ""
+    frames = 600
+
+    def setup(self, game):
+        pass
+
+    def frame(self, game, i):
+        pass
+
+
+def _keep_mat_full(game, ticket_types):
+    """Buy tickets (cycling through *ticket_types*) until the mat is full."""
+    mat = game.mat
+    i = len(mat.mat_tickets) + len(mat.ticket_queue)
+    while len(mat.mat_tickets) + len(mat.ticket_queue) < MAX_TICKETS_ON_MAT:
+        game.buy_ticket(ticket_types[i % len(ticket_types)])
+        i += 1
+
+
+class FullMatScratch(Scenario):
+    name = "full_mat_scratch"
+    description = "mouse held, sweeping across a full mat; finished tickets replaced"
+    TYPES = ("basic", "match3", "jackpot", "number_match_gold")
+
+    def setup(self, game):
+        game.player.money = RICH
+        game.player.upgrades["auto_collect"] = 3
+        _keep_mat_full(game, self.TYPES)
+
+    def frame(self, game, i):
+        _keep_mat_full(game, self.TYPES)
+        tickets = game.mat.mat_tickets
+        if not tickets:
+            game.input.mouse_pressed = False
+            return
+        # Spend a second on each ticket, tracing a Lissajous path below its handle
+        ticket = list(tickets)[(i // 60) % len(tickets)]
+        t = i / 60.0
+        x = ticket.x + ticket.width * (0.5 + 0.4 * math.sin(t * 7.0))
+        y = ticket.y + ticket.handle_height + 10 + \
+            (ticket.height - ticket.handle_height - 20) * (0.5 + 0.45 * math.sin(t * 5.3))
+        game.input.mouse_pos = game.camera.world_to_screen((int(x), int(y)))
+        game.input.mouse_pressed = True
+
+
+class BulkBuyQueue(Scenario):
+    name = "bulk_buy_queue"
+    description = "100 tickets bought at once, worked off by auto-scratch and auto-collect"
+    COUNT = 100
+
+    def setup(self, game):
+        game.player.money = RICH
+        game.player.upgrades["auto_scratcher"] = 5
+        game.player.upgrades["auto_collect"] = 3
+        for _ in range(self.COUNT):
+            game.buy_ticket("basic")
+
+
+class JackpotStorm(Scenario):
+    name = "jackpot_storm"
+    description = "big-win bursts every quarter second on top of a coin trail"
+
+    def setup(self, game):
+        game.player.money = RICH
+        _keep_mat_full(game, ("jackpot",))
+
+    def frame(self, game, i):
+        if i % 15 == 0:
+            x = 500 + (i * 37) % 800
+            y = 250 + (i * 53) % 400
+            game.particles.add_big_win_particles(x, y, 5000, 200)
+            game.screen_shake.shake(20, 0.3)
+        if i % 4 == 0:
+            game.particles.add_coin_trail(900 + 300 * math.sin(i / 20), 450)
+
+
+class DrunkFourTickets(Scenario):
+    name = "drunk_four_tickets"
+    description = "drunk vision on with four tickets on the mat"
+
+    def setup(self, game):
+        game.player.money = RICH
+        _keep_mat_full(game, ("basic", "match3"))
+        game.player.add_effect_to_player("drunk")
+
+    def frame(self, game, i):
+        game.player.active_effects["drunk"] = 30
+
+
+class SidePanelInventory(Scenario):
+    name = "side_panel_inventory"
+    description = "ticket inventory panel with 500 stashed tickets sliding and scrolling"
+    COUNT = 500
+
+    def setup(self, game):
+        mat = game.mat
+        for _ in range(self.COUNT):
+            ticket = create_ticket("basic", 0, 0, 340, 280)
+            tid = mat.registry.register(ticket)
+            mat.registry.set_lifecycle(tid, LIFECYCLE_STASHED)
+            mat.stashed_tickets.append(ticket)
+
+    def frame(self, game, i):
+        menus = game.side_menus
+        # Open for two seconds, closed for one
+        if i % 180 == 0:
+            menus.open_panel("ticket_inventory")
+            game._setup_side_panel("ticket_inventory")
+        elif i % 180 == 120:
+            menus.close_active()
+        panel = menus.panels["ticket_inventory"]
+        pos = (int(panel.current_x) + panel.panel_width // 2, 400)
+        game.input.mouse_pos = pos
+        if menus.active_panel_key:
+            menus.handle_scroll(-1 if (i // 60) % 2 == 0 else 1, pos)
+
+
+class PeeSplashes(Scenario):
+    name = "pee_splashes"
+    description = "pee minigame with a full bladder, steering left and right"
+
+    def frame(self, game, i):
+        if not game.pee_minigame_active:
+            game.player.current_bladder = game.player.max_bladder
+            game.pee_minigame.start(game.player)
+            game.pee_minigame_active = True
+        keys = game.input.held_keys
+        keys.clear()
+        keys.add(pygame.K_LEFT if (i // 45) % 2 == 0 else pygame.K_RIGHT)
+
+
+SCENARIOS = {s.name: s for s in (
+    FullMatScratch(),
+    BulkBuyQueue(),
+    JackpotStorm(),
+    DrunkFourTickets(),
+    SidePanelInventory(),
+    PeeSplashes(),
+)}
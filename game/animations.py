@@ -1,4 +1,12 @@
-"""Lightweight tween / animation utilities for the scratch-card game."""
+"""Lightweight tween / animation utilities for the scratch-card game.
+
+Tweens that are handed to an ``AnimationManager`` are stored in a
+struct-of-arrays ``TweenPool`` and advanced together in one NumPy pass per
+frame.  A ``Tween`` that has not been added to a manager keeps its own
+scalar state, so the standalone ``update`` / ``get_value`` usage still works.
+"""
+
+import numpy as np
 
 
 class Tween:
@@ -11,6 +19,9 @@ class Tween:
         while not tw.done:
             tw.update(dt)
             x = tw.get_value()
+
+    Once added to an ``AnimationManager`` the tween is a thin facade over a
+    slot in the manager's ``TweenPool``; reads go straight to the pool arrays.
     """
 
     EASE_FUNCS = {}  # populated by _register helpers below
@@ -19,29 +30,76 @@ class Tween:
         self.start = float(start)
         self.end = float(end)
         self.duration = max(duration, 0.001)  # avoid /0
-        self.elapsed = 0.0
-        self.done = False
+        self._elapsed = 0.0
+        self._done = False
         self._value = float(start)
 
-        if callable(ease_func):
+        if callable(ease_func) and ease_func not in EASE_IDS_BY_FUNC:
             self._ease = ease_func
+            self._ease_id = CUSTOM_EASE
         else:
-            self._ease = self.EASE_FUNCS.get(ease_func, Tween.ease_out_quad)
+            if callable(ease_func):
+                self._ease_id = EASE_IDS_BY_FUNC[ease_func]
+            else:
+                self._ease_id = EASE_IDS.get(ease_func, EASE_IDS["ease_out_quad"])
+            self._ease = _SCALAR_EASES[self._ease_id]
+
+        # Set while the tween lives in a TweenPool
+        self._pool = None
+        self._slot = -1
+
+    # ----- pool binding -----
+
+    def _bind(self, pool, owner):
+        """Move this tween's state into *pool*. Returns the slot index."""
+        self._slot = pool.alloc(self, owner)
+        self._pool = pool
+        return self._slot
+
+    def _unbind(self):
+        """Copy the pooled state back and release the slot."""
+        pool, slot = self._pool, self._slot
+        if pool is None:
+            return
+        self._elapsed = float(pool.elapsed[slot])
+        self._value = float(pool.value[slot])
+        self._done = bool(pool.done[slot])
+        pool.release(slot)
+        self._pool = None
+        self._slot = -1
+
+    # ----- public API -----
+
+    @property
+    def elapsed(self):
+        if self._pool is not None:
+            return float(self._pool.elapsed[self._slot])
+        return self._elapsed
+
+    @property
+    def done(self):
+        if self._pool is not None:
+            return bool(self._pool.done[self._slot])
+        return self._done
 
     def update(self, dt):
         """Advance the tween. Returns True when the tween has finished."""
-        if self.done:
+        if self._pool is not None:
+            return self._pool.step_slot(self._slot, dt)
+        if self._done:
             return True
-        self.elapsed += dt
-        t = min(self.elapsed / self.duration, 1.0)
+        self._elapsed += dt
+        t = min(self._elapsed / self.duration, 1.0)
         eased = self._ease(t)
         self._value = self.start + (self.end - self.start) * eased
         if t >= 1.0:
             self._value = self.end
-            self.done = True
-        return self.done
+            self._done = True
+        return self._done
 
     def get_value(self):
+        if self._pool is not None:
+            return float(self._pool.value[self._slot])
         return self._value
 
     # ----- built-in easing functions -----
@@ -76,6 +134,11 @@ class Tween:
         return 1 - (-2 * t + 2) ** 2 / 2
 
 
+def _ease_in_out_quad_vec(t):
+    """Array version of ``Tween.ease_in_out_quad`` (the scalar one branches)."""
+    return np.where(t < 0.5, 2 * t * t, 1 - (-2 * t + 2) ** 2 / 2)
+
+
 # Register all built-in easing functions
 Tween.EASE_FUNCS = {
     "linear": Tween.ease_linear,
@@ -86,6 +149,144 @@ Tween.EASE_FUNCS = {
     "ease_in_out_quad": Tween.ease_in_out_quad,
 }
 
+# Integer easing ids used by TweenPool (index into the tables below)
+CUSTOM_EASE = -1
+EASE_IDS = {name: i for i, name in enumerate(Tween.EASE_FUNCS)}
+EASE_IDS_BY_FUNC = {func: EASE_IDS[name] for name, func in Tween.EASE_FUNCS.items()}
+_SCALAR_EASES = tuple(Tween.EASE_FUNCS.values())
+_VECTOR_EASES = tuple(
+    _ease_in_out_quad_vec if name == "ease_in_out_quad" else func
+    for name, func in Tween.EASE_FUNCS.items()
+)
+
+
+class TweenPool:
+    """Struct-of-arrays storage for many tweens.
+
+    Each slot holds start, end, elapsed, duration, current value and an
+    easing id.  ``step(dt)`` advances every live slot in one vectorised pass
+    and returns the slots that finished during that step, along with any
+    that ``step_slot`` finished since the last ``step``, so the owner hears
+    about every completion exactly once.  Tweens with a custom (callable)
+    easing function are evaluated per slot after the vector pass.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self.start = np.zeros(0)
+        self.end = np.zeros(0)
+        self.elapsed = np.zeros(0)
+        self.duration = np.ones(0)
+        self.value = np.zeros(0)
+        self.ease = np.zeros(0, dtype=np.int16)
+        self.owner = np.full(0, -1, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)
+        self.done = np.zeros(0, dtype=bool)
+        self._free = []
+        self._custom = {}  # slot -> callable easing
+        self._stepped_done = []  # slots finished by step_slot, reported by step
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        old = self.capacity
+        extra = capacity - old
+
+        def extend(arr, fill):
+            return np.concatenate([arr, np.full(extra, fill, dtype=arr.dtype)])
+
+        self.start = extend(self.start, 0.0)
+        self.end = extend(self.end, 0.0)
+        self.elapsed = extend(self.elapsed, 0.0)
+        self.duration = extend(self.duration, 1.0)
+        self.value = extend(self.value, 0.0)
+        self.ease = extend(self.ease, 0)
+        self.owner = extend(self.owner, -1)
+        self.active = extend(self.active, False)
+        self.done = extend(self.done, False)
+        # Pop from the end -> lowest free slot first
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    def alloc(self, tween, owner=-1):
+        """Copy *tween*'s current state into a free slot and return its index."""
+        if not self._free:
+            self._grow(max(16, self.capacity * 2))
+        slot = self._free.pop()
+        self.start[slot] = tween.start
+        self.end[slot] = tween.end
+        self.duration[slot] = tween.duration
+        self.elapsed[slot] = tween._elapsed
+        self.value[slot] = tween._value
+        self.ease[slot] = tween._ease_id
+        self.owner[slot] = owner
+        self.active[slot] = True
+        self.done[slot] = tween._done
+        if tween._ease_id == CUSTOM_EASE:
+            self._custom[slot] = tween._ease
+        return slot
+
+    def release(self, slot):
+        self.active[slot] = False
+        self.owner[slot] = -1
+        self._custom.pop(slot, None)
+        if slot in self._stepped_done:
+            self._stepped_done.remove(slot)
+        self._free.append(slot)
+
+    def step(self, dt):
+        """Advance every live, unfinished slot by *dt*.
+
+        Returns an int array of the slots that completed during this step
+        or through ``step_slot`` since the last one.
+        """
+        stepped = np.array(self._stepped_done, dtype=np.int64)
+        self._stepped_done.clear()
+        live = np.flatnonzero(self.active & ~self.done)
+        if live.size == 0:
+            return stepped
+
+        elapsed = self.elapsed[live] + dt
+        self.elapsed[live] = elapsed
+        t = np.minimum(elapsed / self.duration[live], 1.0)
+
+        ease = self.ease[live]
+        eased = np.empty_like(t)
+        for ease_id in np.unique(ease):
+            mask = ease == ease_id
+            if ease_id == CUSTOM_EASE:
+                for i in np.flatnonzero(mask):
+                    eased[i] = self._custom[int(live[i])](float(t[i]))
+            else:
+                eased[mask] = _VECTOR_EASES[ease_id](t[mask])
+
+        start = self.start[live]
+        end = self.end[live]
+        finished = t >= 1.0
+        self.value[live] = np.where(finished, end, start + (end - start) * eased)
+        self.done[live] = finished
+        if stepped.size:
+            return np.concatenate([stepped, live[finished]])
+        return live[finished]
+
+    def step_slot(self, slot, dt):
+        """Scalar advance of a single slot (used by ``Tween.update``)."""
+        if self.done[slot]:
+            return True
+        self.elapsed[slot] += dt
+        t = min(self.elapsed[slot] / self.duration[slot], 1.0)
+        ease_id = int(self.ease[slot])
+        ease = self._custom[slot] if ease_id == CUSTOM_EASE else _SCALAR_EASES[ease_id]
+        start, end = self.start[slot], self.end[slot]
+        self.value[slot] = start + (end - start) * ease(float(t))
+        if t >= 1.0:
+            self.value[slot] = end
+            self.done[slot] = True
+            self._stepped_done.append(slot)
+        return bool(self.done[slot])
+
+    def live_count(self):
+        return int(np.count_nonzero(self.active))
+
 
 class TweenGroup:
     """Runs multiple Tweens in parallel (e.g. x and y for a 2-D slide)."""
@@ -93,15 +294,14 @@ class TweenGroup:
     def __init__(self, tweens):
         """tweens: dict of name -> Tween, e.g. {"x": Tween(...), "y": Tween(...)}"""
         self.tweens = tweens
-        self.done = False
+
+    @property
+    def done(self):
+        return all(tw.done for tw in self.tweens.values())
 
     def update(self, dt):
-        all_done = True
         for tw in self.tweens.values():
             tw.update(dt)
-            if not tw.done:
-                all_done = False
-        self.done = all_done
         return self.done
 
     def get_values(self):
@@ -110,8 +310,8 @@ class TweenGroup:
 
 
 class AnimationManager:
-    """Owns a list of active animations (Tween or TweenGroup),
-    updates them each frame, fires callbacks on completion, and
+    """Owns the active animations (Tween or TweenGroup), advances them all
+    in one ``TweenPool`` pass each frame, fires callbacks on completion, and
     removes finished animations.
 
     Usage::
@@ -123,33 +323,87 @@ class AnimationManager:
     """
 
     def __init__(self):
-        self._entries = []  # list of (tween_or_group, callback, tag)
+        self.pool = TweenPool()
+        self._entries = {}      # serial -> (tween_or_group, callback, tag)
+        self._slots = {}        # serial -> list of pool slots
+        self._pending = {}      # serial -> number of unfinished slots
+        self._by_tag = {}       # tag -> set of serials
+        self._next_serial = 0
 
     def add(self, tween, callback=None, tag=None):
         """Add a Tween or TweenGroup. *callback* is called (no args) when it
         finishes. *tag* is an optional string used by ``cancel(tag)``."""
-        self._entries.append((tween, callback, tag))
+        serial = self._next_serial
+        self._next_serial += 1
+
+        members = tween.tweens.values() if isinstance(tween, TweenGroup) else (tween,)
+        slots = [tw._bind(self.pool, serial) for tw in members]
+
+        self._entries[serial] = (tween, callback, tag)
+        self._slots[serial] = slots
+        self._pending[serial] = int(np.count_nonzero(~self.pool.done[slots]))
+        if tag is not None:
+            self._by_tag.setdefault(tag, set()).add(serial)
+
+        if self._pending[serial] == 0:
+            # Zero-length / already-finished animation: complete on next update
+            self._pending[serial] = -1
 
     def update(self, dt):
-        still_alive = []
-        for tween, callback, tag in self._entries:
-            done = tween.update(dt)
-            if done:
-                if callback:
-                    callback()
-            else:
-                still_alive.append((tween, callback, tag))
-        self._entries = still_alive
+        finished = self.pool.step(dt)
+
+        done_serials = [s for s, n in self._pending.items() if n < 0]
+        if finished.size:
+            owners, counts = np.unique(self.pool.owner[finished], return_counts=True)
+            for serial, count in zip(owners.tolist(), counts.tolist()):
+                remaining = self._pending[serial] - count
+                self._pending[serial] = remaining
+                if remaining <= 0:
+                    done_serials.append(serial)
+
+        if not done_serials:
+            return
+
+        # Fire callbacks in the order the animations were added
+        done_serials.sort()
+        callbacks = []
+        for serial in done_serials:
+            tween, callback, _ = self._entries[serial]
+            self._remove(serial)
+            if callback:
+                callbacks.append(callback)
+        for callback in callbacks:
+            callback()
+
+    def _remove(self, serial):
+        tween, _, tag = self._entries.pop(serial)
+        self._pending.pop(serial)
+        self._slots.pop(serial)
+        members = tween.tweens.values() if isinstance(tween, TweenGroup) else (tween,)
+        for tw in members:
+            tw._unbind()
+        if tag is not None:
+            serials = self._by_tag.get(tag)
+            if serials is not None:
+                serials.discard(serial)
+                if not serials:
+                    del self._by_tag[tag]
+
+    def entries(self):
+        """Iterate the live ``(tween_or_group, callback, tag)`` entries."""
+        return self._entries.values()
 
     def cancel(self, tag):
         """Remove all entries with the given tag (without calling callbacks)."""
-        self._entries = [(t, cb, tg) for t, cb, tg in self._entries if tg != tag]
+        for serial in list(self._by_tag.get(tag, ())):
+            self._remove(serial)
 
     def cancel_all(self):
-        self._entries.clear()
+        for serial in list(self._entries):
+            self._remove(serial)
 
     def is_animating(self, tag=None):
         """True if any animation (optionally filtered by tag) is running."""
         if tag is None:
             return len(self._entries) > 0
-        return any(tg == tag for _, _, tg in self._entries)
+        return tag in self._by_tag
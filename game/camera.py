@@ -0,0 +1,66 @@
+"""Camera — one world-to-screen transform for shake and drunk sway."""
+
+
+class Camera:
+    """Owns the offset between world and screen coordinates.
+
+    The world layer (background, mat, tickets) is rendered once, unshifted,
+    to an off-screen surface and ``present`` blits it with the camera
+    offset. Mouse input goes back through ``screen_to_world`` so hit-tests
+    match what the player sees. UI drawn straight to the screen (HUD,
+    menus, the dragged ticket) ignores the camera.
+    """
+
+    def __init__(self, screen_shake=None, drunk=None):
+        self.screen_shake = screen_shake
+        self.drunk = drunk
+        self.offset = (0, 0)
+
+    def update(self):
+        """Sample shake and sway once per frame."""
+        ox, oy = 0, 0
+        if self.screen_shake is not None:
+            sx, sy = self.screen_shake.get_offset()
+            ox += sx
+            oy += sy
+        if self.drunk is not None:
+            dx, dy = self.drunk.get_offset()
+            ox += dx
+            oy += dy
+        self.offset = (ox, oy)
+
+    @property
+    def is_moving(self):
+        return self.offset != (0, 0)
+
+    # ---- transforms ----
+
+    def world_to_screen(self, pos):
+        return (pos[0] + self.offset[0], pos[1] + self.offset[1])
+
+    def screen_to_world(self, pos):
+        return (pos[0] - self.offset[0], pos[1] - self.offset[1])
+
+    # ---- presentation ----
+
+    def present(self, screen, world, edge_color=(0, 0, 0)):
+        """Blit the world layer to *screen* at the camera offset.
+
+        The strips the offset uncovers are filled with *edge_color*; drunk
+        vision is applied here as a post-process when it's active.
+        """
+        ox, oy = self.offset
+        width, height = screen.get_size()
+        if ox > 0:
+            screen.fill(edge_color, (0, 0, ox, height))
+        elif ox < 0:
+            screen.fill(edge_color, (width + ox, 0, -ox, height))
+        if oy > 0:
+            screen.fill(edge_color, (0, 0, width, oy))
+        elif oy < 0:
+            screen.fill(edge_color, (0, height + oy, width, -oy))
+
+        if self.drunk is not None and self.drunk.enabled:
+            self.drunk.post_process(screen, world, self.offset)
+        else:
+            screen.blit(world, self.offset)
@@ -0,0 +1,109 @@
+"""Celebration director — merges wins that land together into one burst."""
+
+
+# Win tiers, highest first: minimum prize, money particles, additive
+# sparkles, big burst?, shake amount, shake duration, morale gained per
+# winning ticket
+WIN_TIERS = [
+    {"min_prize": 1000, "particles": 80, "sparkles": 30, "big": True,  "shake": 48, "duration": 1.2,  "morale": 400},
+    {"min_prize": 500,  "particles": 80, "sparkles": 25, "big": True,  "shake": 40, "duration": 0.9,  "morale": 250},
+    {"min_prize": 250,  "particles": 80, "sparkles": 20, "big": True,  "shake": 32, "duration": 0.7,  "morale": 180},
+    {"min_prize": 100,  "particles": 80, "sparkles": 15, "big": True,  "shake": 22, "duration": 0.55, "morale": 120},
+    {"min_prize": 50,   "particles": 80, "sparkles": 10, "big": False, "shake": 14, "duration": 0.4,  "morale": 70},
+    {"min_prize": 25,   "particles": 50, "sparkles": 0,  "big": False, "shake": 8,  "duration": 0.3,  "morale": 50},
+    {"min_prize": 0,    "particles": 20, "sparkles": 0,  "big": False, "shake": 4,  "duration": 0.18, "morale": 15},
+]
+
+# Particles added by the ring of extra bursts in add_big_win_particles
+BIG_BURST_EXTRA = 100
+
+
+def tier_for(prize):
+    """The WIN_TIERS entry a prize falls into."""
+    for tier in WIN_TIERS:
+        if prize >= tier["min_prize"]:
+            return tier
+    return WIN_TIERS[-1]
+
+
+class CelebrationDirector:
+    """Collects wins and plays one celebration per burst of wins.
+
+    Wins that complete within ``COALESCE_WINDOW`` seconds of the first one
+    are merged: the celebration uses the tier of the combined prize, grows
+    a little with each extra ticket and is capped, so a full mat paying
+    out at once gives one big shake and one bounded particle burst instead
+    of several stacked ones.
+    """
+
+    COALESCE_WINDOW = 0.15
+    EXTRA_WIN_SCALE = 0.25      # extra particles / shake per additional win
+    MAX_PARTICLES = 300         # money, ring and sparkles together
+    MAX_SPARKLES = 60
+    MAX_SHAKE = 48
+    MAX_SHAKE_DURATION = 1.2
+
+    def __init__(self, particles, screen_shake):
+        self.particles = particles
+        self.screen_shake = screen_shake
+        self._reset()
+
+    def _reset(self):
+        self._timer = 0
+        self._total = 0
+        self._wins = 0
+        self._best_prize = -1
+        self._origin = (0, 0)
+
+    @property
+    def pending(self):
+        return self._wins > 0
+
+    def add_win(self, prize, x, y):
+        """Queue a win centred at (x, y); it's celebrated after the window."""
+        if self._wins == 0:
+            self._timer = self.COALESCE_WINDOW
+        self._wins += 1
+        self._total += prize
+        # Burst from the biggest winner in the group
+        if prize > self._best_prize:
+            self._best_prize = prize
+            self._origin = (x, y)
+
+    def update(self, dt):
+        if self._wins == 0:
+            return
+        self._timer -= dt
+        if self._timer <= 0:
+            self._celebrate()
+
+    def flush(self):
+        """Celebrate anything pending right away."""
+        if self._wins:
+            self._celebrate()
+
+    def cancel(self):
+        """Drop pending wins without celebrating (e.g. on reset)."""
+        self._reset()
+
+    def _celebrate(self):
+        tier = tier_for(self._total)
+        scale = 1 + self.EXTRA_WIN_SCALE * (self._wins - 1)
+        x, y = self._origin
+
+        sparkles = min(int(tier["sparkles"] * scale), self.MAX_SPARKLES)
+        budget = self.MAX_PARTICLES - sparkles
+        if tier["big"]:
+            count = min(int(tier["particles"] * scale), budget - BIG_BURST_EXTRA)
+            self.particles.add_big_win_particles(x, y, self._total, count)
+        else:
+            count = min(int(tier["particles"] * scale), budget)
+            self.particles.add_win_particles(x, y, self._total, count)
+        if sparkles:
+            self.particles.add_sparkles(x, y, sparkles)
+
+        self.screen_shake.shake(
+            min(tier["shake"] * scale, self.MAX_SHAKE),
+            min(tier["duration"] * scale, self.MAX_SHAKE_DURATION),
+        )
+        self._reset()
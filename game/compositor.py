@@ -0,0 +1,111 @@
+"""Layered compositor — named draw layers with per-layer cache policies."""
+
+import pygame
+
+
+# Cache policies
+STATIC = "static"          # drawn once; neighbouring static layers are flattened together
+ON_CHANGE = "on_change"    # cached, redrawn only when the layer's key() changes
+PER_FRAME = "per_frame"    # drawn straight onto the target every frame
+
+
+class Layer:
+    def __init__(self, name, draw, policy=PER_FRAME, key=None):
+        self.name = name
+        self.draw = draw
+        self.policy = policy
+        self.key = key
+        self.surface = None
+        self.offset = (0, 0)
+        self.last_key = None
+
+
+class Compositor:
+    """Draws an ordered stack of named layers onto a target surface.
+
+    ``draw(surface)`` callbacks paint in target coordinates. Static and
+    on-change layers are rendered once into a transparent scratch surface
+    and cropped to what they actually drew, so compositing them is a single
+    blit of that area. Each run of neighbouring static layers is flattened
+    into one surface (opaque when it's the bottom of the stack). Blits
+    honour the target's clip, so the dirty-rect renderer can compose just
+    the changed regions.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.layers = []
+        self._steps = None
+        self._scratch = None
+
+    def add_layer(self, name, draw, policy=PER_FRAME, key=None):
+        if policy == ON_CHANGE and key is None:
+            raise ValueError(f"on-change layer '{name}' needs a key function")
+        self.layers.append(Layer(name, draw, policy, key))
+        self._steps = None
+
+    def layer(self, name):
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def invalidate(self, name=None):
+        """Redraw a cached layer (or every cached layer) on the next compose."""
+        layers = self.layers if name is None else [self.layer(name)]
+        for layer in layers:
+            if layer.policy == STATIC:
+                self._steps = None
+            layer.surface = None
+
+    # ---- building ----
+
+    def _build_steps(self):
+        """Collapse each run of static layers into one pre-rendered step."""
+        steps = []
+        run = []
+        for layer in self.layers + [None]:
+            if layer is not None and layer.policy == STATIC:
+                run.append(layer)
+                continue
+            if run:
+                flat = Layer("+".join(l.name for l in run),
+                             lambda surface, run=tuple(run): [l.draw(surface) for l in run],
+                             STATIC)
+                self._render(flat, opaque=not steps)
+                steps.append(flat)
+                run = []
+            if layer is not None:
+                steps.append(layer)
+        self._steps = steps
+
+    def _render(self, layer, opaque=False):
+        if opaque:
+            surface = pygame.Surface(self.size).convert()
+            layer.draw(surface)
+            layer.surface, layer.offset = surface, (0, 0)
+            return
+        if self._scratch is None:
+            self._scratch = pygame.Surface(self.size, pygame.SRCALPHA)
+        scratch = self._scratch
+        scratch.fill((0, 0, 0, 0))
+        layer.draw(scratch)
+        bounds = scratch.get_bounding_rect()
+        layer.surface = scratch.subsurface(bounds).copy()
+        layer.offset = bounds.topleft
+
+    # ---- drawing ----
+
+    def compose(self, target):
+        if self._steps is None:
+            self._build_steps()
+        for layer in self._steps:
+            if layer.policy == PER_FRAME:
+                layer.draw(target)
+                continue
+            if layer.policy == ON_CHANGE:
+                key = layer.key()
+                if layer.surface is None or key != layer.last_key:
+                    self._render(layer)
+                    layer.last_key = key
+            target.blit(layer.surface, layer.offset)
@@ -23,6 +23,17 @@ SYMBOLS = {
 
 SYMBOL_IMAGES = {}
 
+
+def load_image(path, alpha=True):
+    """Load an image, converted for fast blitting once a display exists.
+
+    Without a display (headless runs) the image is returned as loaded.
+    """
+    image = pygame.image.load(path)
+    if pygame.display.get_surface() is None:
+        return image
+    return image.convert_alpha() if alpha else image.convert()
+
 def load_symbol_images():
     if SYMBOL_IMAGES:
         return
@@ -64,7 +75,7 @@ def load_ticket_images():
     for fname in needed:
         path = os.path.join("assets", "tickets", fname)
         if os.path.isfile(path):
-            TICKET_IMAGES[fname] = pygame.image.load(path).convert_alpha()
+            TICKET_IMAGES[fname] = load_image(path)
         else:
             print(f"[ticket art] WARNING: {path} not found — will use fallback")
 
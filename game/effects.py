@@ -1,7 +1,6 @@
 import pygame
 import math
 import random
-from collections import deque
 
 
 class DrunkEffect:
@@ -16,43 +15,48 @@ class DrunkEffect:
         self.noise = 0.5
 
         # Double vision
-        self.ghost_delay = 0.5  # seconds
-        self._offset_history = deque()  # holds (time, (x,y))
         self.double_vision_strength = 50  # pixels
         self.double_vision_alpha = 220  # Transparency
-        self.ghost_trails = {}
-        self.ghost_cache = {}
 
         self.smear_count = 3  # how many smear copies
-        self.smear_spacing = 1.2  # how far apart they feel
 
-        self.ghost_lag = 20.0  # higher = slower catch-up
+        # Sway sampled once per frame in update() so drawing and hit-testing agree
+        self.offset = (0, 0)
+
+        # Full-frame post-process
+        self.frame_trail = []  # smoothed world offsets, newest first
+        self.post_ghost_strength = 0.5  # ghosts sit on top, so keep them faint
+        self._ghost_frame = None
 
     def toggle(self):
         self.enabled = not self.enabled
         if not self.enabled:
             self.time = 0.0
 
+    def reset(self):
+        """Drop sway phase, smear history and the cached ghost frame."""
+        self.time = 0.0
+        self.frame_trail.clear()
+        self._ghost_frame = None
+        self.offset = (0, 0)
+
     def update(self, dt):
         if not self.enabled:
-            self._offset_history.clear()
+            self.frame_trail.clear()
+            self.offset = (0, 0)
             return
 
         self.time += dt * self.speed
-
-        # record the "camera" offset for delayed ghosting
-        cur_offset = self.get_offset()
-        self._offset_history.append((self.time, cur_offset))
-
-        # drop history older than we need (keep a bit extra)
-        cutoff = self.time - (self.ghost_delay + 0.5)
-        while self._offset_history and self._offset_history[0][0] < cutoff:
-            self._offset_history.popleft()
+        self.offset = self._sample_offset()
+        self._push_trail(self.frame_trail, self.offset)
 
     def get_offset(self):
+        """World sway for the current frame."""
         if not self.enabled:
             return (0, 0)
+        return self.offset
 
+    def _sample_offset(self):
         x = math.sin(self.time) * self.sway_strength_x
         y = math.cos(self.time * 0.7) * self.sway_strength_y
 
@@ -61,72 +65,62 @@ class DrunkEffect:
 
         return int(x), int(y)
 
-    def get_ticket_offset(self):
-        if not self.enabled:
-            return (0, 0)
-
-        t = self.time
-
-        x = math.sin(t * 1.3 + 2.0) * (self.sway_strength_x * 0.4)
-        y = math.cos(t * 1.1 + 1.0) * (self.sway_strength_y * 0.4)
-
-        x += math.sin(t * 2.7) * 4
-        y += math.cos(t * 2.3) * 4
-
-        return int(x), int(y)
-
-    # ---------------- DOUBLE VISION ----------------
-    def draw_double(self, screen, surface, real_offset, key):
-        if not self.enabled:
-            screen.blit(surface, real_offset)
-            return
-
-        if key not in self.ghost_trails:
-            self.ghost_trails[key] = []
-
-        trail = self.ghost_trails[key]
-
+    def _push_trail(self, trail, offset):
+        """Add a smoothed sample to the front of a smear trail."""
         if not trail:
-            trail.append(real_offset)
+            trail.append(offset)
         else:
             last_x, last_y = trail[0]
 
             smooth = 0.35  # lower = smoother (0.2-0.4 good)
 
             smoothed = (
-                last_x + (real_offset[0] - last_x) * smooth,
-                last_y + (real_offset[1] - last_y) * smooth
+                last_x + (offset[0] - last_x) * smooth,
+                last_y + (offset[1] - last_y) * smooth
             )
 
             trail.insert(0, smoothed)
         if len(trail) > self.smear_count + 1:
             trail.pop()
 
-        # Build ghost cache ONCE per surface
-        if key not in self.ghost_cache:
-            ghost = surface.copy().convert_alpha()
-            ghost.fill((200, 200, 200), special_flags=pygame.BLEND_RGB_MULT)
-            self.ghost_cache[key] = ghost
+    # ---------------- POST-PROCESS ----------------
+    def post_process(self, screen, frame, offset=(0, 0)):
+        """Present *frame* (the rendered world) on *screen* at *offset* with
+        smear and double vision applied to the whole image.
+
+        Costs one copy, one tint and ``smear_count + 1`` full-frame blits no
+        matter what the frame contains, and ghosts always show the current
+        frame, so scratched tickets never ghost their old cover.
+        """
+        screen.blit(frame, offset)
+        trail = self.frame_trail
+        if not self.enabled or len(trail) < 2:
+            return
 
-        ghost_surface = self.ghost_cache[key]
+        if self._ghost_frame is None or self._ghost_frame.get_size() != frame.get_size():
+            self._ghost_frame = frame.copy()
+        ghost = self._ghost_frame
+        ghost.blit(frame, (0, 0))
+        ghost.fill((200, 200, 200), special_flags=pygame.BLEND_RGB_MULT)
+
+        cur_x, cur_y = self.offset
+        # Eyes drift apart and back together
+        split = math.sin(self.time * 0.9) * self.double_vision_strength / self.smear_count
 
-        # Draw smear
         for i in range(len(trail) - 1, 0, -1):
             t = i / len(trail)
-            alpha = int(self.double_vision_alpha * (1 - t))
+            alpha = int(self.double_vision_alpha * (1 - t) * self.post_ghost_strength)
 
             bx = math.sin(self.time * 1.6 + i) * 2
             by = math.cos(self.time * 1.3 + i) * 2
 
-            ghost_surface.set_alpha(alpha)
+            ghost.set_alpha(alpha)
 
             spread = 1 + i * 0.6
             screen.blit(
-                ghost_surface,
+                ghost,
                 (
-                    real_offset[0] + (trail[i][0] - real_offset[0]) * spread + bx,
-                    real_offset[1] + (trail[i][1] - real_offset[1]) * spread + by
+                    offset[0] + (trail[i][0] - cur_x) * spread + bx + split * i,
+                    offset[1] + (trail[i][1] - cur_y) * spread + by
                 )
             )
-
-        screen.blit(surface, real_offset)
@@ -0,0 +1,40 @@
+"""Input state — what the simulation reads instead of polling pygame."""
+
+import pygame
+
+
+class InputState:
+    """Mouse and keyboard state for one simulation step.
+
+    The windowed game calls ``poll()`` once per frame to copy the real
+    devices in. A headless game never polls: scripted input or a policy
+    sets ``mouse_pos`` / ``mouse_pressed`` and adds key codes to
+    ``held_keys`` directly, and a replay calls ``feed``. ``state[key]`` works like indexing
+    ``pygame.key.get_pressed()``, so it can be passed wherever that was.
+    """
+
+    def __init__(self):
+        self.mouse_pos = (0, 0)
+        self.mouse_pressed = False
+        self.held_keys = set()
+        self._device_keys = None
+
+    def poll(self):
+        """Copy the current mouse and keyboard state from pygame."""
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pressed = pygame.mouse.get_pressed()[0]
+        self._device_keys = pygame.key.get_pressed()
+
+    def feed(self, mouse_pos, mouse_pressed, held_keys):
+        """Set the whole state, replacing anything polled from the devices."""
+        self.mouse_pos = mouse_pos
+        self.mouse_pressed = mouse_pressed
+        self.held_keys = set(held_keys)
+        self._device_keys = None
+
+    def key_down(self, key):
+        if key in self.held_keys:
+            return True
+        return self._device_keys is not None and bool(self._device_keys[key])
+
+    __getitem__ = key_down
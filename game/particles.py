@@ -2,157 +2,471 @@ import pygame
 import random
 import math
 
+import numpy as np
+
+MONEY_SPRITE_PATHS = [
+    "assets/particles/coin.png",
+    "assets/particles/dollar.png",
+    "assets/particles/gem.png",
+]
 MONEY_SPRITES = None
 
 def _load_money_sprites():
     global MONEY_SPRITES
     if MONEY_SPRITES is None:
-        coin_img = pygame.image.load("assets/particles/coin.png")
-        dollar_img = pygame.image.load("assets/particles/dollar.png")
-        gem_img = pygame.image.load("assets/particles/gem.png")
-        MONEY_SPRITES = [coin_img, dollar_img, gem_img]
-
-class Particle:
-    def __init__(
-        self,
-        x, y,
-        color,
-        velocity,
-        lifetime=1.0,
-        size=4,
-        gravity=0,
-        sprite=None,
-        is_smoke=False
-    ):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = gravity
-        self.alpha = 255
-        self.is_smoke = is_smoke
+        MONEY_SPRITES = [pygame.image.load(path) for path in MONEY_SPRITE_PATHS]
+    return MONEY_SPRITES
 
-        self.sprite = sprite
 
-        if self.sprite:
-            self.sprite = pygame.transform.smoothscale(self.sprite, (size, size))
+class SpriteAtlas:
+    """Money sprites pre-scaled once per (sprite, size) and pre-faded to a
+    fixed set of alpha levels, so drawing a particle is a lookup instead of
+    a smoothscale / copy / set_alpha.
 
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+    Spawning only hands out an index; the sprites are loaded and each
+    entry built the first time it is drawn, so an undrawn (headless)
+    system never touches a surface.
+    """
 
-        # Smoke slowly spreads
-        if self.is_smoke:
-            self.size += 6 * dt
-            self.vx += random.uniform(-5, 5) * dt
+    ALPHA_LEVELS = 16
 
-        self.vy += self.gravity * dt
-        self.lifetime -= dt
+    def __init__(self):
+        self._index = {}    # (sprite_id, size) -> atlas index
+        self._keys = []     # atlas index -> (sprite_id, size)
+        self._frames = []   # atlas index -> [surface per alpha level], None until drawn
+
+    def __len__(self):
+        return len(self._keys)
+
+    def index_for(self, sprite_id, size):
+        """Atlas index for *sprite_id* scaled to *size*."""
+        key = (sprite_id, size)
+        idx = self._index.get(key)
+        if idx is None:
+            idx = len(self._keys)
+            self._keys.append(key)
+            self._frames.append(None)
+            self._index[key] = idx
+        return idx
+
+    def _build(self, idx):
+        sprite_id, size = self._keys[idx]
+        scaled = pygame.transform.smoothscale(_load_money_sprites()[sprite_id], (size, size))
+        levels = []
+        for level in range(self.ALPHA_LEVELS):
+            frame = scaled.copy()
+            frame.set_alpha(self._level_alpha(level))
+            levels.append(frame)
+        self._frames[idx] = levels
+        return levels
+
+    def _level_alpha(self, level):
+        return round(255 * (level + 1) / self.ALPHA_LEVELS)
+
+    def level_for(self, alpha):
+        """Quantize a 1..255 alpha to an alpha level index."""
+        return min(self.ALPHA_LEVELS - 1, alpha * self.ALPHA_LEVELS // 256)
+
+    def surface(self, idx, alpha):
+        levels = self._frames[idx]
+        if levels is None:
+            levels = self._build(idx)
+        return levels[self.level_for(alpha)]
+
+
+class StampAtlas:
+    """Pre-drawn alpha circles keyed by (radius, colour bucket, alpha bucket).
+
+    Circle particles (scratch dust, smoke, pee droplets) all draw from one
+    shared atlas instead of building a fresh SRCALPHA surface per particle
+    per frame.  Colours are quantized to ``COLOR_STEP`` per channel and
+    alpha to ``ALPHA_LEVELS`` levels, which keeps the atlas small.
+    """
+
+    COLOR_STEP = 16
+    ALPHA_LEVELS = 16
+    MAX_STAMPS = 4096
 
-        if self.lifetime < self.max_lifetime:
-            self.alpha = int(255 * (self.lifetime / self.max_lifetime))
+    def __init__(self):
+        self._stamps = {}   # packed key -> surface
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __len__(self):
+        return len(self._stamps)
+
+    def keys_for(self, radius, colors, alphas, additive=None):
+        """Vectorised packing of per-particle stamp keys.
+
+        *radius* and *alphas* are (n,) arrays, *colors* is (n, 3) and
+        *additive* an optional (n,) bool array selecting glow stamps.
+        """
+        radius = np.maximum(radius.astype(np.int64), 1)
+        c = colors.astype(np.int64) // self.COLOR_STEP
+        color_bucket = (c[:, 0] << 8) | (c[:, 1] << 4) | c[:, 2]
+        alpha_bucket = np.minimum(alphas.astype(np.int64) * self.ALPHA_LEVELS // 256,
+                                  self.ALPHA_LEVELS - 1)
+        keys = (radius << 17) | (color_bucket << 4) | alpha_bucket
+        if additive is not None:
+            keys |= additive.astype(np.int64) << 16
+        return keys
+
+    def key_for(self, radius, color, alpha, additive=False):
+        """Scalar version of ``keys_for``."""
+        radius = max(1, int(radius))
+        step = self.COLOR_STEP
+        color_bucket = ((color[0] // step) << 8) | ((color[1] // step) << 4) | (color[2] // step)
+        alpha_bucket = min(int(alpha) * self.ALPHA_LEVELS // 256, self.ALPHA_LEVELS - 1)
+        return (radius << 17) | (int(additive) << 16) | (color_bucket << 4) | alpha_bucket
+
+    def get(self, key):
+        """Stamp surface for a packed key, drawing it on first use."""
+        stamp = self._stamps.get(key)
+        if stamp is not None:
+            self.cache_hits += 1
+            return stamp
+        self.cache_misses += 1
+        if len(self._stamps) >= self.MAX_STAMPS:
+            self._stamps.clear()
+        stamp = self._build(key)
+        self._stamps[key] = stamp
+        return stamp
+
+    def stamp(self, radius, color, alpha):
+        return self.get(self.key_for(radius, color, alpha))
+
+    def _build(self, key):
+        radius = key >> 17
+        additive = (key >> 16) & 1
+        color_bucket = (key >> 4) & 0xFFF
+        alpha_bucket = key & 0xF
+        half = self.COLOR_STEP // 2
+        color = (
+            ((color_bucket >> 8) & 0xF) * self.COLOR_STEP + half,
+            ((color_bucket >> 4) & 0xF) * self.COLOR_STEP + half,
+            (color_bucket & 0xF) * self.COLOR_STEP + half,
+        )
+        alpha = round(255 * (alpha_bucket + 1) / self.ALPHA_LEVELS)
+        if additive:
+            return self._build_glow(radius, color, alpha)
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+        return surf
+
+    def _build_glow(self, radius, color, alpha):
+        """Soft glow for additive blending: black is a no-op, so the fade is
+        baked into the RGB instead of an alpha channel."""
+        surf = pygame.Surface((radius * 2, radius * 2))
+        for r in range(radius, 0, -1):
+            falloff = alpha / 255 * (1 - (r - 1) / radius)
+            pygame.draw.circle(surf, [int(ch * falloff) for ch in color], (radius, radius), r)
+        return surf
+
+
+class ParticleGovernor:
+    """Decides how many particles each emitter may actually spawn.
+
+    * Hard cap: never more than ``max_particles`` alive.
+    * Per-emitter priority: each emitter may only fill the pool up to its
+      share of the cap, so low-priority smoke and scratch dust leave
+      headroom for win bursts.
+    * Frame-time adaptation: when the measured frame work time goes over
+      budget, emission is scaled down (never below the emitter's floor)
+      and recovers gradually once frames are cheap again.
+    """
+
+    MAX_PARTICLES = 3000
+    FRAME_BUDGET_MS = 12.0      # work time per frame before we back off
+    BACKOFF = 0.7               # scale multiplier per over-budget frame
+    MIN_SCALE = 0.1
+    RECOVERY_PER_SEC = 0.5      # scale regained per second under budget
+    SMOOTHING = 0.2             # EMA weight of the newest frame time
+
+    # emitter -> (share of the cap it may fill, minimum emission scale)
+    EMITTERS = {
+        "win": (1.0, 0.5),
+        "scratch": (0.5, 0.25),
+        "coin": (0.4, 0.0),
+        "smoke": (0.2, 0.0),
+        "splash": (0.5, 0.25),
+        "sparkle": (0.6, 0.0),
+    }
+
+    def __init__(self, max_particles=MAX_PARTICLES):
+        self.max_particles = max_particles
+        self.scale = 1.0
+        self.frame_ms = 0.0
+        self._carry = {name: 0.0 for name in self.EMITTERS}
+
+    def report_frame(self, work_ms, dt):
+        """Feed the last frame's work time (ms, excluding the FPS wait)."""
+        self.frame_ms += (work_ms - self.frame_ms) * self.SMOOTHING
+        if self.frame_ms > self.FRAME_BUDGET_MS:
+            self.scale = max(self.MIN_SCALE, self.scale * self.BACKOFF)
+        else:
+            self.scale = min(1.0, self.scale + self.RECOVERY_PER_SEC * dt)
+
+    def grant(self, emitter, requested, live):
+        """How many of *requested* particles *emitter* may spawn now."""
+        share, floor = self.EMITTERS[emitter]
+        room = int(self.max_particles * share) - live
+        if room <= 0:
+            self._carry[emitter] = 0.0
+            return 0
+        # Carry the fractional part so scaled-down trickles still emit
+        wanted = requested * max(self.scale, floor) + self._carry[emitter]
+        granted = int(wanted)
+        self._carry[emitter] = wanted - granted
+        return min(granted, room)
+
+
+class Emitter:
+    """Spawns particles at a steady rate, independent of frame rate.
+
+    *spawn* is an emitter method such as ``ParticleSystem.add_smoke`` and is
+    called as ``spawn(x, y, count)``.  Registered emitters are advanced by
+    ``ParticleSystem.update(dt)``; fractional particles accumulate between
+    frames and a long frame catches up by at most ``MAX_CATCHUP`` seconds
+    of emission instead of bursting.
+    """
+
+    MAX_CATCHUP = 0.1
+
+    def __init__(self, spawn, rate, x=0, y=0, enabled=True):
+        self.spawn = spawn
+        self.rate = rate        # particles per second
+        self.x = x
+        self.y = y
+        self.enabled = enabled
+        self._accum = 0.0
 
-        return self.lifetime > 0
+    def move_to(self, x, y):
+        self.x = x
+        self.y = y
 
-    def draw(self, screen):
-        if self.alpha <= 0:
-            return
+    def reset(self):
+        self._accum = 0.0
 
-        # MONEY PARTICLES (sprites)
-        if self.sprite:
-            img = self.sprite.copy()
-            img.set_alpha(self.alpha)
-            rect = img.get_rect(center=(self.x, self.y))
-            screen.blit(img, rect)
+    def advance(self, dt):
+        if not self.enabled or self.rate <= 0:
+            self._accum = 0.0
             return
+        self._accum = min(self._accum + self.rate * dt,
+                          self.rate * self.MAX_CATCHUP + 1)
+        count = int(self._accum)
+        if count:
+            self._accum -= count
+            self.spawn(self.x, self.y, count)
+
 
-        # SCRATCH PARTICLES (circles)
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        color_with_alpha = (*self.color, self.alpha)
-        pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-        screen.blit(surf, (self.x - self.size, self.y - self.size))
+# Particle kinds (ParticleSystem.kind)
+KIND_CIRCLE = 0     # scratch dust, coin trail
+KIND_SMOKE = 1      # grows and drifts while it fades
+KIND_SPRITE = 2     # money sprites (coin / dollar / gem)
+KIND_DROPLET = 3    # pee splash, shrinks as it fades
+KIND_SPARKLE = 4    # additive glow on top of everything else
 
+SPARKLE_COLORS = np.array([(255, 240, 180), (255, 215, 0), (255, 255, 255)], dtype=np.uint8)
 
 
 class ParticleSystem:
-    def __init__(self):
-        _load_money_sprites()
-        self.particles = []
+    """Struct-of-arrays particle engine.
+
+    Every particle attribute lives in a preallocated NumPy array; slots
+    ``[0, count)`` are alive.  ``update`` integrates and culls all particles
+    in one vectorised step and compacts the arrays with swap-remove, so the
+    per-frame cost doesn't grow with Python object churn.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, capacity=INITIAL_CAPACITY, stamps=None, seed=None):
+        self.atlas = SpriteAtlas()
+        self.stamps = stamps if stamps is not None else StampAtlas()
+        self.governor = ParticleGovernor()
+        self.emitters = []
+        self._layer = None   # SRCALPHA layer for the particles' bbox, grown as needed
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.capacity = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        """(Re)allocate the particle arrays, keeping the live particles."""
+        def grow(old, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if old is not None:
+                new[:self.count] = old[:self.count]
+            return new
+
+        get = self.__dict__.get
+        self.pos = grow(get("pos"), (capacity, 2), np.float32)
+        # Position before the last update, for render interpolation
+        self.prev_pos = grow(get("prev_pos"), (capacity, 2), np.float32)
+        self.vel = grow(get("vel"), (capacity, 2), np.float32)
+        self.gravity = grow(get("gravity"), capacity, np.float32)
+        self.life = grow(get("life"), capacity, np.float32)
+        self.max_life = grow(get("max_life"), capacity, np.float32)
+        self.size = grow(get("size"), capacity, np.float32)
+        self.alpha = grow(get("alpha"), capacity, np.uint8)
+        self.color = grow(get("color"), (capacity, 3), np.uint8)
+        self.kind = grow(get("kind"), capacity, np.uint8)
+        # Index into self.atlas for sprite particles (-1 for circles)
+        self.sprite = grow(get("sprite"), capacity, np.int32)
+        self.capacity = capacity
+
+    def _reserve(self, n):
+        """Return the slice of *n* fresh slots at the end of the live range."""
+        needed = self.count + n
+        if needed > self.capacity:
+            self._allocate(max(needed, self.capacity * 2))
+        start = self.count
+        self.count = needed
+        return slice(start, needed)
+
+    def _spawn(self, x, y, vx, vy, life, size, gravity, color, kind):
+        """Append a batch of particles (array-like args broadcast to n)."""
+        n = len(vx)
+        if n == 0:
+            return slice(self.count, self.count)
+        s = self._reserve(n)
+        self.pos[s, 0] = x
+        self.pos[s, 1] = y
+        self.prev_pos[s] = self.pos[s]
+        self.vel[s, 0] = vx
+        self.vel[s, 1] = vy
+        self.life[s] = life
+        self.max_life[s] = life
+        self.size[s] = size
+        self.gravity[s] = gravity
+        self.alpha[s] = 255
+        self.color[s] = color
+        self.kind[s] = kind
+        self.sprite[s] = -1
+        return s
+
+    # ---- emitters ----
+
+    def add_emitter(self, emitter):
+        """Register a rate-based emitter; it's advanced in ``update``."""
+        self.emitters.append(emitter)
+        return emitter
+
+    def remove_emitter(self, emitter):
+        if emitter in self.emitters:
+            self.emitters.remove(emitter)
+
+    # ---- spawning ----
 
     def add_scratch_particles(self, x, y, color, count=5):
         """Add particles for scratching effect."""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(30, 80)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-
-            # Vary the color slightly
-            varied_color = tuple(
-                max(0, min(255, c + random.randint(-30, 30)))
-                for c in color
-            )
-
-            particle = Particle(
-                x, y, varied_color,
-                (vx, vy),
-                lifetime=random.uniform(0.3, 0.6),
-                size=random.randint(2, 4),
-                gravity=100
-            )
-            self.particles.append(particle)
-    def add_smoke(self, x, y, count=2):
-        for _ in range(count):
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(-40, -80)
-
-            gray = random.randint(160, 220)
+        count = self.governor.grant("scratch", count, self.count)
+        if count == 0:
+            return
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(30, 80, count)
+
+        # Vary the color slightly
+        varied = np.clip(np.asarray(color, dtype=np.int16)
+                         + rng.integers(-30, 31, (count, 3)), 0, 255)
+
+        self._spawn(
+            x, y,
+            np.cos(angle) * speed, np.sin(angle) * speed,
+            life=rng.uniform(0.3, 0.6, count),
+            size=rng.integers(2, 5, count),
+            gravity=100,
+            color=varied,
+            kind=KIND_CIRCLE,
+        )
 
-            particle = Particle(
-                x + random.randint(-2, 2),
-                y + random.randint(-2, 2),
-                (gray, gray, gray),
-                (vx, vy),
-                lifetime=random.uniform(0.8, 1.4),
-                size=random.randint(6, 10),
-                gravity=-10,
-                is_smoke=True
-            )
+    def add_smoke(self, x, y, count=2):
+        count = self.governor.grant("smoke", count, self.count)
+        if count == 0:
+            return
+        rng = self.rng
+        gray = rng.integers(160, 221, count)
+        self._spawn(
+            x + rng.integers(-2, 3, count),
+            y + rng.integers(-2, 3, count),
+            rng.uniform(-10, 10, count),
+            rng.uniform(-80, -40, count),
+            life=rng.uniform(0.8, 1.4, count),
+            size=rng.integers(6, 11, count),
+            gravity=-10,
+            color=np.stack([gray, gray, gray], axis=1),
+            kind=KIND_SMOKE,
+        )
 
-            self.particles.append(particle)
+    def add_splash(self, x, y, count=2):
+        """Pee droplets kicked up in an upward arc."""
+        count = self.governor.grant("splash", count, self.count)
+        if count == 0:
+            return
+        rng = self.rng
+        angle = rng.uniform(-math.pi * 0.85, -math.pi * 0.15, count)  # upward arc
+        speed = rng.uniform(40, 150, count)
+        # Yellow-ish droplet colors
+        color = np.stack([
+            np.full(count, 255),
+            rng.integers(200, 241, count),
+            rng.integers(20, 81, count),
+        ], axis=1)
+        self._spawn(
+            x + rng.uniform(-4, 4, count),
+            y + rng.uniform(-4, 4, count),
+            np.cos(angle) * speed, np.sin(angle) * speed,
+            life=rng.uniform(0.2, 0.5, count),
+            size=rng.uniform(1.5, 3.5, count),
+            gravity=300,
+            color=color,
+            kind=KIND_DROPLET,
+        )
 
     def add_win_particles(self, x, y, amount, count=30):
         """Add celebratory particles for winning."""
-        # Gold/yellow particles
-        colors = [
-            (255, 215, 0),   # Gold
-            (255, 255, 100), # Yellow
-            (100, 255, 100), # Green (money)
-            (255, 255, 255), # White sparkle
+        count = self.governor.grant("win", count, self.count)
+        if count == 0:
+            return
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(100, 300, count)
+        sizes = rng.integers(12, 21, count)
+
+        s = self._spawn(
+            x, y,
+            np.cos(angle) * speed,
+            np.sin(angle) * speed - 100,  # Bias upward
+            life=rng.uniform(1.0, 2.0, count),
+            size=sizes,
+            gravity=200,
+            color=(255, 255, 255),  # unused for sprites
+            kind=KIND_SPRITE,
+        )
+        sprite_ids = rng.integers(0, len(MONEY_SPRITE_PATHS), count)
+        self.sprite[s] = [
+            self.atlas.index_for(i, sz)
+            for i, sz in zip(sprite_ids.tolist(), sizes.tolist())
         ]
 
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 300)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 100  # Bias upward
-
-            color = random.choice(colors)
-
-            particle = Particle(
-                x, y,
-                (255, 255, 255),  # dummy color (unused)
-                (vx, vy),
-                lifetime=random.uniform(1.0, 2.0),
-                size=random.randint(12, 20),
-                gravity=200,
-                sprite=random.choice(MONEY_SPRITES)
-            )
-
-            self.particles.append(particle)
+    def add_sparkles(self, x, y, count=10):
+        """Short-lived glints drawn with additive blending."""
+        count = self.governor.grant("sparkle", count, self.count)
+        if count == 0:
+            return
+        rng = self.rng
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speed = rng.uniform(50, 200, count)
+        self._spawn(
+            x, y,
+            np.cos(angle) * speed, np.sin(angle) * speed,
+            life=rng.uniform(0.4, 0.8, count),
+            size=rng.integers(2, 6, count),
+            gravity=50,
+            color=SPARKLE_COLORS[rng.integers(0, len(SPARKLE_COLORS), count)],
+            kind=KIND_SPARKLE,
+        )
 
     def add_big_win_particles(self, x, y, amount, count=80):
         """Add extra celebratory particles for big wins."""
@@ -168,32 +482,169 @@ class ParticleSystem:
 
     def add_coin_trail(self, x, y):
         """Add a trail of coin-like particles."""
+        if self.governor.grant("coin", 1, self.count) == 0:
+            return
         colors = [(255, 215, 0), (255, 200, 50), (200, 180, 50)]
-        color = random.choice(colors)
-
-        particle = Particle(
+        self._spawn(
             x + random.randint(-5, 5),
             y + random.randint(-5, 5),
-            color,
-            (random.uniform(-20, 20), random.uniform(-50, -100)),
-            lifetime=0.5,
+            [random.uniform(-20, 20)], [random.uniform(-50, -100)],
+            life=0.5,
             size=random.randint(2, 4),
-            gravity=300
+            gravity=300,
+            color=random.choice(colors),
+            kind=KIND_CIRCLE,
         )
-        self.particles.append(particle)
 
     def update(self, dt):
-        """Update all particles."""
-        self.particles = [p for p in self.particles if p.update(dt)]
+        """Advance emitters, then integrate and cull all particles in one
+        vectorised pass."""
+        for emitter in self.emitters:
+            emitter.advance(dt)
+
+        n = self.count
+        if n == 0:
+            return
 
-    def draw(self, screen):
-        """Draw all particles."""
-        for particle in self.particles:
-            particle.draw(screen)
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        self.prev_pos[:n] = pos
+        pos += vel * dt
+
+        # Smoke slowly spreads
+        smoke = np.flatnonzero(self.kind[:n] == KIND_SMOKE)
+        if smoke.size:
+            self.size[smoke] += 6 * dt
+            vel[smoke, 0] += self.rng.uniform(-5, 5, smoke.size) * dt
+
+        vel[:, 1] += self.gravity[:n] * dt
+        life = self.life[:n]
+        life -= dt
+        self.alpha[:n] = (255 * np.clip(life / self.max_life[:n], 0, 1)).astype(np.uint8)
+
+        alive = life > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            self._compact(alive, alive_count)
+
+    def _compact(self, alive, alive_count):
+        """Swap-remove: move survivors from the tail into the dead slots
+        at the front so ``[0, alive_count)`` is dense again."""
+        holes = np.flatnonzero(~alive[:alive_count])
+        movers = np.flatnonzero(alive[alive_count:]) + alive_count
+        if holes.size:
+            for arr in (self.pos, self.prev_pos, self.vel, self.gravity,
+                        self.life, self.max_life, self.size, self.alpha, self.color,
+                        self.kind, self.sprite):
+                arr[holes] = arr[movers]
+        self.count = alive_count
+
+    def _layer_for(self, width, height):
+        """The reusable layer, grown to at least *width* x *height*."""
+        layer = self._layer
+        if layer is None or layer.get_width() < width or layer.get_height() < height:
+            if layer is not None:
+                width = max(width, layer.get_width())
+                height = max(height, layer.get_height())
+            self._layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        return self._layer
+
+    def draw(self, screen, alpha=1.0):
+        """Draw all particles in a handful of SDL calls.
+
+        Normal particles are batched into one ``blits`` onto a reusable
+        layer the size of their bounding box (grown when a bigger box
+        comes along, never shrunk), which is cleared and composited onto
+        *screen* at the box.  Sparkles follow in a second ``blits`` with
+        additive blending straight onto *screen*.
+
+        *alpha* is how far the render time is between the last two
+        updates; positions are interpolated by it.
+        """
+        n = self.count
+        if n == 0:
+            return
+        visible = np.flatnonzero(self.alpha[:n] > 0)
+        if visible.size == 0:
+            return
+
+        pos = self.pos[visible]
+        if alpha < 1.0:
+            prev = self.prev_pos[visible]
+            pos = prev + (pos - prev) * alpha
+        alphas = self.alpha[visible]
+        kinds = self.kind[visible]
+        size = np.where(kinds == KIND_DROPLET,
+                        self.size[visible] * (alphas / 255.0), self.size[visible])
+        radius = np.maximum(size.astype(np.int32), 1)
+        is_sprite = kinds == KIND_SPRITE
+        additive = kinds == KIND_SPARKLE
+        # Circles blit from their top-left corner, sprites are centred
+        extent = np.where(is_sprite, self.size[visible].astype(np.int32), radius * 2)
+        xs = (pos[:, 0] - extent / 2).astype(np.int32)
+        ys = (pos[:, 1] - extent / 2).astype(np.int32)
+
+        # Bounding box of everything visible, clipped to the screen
+        screen_w, screen_h = screen.get_size()
+        left = max(0, int(xs.min()))
+        top = max(0, int(ys.min()))
+        right = min(screen_w, int((xs + extent).max()))
+        bottom = min(screen_h, int((ys + extent).max()))
+        if right <= left or bottom <= top:
+            return
+        bbox = pygame.Rect(left, top, right - left, bottom - top)
+
+        keys = self.stamps.keys_for(radius, self.color[visible], alphas, additive).tolist()
+        sprites = self.sprite[visible].tolist()
+        alphas = alphas.tolist()
+        # Normal particles go onto the layer, relative to the box
+        layer_xs = (xs - left).tolist()
+        layer_ys = (ys - top).tolist()
+        xs = xs.tolist()
+        ys = ys.tolist()
+        additive = additive.tolist()
+
+        atlas = self.atlas
+        stamp = self.stamps.get
+        normal = []
+        glow = []
+        for i in range(len(keys)):
+            if additive[i]:
+                glow.append((stamp(keys[i]), (xs[i], ys[i]), None, pygame.BLEND_RGB_ADD))
+            elif sprites[i] >= 0:
+                normal.append((atlas.surface(sprites[i], alphas[i]), (layer_xs[i], layer_ys[i])))
+            else:
+                normal.append((stamp(keys[i]), (layer_xs[i], layer_ys[i])))
+
+        if normal:
+            layer = self._layer_for(bbox.width, bbox.height)
+            area = pygame.Rect(0, 0, bbox.width, bbox.height)
+            layer.fill((0, 0, 0, 0), area)
+            layer.blits(normal, doreturn=False)
+            screen.blit(layer, bbox.topleft, area)
+        if glow:
+            screen.blits(glow, doreturn=False)
+
+    def bounds(self):
+        """Screen rect covering every live particle (at any interpolated
+        position since the last update), or None."""
+        n = self.count
+        if n == 0:
+            return None
+        pos = self.pos[:n]
+        prev = self.prev_pos[:n]
+        # Widest thing drawn around a centre: sprite size or circle diameter
+        pad = int(self.size[:n].max()) * 2 + 2
+        left, top = np.minimum(pos.min(axis=0), prev.min(axis=0))
+        right, bottom = np.maximum(pos.max(axis=0), prev.max(axis=0))
+        return pygame.Rect(int(left) - pad, int(top) - pad,
+                           int(right - left) + pad * 2 + 1, int(bottom - top) + pad * 2 + 1)
 
     def clear(self):
         """Clear all particles."""
-        self.particles = []
+        self.count = 0
+        for emitter in self.emitters:
+            emitter.reset()
 
 
 class ScreenShake:
@@ -222,4 +673,3 @@ class ScreenShake:
     def get_offset(self):
         """Get the current shake offset."""
         return (int(self.offset_x), int(self.offset_y))
-
@@ -1,20 +1,21 @@
 import pygame
-import math
 import random
 
-from game.config import PEE_CONFIG
+from game.config import PEE_CONFIG, load_image
+from game.particles import ParticleSystem, Emitter
+
+SPLASH_RATE = 100  # droplets per second
 
 
 class PeeMinigame:
     """Pee aiming minigame — balance the stream to keep it in the bowl."""
 
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, stamp_atlas=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        # Load and scale background
-        self.bg = pygame.image.load("assets/background/toilet_bg.png").convert()
-        self.bg = pygame.transform.scale(self.bg, (screen_width, screen_height))
+        # Background, loaded and scaled on first draw (headless games never draw)
+        self.bg = None
 
         # Bowl hitbox from config
         self.bowl_x = PEE_CONFIG["bowl_x"]
@@ -58,9 +59,11 @@ class PeeMinigame:
         self.sway_max_force = 450.0    # max sway acceleration (stronger pushes)
         self.sway_change_interval = 0.6  # seconds between force direction changes (more frequent)
 
-        # Splash particles
-        self.splash_particles = []
-        self.splash_timer = 0
+        # Splash particles (own system; droplets share the circle atlas if given)
+        self.particles = ParticleSystem(capacity=256, stamps=stamp_atlas)
+        self.splash_emitter = self.particles.add_emitter(
+            Emitter(self.particles.add_splash, SPLASH_RATE)
+        )
 
         # Result display
         self.show_result = False
@@ -75,8 +78,7 @@ class PeeMinigame:
         self.peed_in_bowl = 0
         self.show_result = False
         self.result_timer = 0
-        self.splash_particles = []
-        self.splash_timer = 0
+        self.particles.clear()
 
         # Start stream at a random X position on the bowl's Y plane
         margin = 150
@@ -171,40 +173,9 @@ class PeeMinigame:
         if distance <= self.bowl_radius:
             self.peed_in_bowl += pee_amount
 
-        # --- Spawn splash particles at stream endpoint ---
-        self.splash_timer -= dt
-        if self.splash_timer <= 0:
-            self.splash_timer = 0.02  # spawn every 20ms
-            ex = int(self.stream_x)
-            ey = int(self.stream_y)
-            for _ in range(random.randint(1, 3)):
-                angle = random.uniform(-math.pi * 0.85, -math.pi * 0.15)  # upward arc
-                speed = random.uniform(40, 150)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
-                # Yellow-ish droplet colors
-                g = random.randint(200, 240)
-                color = (255, g, random.randint(20, 80))
-                size = random.uniform(1.5, 3.5)
-                life = random.uniform(0.2, 0.5)
-                self.splash_particles.append({
-                    "x": ex + random.uniform(-4, 4),
-                    "y": ey + random.uniform(-4, 4),
-                    "vx": vx, "vy": vy,
-                    "life": life, "max_life": life,
-                    "size": size, "color": color,
-                })
-
-        # Update existing splash particles
-        alive = []
-        for p in self.splash_particles:
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            p["vy"] += 300 * dt  # gravity pulls droplets down
-            p["life"] -= dt
-            if p["life"] > 0:
-                alive.append(p)
-        self.splash_particles = alive
+        # --- Splash particles at stream endpoint ---
+        self.splash_emitter.move_to(self.stream_x, self.stream_y)
+        self.particles.update(dt)
 
         # Check if done
         if self.bladder_remaining <= 0:
@@ -225,6 +196,9 @@ class PeeMinigame:
     def draw(self, screen):
         """Draw the minigame screen."""
         # Background
+        if self.bg is None:
+            bg = load_image("assets/background/toilet_bg.png", alpha=False)
+            self.bg = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
         screen.blit(self.bg, (0, 0))
 
         if self.show_result:
@@ -256,13 +230,7 @@ class PeeMinigame:
         pygame.draw.circle(screen, (220, 200, 30), (end_x, end_y), self.stream_radius, 2)
 
         # Splash particles
-        for p in self.splash_particles:
-            alpha = int(255 * (p["life"] / p["max_life"]))
-            sz = max(1, int(p["size"] * (p["life"] / p["max_life"])))
-            surf = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-            color_a = (*p["color"], alpha)
-            pygame.draw.circle(surf, color_a, (sz, sz), sz)
-            screen.blit(surf, (int(p["x"]) - sz, int(p["y"]) - sz))
+        self.particles.draw(screen)
 
         # Bladder meter bar at top
         self._draw_bladder_bar(screen)
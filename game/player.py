@@ -2,6 +2,7 @@ import json
 import os
 
 from game.config import UPGRADES, ITEMS, LEVEL_CONFIG, PEE_CONFIG
+from game.saver import AsyncSaver
 
 
 class Inventory:
@@ -21,7 +22,7 @@ class Inventory:
 
 
 class Player:
-    def __init__(self):
+    def __init__(self, save_file="savegame.json"):
         self.money = 5.0  # Start with $5
         self.total_earned = 0.0  # Track lifetime earnings for unlocks
         self.total_spent = 0.0
@@ -45,9 +46,11 @@ class Player:
         # Item unlock levels
         self.item_unlock_requirements = {key: data["unlock_level"] for key, data in ITEMS.items()}
 
-        # Try to load saved game
-        self.save_file = "savegame.json"
+        # Try to load saved game (save_file=None: nothing is loaded or saved)
+        self.save_file = save_file
         self.load_game()
+        # Saves are written in the background (see save_game)
+        self.saver = AsyncSaver(save_file) if save_file is not None else None
 
     def get_luck_bonus(self):
         """Get the luck bonus from upgrades, active effects, and player level."""
@@ -269,60 +272,75 @@ class Player:
                 unlocked.append(key)
         return unlocked
 
-    def save_game(self):
-        """Save game state to file."""
-        data = {
+    def snapshot(self):
+        """The persistent part of the player's state, as saved."""
+        return {
             "money": self.money,
             "total_earned": self.total_earned,
             "total_spent": self.total_spent,
             "tickets_scratched": self.tickets_scratched,
             "biggest_win": self.biggest_win,
-            "upgrades": self.upgrades,
-            "items": self.inventory.items_in_inventory,
+            "upgrades": dict(self.upgrades),
+            "items": dict(self.inventory.items_in_inventory),
             "player_level": self.player_level,
             "current_xp": self.current_xp,
             "current_bladder": self.current_bladder,
         }
-        try:
-            with open(self.save_file, "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            pass
+
+    def restore(self, data):
+        """Apply a ``snapshot`` (missing keys fall back to defaults)."""
+        self.money = data.get("money", 5.0)
+        self.total_earned = data.get("total_earned", 0.0)
+        self.total_spent = data.get("total_spent", 0.0)
+        self.tickets_scratched = data.get("tickets_scratched", 0)
+        self.biggest_win = data.get("biggest_win", 0)
+
+        # Load upgrades (handle missing keys)
+        saved_upgrades = data.get("upgrades", {})
+        for key in UPGRADES:
+            self.upgrades[key] = saved_upgrades.get(key, 0)
+        # Load Items (handle missing keys)
+        saved_items = data.get("items", {})
+        for key in ITEMS:
+            self.inventory.items_in_inventory[key] = saved_items.get(key, 0)
+
+        # Load XP / level
+        self.player_level = data.get("player_level", 1)
+        self.current_xp = data.get("current_xp", 0)
+        self.xp_to_next_level = self._calc_xp_for_level(self.player_level)
+        # Restore morale cap bonus from levels
+        self.morale_cap = 100 + (self.player_level - 1) * LEVEL_CONFIG["rewards_per_level"]["morale_cap_bonus"]
+
+        # Load bladder
+        self.current_bladder = data.get("current_bladder", 0)
+
+    def save_game(self):
+        """Queue the game state to be saved; returns without touching the disk."""
+        if self.saver is None:
+            return
+        self.saver.save(self.snapshot())
+
+    def close_save(self):
+        """Write any queued save and stop saving. False if it couldn't be written."""
+        if self.saver is None:
+            return True
+        return self.saver.close()
+
+    def take_save_errors(self):
+        """Errors from background saves since the last call."""
+        if self.saver is None:
+            return []
+        return self.saver.take_errors()
 
     def load_game(self):
         """Load game state from file."""
-        if not os.path.exists(self.save_file):
+        if self.save_file is None or not os.path.exists(self.save_file):
             return
 
         try:
             with open(self.save_file, "r") as f:
                 data = json.load(f)
-
-            self.money = data.get("money", 5.0)
-            self.total_earned = data.get("total_earned", 0.0)
-            self.total_spent = data.get("total_spent", 0.0)
-            self.tickets_scratched = data.get("tickets_scratched", 0)
-            self.biggest_win = data.get("biggest_win", 0)
-
-            # Load upgrades (handle missing keys)
-            saved_upgrades = data.get("upgrades", {})
-            for key in UPGRADES:
-                self.upgrades[key] = saved_upgrades.get(key, 0)
-            # Load Items (handle missing keys)
-            saved_items = data.get("items", {})
-            for key in ITEMS:
-                self.inventory.items_in_inventory[key] = saved_items.get(key, 0)
-
-            # Load XP / level
-            self.player_level = data.get("player_level", 1)
-            self.current_xp = data.get("current_xp", 0)
-            self.xp_to_next_level = self._calc_xp_for_level(self.player_level)
-            # Restore morale cap bonus from levels
-            self.morale_cap = 100 + (self.player_level - 1) * LEVEL_CONFIG["rewards_per_level"]["morale_cap_bonus"]
-
-            # Load bladder
-            self.current_bladder = data.get("current_bladder", 0)
-
+            self.restore(data)
         except Exception as e:
             pass
 
@@ -0,0 +1,263 @@
+"""Frame profiler — per-phase timings and live counters with an overlay."""
+
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+
+
+_Surface = pygame.Surface
+
+
+class _CountingSurface(_Surface):
+    """Stands in for ``pygame.Surface`` while profiling, to count allocations."""
+
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _CountingSurface.created += 1
+
+
+class _Hook:
+    def __init__(self, target, attr, make_wrapper):
+        self.target = target        # object, or a callable returning it
+        self.attr = attr
+        self.make_wrapper = make_wrapper
+        self.obj = None
+        self.original = None
+        self.own = False
+
+    def install(self):
+        obj = self.target if hasattr(self.target, self.attr) else self.target()
+        self.obj = obj
+        self.own = self.attr in vars(obj)
+        self.original = getattr(obj, self.attr)
+        setattr(obj, self.attr, self.make_wrapper(self.original))
+
+    def remove(self):
+        if self.obj is None:
+            return
+        if self.own:
+            setattr(self.obj, self.attr, self.original)
+        else:
+            delattr(self.obj, self.attr)
+        self.obj = None
+        self.original = None
+
+
+class FrameProfiler:
+    """Times the phases of a frame and shows them in an overlay.
+
+    Phases and counters are registered up front with ``time`` / ``count``
+    against an object (or a callable returning it, for objects that get
+    replaced) and a method name. Nothing is wrapped until the profiler is
+    enabled: ``enable`` swaps timing wrappers in as instance attributes
+    and ``disable`` takes them out again, so a disabled profiler costs
+    nothing. While enabled, ``pygame.Surface`` is also swapped for a
+    counting subclass to report surfaces created per frame (surfaces
+    made inside pygame — ``copy``, ``transform``, font rendering — are
+    not counted).
+
+    The overlay shows a rolling frame-time graph, p50/p95/p99, smoothed
+    per-phase milliseconds, gauges and cache hit rates. It is redrawn a
+    few times a second so it barely shows up in its own numbers.
+    """
+
+    HISTORY = 240               # frames in the graph and percentiles
+    SMOOTHING = 0.1
+    REFRESH = 0.25              # seconds between overlay redraws
+    WIDTH = 330
+    LINE_HEIGHT = 15
+    GRAPH_HEIGHT = 60
+    GRAPH_MAX_MS = 33.3         # graph top; the 60 fps line sits at a half
+    MARGIN = 10
+
+    def __init__(self, screen_size):
+        self.screen_size = screen_size
+        self.enabled = False
+        self.frame_ms = deque(maxlen=self.HISTORY)
+        self.phase_ms = {}      # label -> smoothed ms per frame
+        self._phases = []       # labels in registration order
+        self._frame_phases = {}
+        self._counts = {}       # counter -> calls this refresh window
+        self._gauges = []       # (label, fn)
+        self._rates = []        # (label, lookups counter, misses counter)
+        self._hooks = []
+        self._frame_start = 0.0
+        self._surfaces_frame = 0
+        self.surfaces_per_frame = 0.0
+        self._panel = None
+        self._panel_age = self.REFRESH
+        self._font = None
+
+    # ---- registration ----
+
+    def time(self, target, attr, label):
+        """Time calls to ``target.attr`` as phase *label*."""
+        if label not in self._phases:
+            self._phases.append(label)
+        phases = self._frame_phases
+        perf = time.perf_counter
+
+        def make_wrapper(fn):
+            def timed(*args, **kwargs):
+                t0 = perf()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    phases[label] = phases.get(label, 0.0) + (perf() - t0) * 1000
+            return timed
+
+        self._add_hook(_Hook(target, attr, make_wrapper))
+
+    def count(self, target, attr, counter):
+        """Count calls to ``target.attr`` under *counter*."""
+        counts = self._counts
+        counts.setdefault(counter, 0)
+
+        def make_wrapper(fn):
+            def counted(*args, **kwargs):
+                counts[counter] += 1
+                return fn(*args, **kwargs)
+            return counted
+
+        self._add_hook(_Hook(target, attr, make_wrapper))
+
+    def gauge(self, label, fn):
+        """Show ``fn()`` as a live value."""
+        self._gauges.append((label, fn))
+
+    def hit_rate(self, label, lookups, misses):
+        """Show the hit rate of a cache from two ``count`` counters."""
+        self._rates.append((label, lookups, misses))
+
+    def _add_hook(self, hook):
+        self._hooks.append(hook)
+        if self.enabled:
+            hook.install()
+
+    # ---- switching ----
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for hook in self._hooks:
+            hook.install()
+        pygame.Surface = _CountingSurface
+        self.frame_ms.clear()
+        self.phase_ms = {}
+        self._panel = None
+        self._panel_age = self.REFRESH
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for hook in self._hooks:
+            hook.remove()
+        pygame.Surface = _Surface
+
+    def refresh(self):
+        """Re-install hooks after a profiled object was replaced."""
+        if self.enabled:
+            for hook in self._hooks:
+                hook.remove()
+                hook.install()
+
+    # ---- per frame ----
+
+    def begin_frame(self):
+        self._frame_phases.clear()
+        self._surfaces_frame = _CountingSurface.created
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self, dt):
+        """Record the frame's work time; *dt* is the real frame time."""
+        self.frame_ms.append((time.perf_counter() - self._frame_start) * 1000)
+        for label in self._phases:
+            ms = self._frame_phases.get(label, 0.0)
+            prev = self.phase_ms.get(label, ms)
+            self.phase_ms[label] = prev + (ms - prev) * self.SMOOTHING
+        created = _CountingSurface.created - self._surfaces_frame
+        self.surfaces_per_frame += (created - self.surfaces_per_frame) * self.SMOOTHING
+        self._panel_age += dt
+
+    def percentiles(self):
+        """(p50, p95, p99) of recent frame work times in ms."""
+        if not self.frame_ms:
+            return 0.0, 0.0, 0.0
+        p50, p95, p99 = np.percentile(np.fromiter(self.frame_ms, float), (50, 95, 99))
+        return float(p50), float(p95), float(p99)
+
+    # ---- overlay ----
+
+    @property
+    def rect(self):
+        lines = 2 + len(self._phases) + len(self._gauges) + len(self._rates)
+        height = self.GRAPH_HEIGHT + lines * self.LINE_HEIGHT + 16
+        return pygame.Rect(self.MARGIN, self.screen_size[1] - height - self.MARGIN,
+                           self.WIDTH, height)
+
+    def needs_redraw(self):
+        return self.enabled and (self._panel is None or self._panel_age >= self.REFRESH)
+
+    def draw(self, screen):
+        if not self.enabled:
+            return
+        if self.needs_redraw():
+            self._panel = self._build_panel()
+            self._panel_age = 0.0
+        screen.blit(self._panel, self.rect.topleft)
+
+    def _build_panel(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        rect = self.rect
+        panel = _Surface(rect.size, pygame.SRCALPHA)
+        panel.fill((10, 10, 15, 200))
+
+        # Frame-time graph, newest on the right
+        graph = pygame.Rect(6, 6, rect.width - 12, self.GRAPH_HEIGHT)
+        pygame.draw.rect(panel, (40, 40, 50), graph)
+        scale = graph.height / self.GRAPH_MAX_MS
+        budget_y = graph.bottom - int(1000 / 60 * scale)
+        pygame.draw.line(panel, (90, 90, 40), (graph.left, budget_y), (graph.right - 1, budget_y))
+        bar_w = graph.width / self.HISTORY
+        start = self.HISTORY - len(self.frame_ms)
+        for i, ms in enumerate(self.frame_ms):
+            h = min(graph.height, int(ms * scale))
+            color = (90, 200, 90) if ms < 1000 / 60 else (230, 80, 60)
+            x = graph.left + int((start + i) * bar_w)
+            pygame.draw.line(panel, color, (x, graph.bottom - 1), (x, graph.bottom - h))
+
+        p50, p95, p99 = self.percentiles()
+        rows = [(f"frame p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f}", "ms", (230, 230, 230))]
+        for label in self._phases:
+            rows.append((label, f"{self.phase_ms.get(label, 0.0):.3f} ms", (190, 210, 255)))
+        rows.append(("surfaces / frame", f"{self.surfaces_per_frame:.1f}", (255, 220, 150)))
+        for label, fn in self._gauges:
+            rows.append((label, str(fn()), (255, 220, 150)))
+        for label, lookups, misses in self._rates:
+            total = self._counts.get(lookups, 0)
+            rate = 1 - self._counts.get(misses, 0) / total if total else 1.0
+            rows.append((label, f"{rate * 100:.1f}%", (180, 255, 180)))
+        for counter in self._counts:
+            self._counts[counter] = 0
+
+        # Labels on the left, values right-aligned
+        y = graph.bottom + 6
+        for label, value, color in rows:
+            panel.blit(self._font.render(label, True, color), (8, y))
+            value_surf = self._font.render(value, True, color)
+            panel.blit(value_surf, (rect.width - 8 - value_surf.get_width(), y))
+            y += self.LINE_HEIGHT
+        return panel
@@ -0,0 +1,146 @@
+"""Dirty-rectangle presentation — redraw and present only what changed."""
+
+import pygame
+
+
+# state_fn sentinel: the region is redrawn every frame while it's visible
+ALWAYS = object()
+
+
+class _Watch:
+    def __init__(self, rect_fn, state_fn):
+        self.rect_fn = rect_fn
+        self.state_fn = state_fn
+        self.last_rect = None
+        self.last_state = None
+
+
+class DirtyRectRenderer:
+    """Collects the screen regions that changed this frame.
+
+    Drawables either push rects directly (``mark`` / ``mark_many``) or are
+    registered with ``watch(rect_fn, state_fn)``: each frame ``state_fn()``
+    is compared with last frame's value and, if it changed, both the old
+    and new ``rect_fn()`` areas are marked. ``rect_fn`` returns ``None``
+    while the drawable is hidden; passing ``state_fn=None`` redraws the
+    region every frame it's visible (for continuously animated widgets).
+
+    ``begin_frame`` merges the marks into a few regions, or asks for a full
+    redraw when forced (shake, drunk vision, returning from a full-screen
+    mode) or when the dirty area is most of the screen anyway.
+    """
+
+    MAX_REGIONS = 6
+    FULL_REDRAW_FRACTION = 0.6
+
+    def __init__(self, screen_size):
+        self.screen_rect = pygame.Rect((0, 0), screen_size)
+        self._rects = []
+        self._watches = []
+        self._solids = []
+        self._full_pending = True   # first frame draws everything
+        self.last_regions = []
+        self.last_full = True
+
+    def watch(self, rect_fn, state_fn=None):
+        self._watches.append(_Watch(rect_fn, state_fn))
+
+    def add_solid(self, rects_fn):
+        """Register drawables that must be redrawn whole.
+
+        pygame's rounded-rect borders don't rasterize identically when the
+        clip cuts through them, so any region touching one of the rects
+        returned by *rects_fn* grows to cover it completely.
+        """
+        self._solids.append(rects_fn)
+
+    def mark(self, rect):
+        if rect is not None:
+            self._rects.append(pygame.Rect(rect))
+
+    def mark_many(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def force_full(self):
+        """Redraw the whole screen next frame."""
+        self._full_pending = True
+
+    def _poll_watches(self):
+        for w in self._watches:
+            rect = w.rect_fn()
+            state = ALWAYS if w.state_fn is None else w.state_fn()
+            if state is ALWAYS or state != w.last_state or rect != w.last_rect:
+                self.mark(w.last_rect)
+                self.mark(rect)
+            w.last_rect = pygame.Rect(rect) if rect is not None else None
+            w.last_state = state
+
+    def begin_frame(self, force_full=False):
+        """Return ``(full, regions)`` for this frame.
+
+        ``full`` means recompose and flip the whole screen; otherwise only
+        ``regions`` (possibly empty — nothing to draw) need recomposing.
+        A forced frame also forces the following one, so the last shaken
+        or swayed image is fully replaced once things settle.
+        """
+        self._poll_watches()
+        full = force_full or self._full_pending
+        self._full_pending = force_full
+
+        regions = self._expand_to_solids(self._merge(self._rects)) if not full else []
+        self._rects = []
+        if not full:
+            area = sum(r.width * r.height for r in regions)
+            screen_area = self.screen_rect.width * self.screen_rect.height
+            if area > screen_area * self.FULL_REDRAW_FRACTION:
+                full = True
+                regions = []
+
+        self.last_full = full
+        self.last_regions = regions
+        return full, regions
+
+    def _merge(self, rects):
+        """Clip to the screen and merge overlapping rects; collapse to a
+        single bounding rect if there are still too many."""
+        pending = [r.clip(self.screen_rect) for r in rects]
+        pending = [r for r in pending if r.width > 0 and r.height > 0]
+        merged = []
+        while pending:
+            rect = pending.pop()
+            grown = True
+            while grown:
+                grown = False
+                for i in range(len(merged) - 1, -1, -1):
+                    if rect.colliderect(merged[i]):
+                        rect = rect.union(merged.pop(i))
+                        grown = True
+            merged.append(rect)
+        if len(merged) > self.MAX_REGIONS:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+
+    def _expand_to_solids(self, regions):
+        if not regions or not self._solids:
+            return regions
+        # Clipped like the regions, or one hanging off-screen never fits
+        solids = [pygame.Rect(r).clip(self.screen_rect) for fn in self._solids for r in fn()]
+        grown = True
+        while grown:
+            grown = False
+            for i, region in enumerate(regions):
+                for solid in solids:
+                    if region.colliderect(solid) and not region.contains(solid):
+                        region = region.union(solid)
+                        grown = True
+                regions[i] = region
+            if grown:
+                regions = self._merge(regions)
+        return regions
+
+    def present(self, full, regions):
+        if full:
+            pygame.display.flip()
+        elif regions:
+            pygame.display.update(regions)
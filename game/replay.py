@@ -0,0 +1,164 @@
+"""Input recording and replay — rerun a play session exactly."""
+
+import json
+import time
+
+import numpy as np
+import pygame
+
+
+VERSION = 1
+
+# Event types the game reacts to, and the attributes kept for each
+RECORDED_EVENTS = {
+    pygame.QUIT: (),
+    pygame.MOUSEWHEEL: ("x", "y"),
+    pygame.MOUSEBUTTONUP: ("button", "pos"),
+    pygame.KEYDOWN: ("key", "mod"),
+    pygame.KEYUP: ("key", "mod"),
+}
+_EVENT_TYPES = {pygame.event.event_name(t): t for t in RECORDED_EVENTS}
+
+
+def make_deterministic(game):
+    """Turn off the wall-clock-dependent parts of the simulation.
+
+    The scheduler's tick budget defers systems depending on how long the
+    tick took, so both recording and replay run without it. (The particle
+    governor's frame times are recorded and fed back instead.)
+    """
+    game.scheduler.budget_ms = None
+
+
+def fingerprint(game):
+    """A summary of the simulation state, to check a replay stayed in sync."""
+    player = game.player
+    return {
+        "money": round(player.money, 2),
+        "tickets_scratched": player.tickets_scratched,
+        "player_level": player.player_level,
+        "current_xp": player.current_xp,
+        "tickets": len(game.mat.mat_tickets) + len(game.mat.ticket_queue),
+        "particles": game.particles.count,
+    }
+
+
+class InputRecorder:
+    """Records what a session's frames read: dt, input state and events.
+
+    Start it right after the game is created with the seed the game was
+    created with; ``record`` is called once per frame after the input has
+    been polled, and ``save`` writes the session when the game ends.
+    Along with the frames the file keeps the seed, the player's starting
+    state and a fingerprint of the end state.
+    """
+
+    def __init__(self, path, game, seed):
+        self.path = path
+        self.seed = seed
+        self.player = game.player.snapshot()
+        self.frames = []
+        self.held = set()       # key codes, tracked from KEYDOWN / KEYUP
+        make_deterministic(game)
+
+    def record(self, dt, work_ms, events, state):
+        recorded = []
+        for event in events:
+            attrs = RECORDED_EVENTS.get(event.type)
+            if attrs is None:
+                continue
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held.discard(event.key)
+            entry = {"type": pygame.event.event_name(event.type)}
+            for attr in attrs:
+                entry[attr] = getattr(event, attr)
+            recorded.append(entry)
+        x, y = state.mouse_pos
+        # [dt, governor work ms, mouse x, mouse y, button, held keys, events]
+        self.frames.append([dt, work_ms, x, y, int(state.mouse_pressed),
+                            sorted(self.held), recorded])
+
+    def save(self, game):
+        data = {
+            "version": VERSION,
+            "seed": self.seed,
+            "player": self.player,
+            "end": fingerprint(game),
+            "frames": self.frames,
+        }
+        with open(self.path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class InputReplay:
+    """Plays a recorded session back into a game.
+
+    Create the game with ``seed`` and no persistence, call ``start(game)``,
+    then take one ``next_frame(game.input)`` per frame until ``done``.
+    """
+
+    def __init__(self, path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != VERSION:
+            raise ValueError(f"{path}: unsupported recording version {data.get('version')}")
+        self.path = path
+        self.seed = data["seed"]
+        self.player = data["player"]
+        self.end = data["end"]
+        self.frames = data["frames"]
+        self.index = 0
+
+    @property
+    def done(self):
+        return self.index >= len(self.frames)
+
+    def start(self, game):
+        game.player.restore(self.player)
+        make_deterministic(game)
+        self.index = 0
+
+    def next_frame(self, state):
+        """Feed the next frame's input into *state*; returns (dt, work_ms, events)."""
+        dt, work_ms, x, y, pressed, keys, recorded = self.frames[self.index]
+        self.index += 1
+        state.feed((x, y), bool(pressed), keys)
+        events = []
+        for entry in recorded:
+            attrs = dict(entry)
+            event_type = _EVENT_TYPES[attrs.pop("type")]
+            if "pos" in attrs:
+                attrs["pos"] = tuple(attrs["pos"])
+            events.append(pygame.event.Event(event_type, attrs))
+        return dt, work_ms, events
+
+    def matches(self, game):
+        """Whether *game* ended in the same state as the recording."""
+        return fingerprint(game) == self.end
+
+
+def play_headless(game, replay):
+    """Run a whole replay as fast as possible; returns a timing report."""
+    replay.start(game)
+    times = []
+    perf = time.perf_counter
+    while game.running and not replay.done:
+        t0 = perf()
+        game.frame(*replay.next_frame(game.input))
+        times.append(perf() - t0)
+    ms = np.array(times) * 1000 if times else np.zeros(1)
+    return {
+        "recording": replay.path,
+        "frames": len(times),
+        "seconds": round(float(ms.sum()) / 1000, 3),
+        "frame_ms": {
+            "mean": round(float(ms.mean()), 3),
+            "p50": round(float(np.percentile(ms, 50)), 3),
+            "p95": round(float(np.percentile(ms, 95)), 3),
+            "p99": round(float(np.percentile(ms, 99)), 3),
+            "max": round(float(ms.max()), 3),
+        },
+        "in_sync": replay.matches(game),
+    }
@@ -0,0 +1,136 @@
+"""Write-behind saving — save files are written on a background thread."""
+
+import json
+import os
+import threading
+import time
+
+
+MAX_WRITES_PER_SEC = 2
+FLUSH_TIMEOUT = 5.0         # seconds flush() waits for the disk
+
+
+class AsyncSaver:
+    """Writes JSON save data to *path* from a background thread.
+
+    ``save(data)`` only hands the data over and returns at once, so the
+    game never waits on the disk. Saves that arrive before the previous
+    one is written replace it — only the newest state is written, at
+    most *max_rate* times a second. Each write goes to a temp file next
+    to *path* and is renamed over it, so a crash mid-write leaves the old
+    save intact.
+
+    The data of a failed write is kept and retried on the next ``flush``
+    unless a newer save replaces it; the exception is queued for
+    ``take_errors``. ``flush`` skips the rate limit and waits for
+    everything handed over so far; ``close`` flushes and stops the thread.
+    """
+
+    def __init__(self, path, max_rate=MAX_WRITES_PER_SEC):
+        self.path = path
+        self.min_interval = 1.0 / max_rate
+        self.writes = 0
+        self.coalesced = 0          # saves replaced before they were written
+        self._cond = threading.Condition()
+        self._pending = None        # newest data not yet on disk
+        self._failed = None         # data whose write failed, for flush to retry
+        self._writing = False
+        self._urgent = False        # flush in progress: ignore the rate limit
+        self._closing = False
+        self._failures = 0
+        self._errors = []
+        self._thread = threading.Thread(target=self._run, name="saver", daemon=True)
+        self._thread.start()
+
+    def save(self, data):
+        """Queue *data* to be written. It must not be mutated afterwards."""
+        with self._cond:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = data
+            self._failed = None
+            self._cond.notify_all()
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """Write anything queued now; False if it failed or timed out."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            failures = self._failures
+            if self._pending is None and self._failed is not None:
+                self._pending, self._failed = self._failed, None
+            self._urgent = True
+            self._cond.notify_all()
+            try:
+                while self._pending is not None or self._writing:
+                    remaining = deadline - time.monotonic()
+                    if self._failures != failures or remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return self._failures == failures
+            finally:
+                self._urgent = False
+
+    def close(self, timeout=FLUSH_TIMEOUT):
+        """Flush and stop the thread; False if the last save didn't make it."""
+        ok = self.flush(timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return ok
+
+    def take_errors(self):
+        """Exceptions from failed writes since the last call."""
+        with self._cond:
+            errors, self._errors = self._errors, []
+        return errors
+
+    # ---- background thread ----
+
+    def _run(self):
+        next_write = 0.0
+        while True:
+            with self._cond:
+                while True:
+                    if self._closing:
+                        return
+                    if self._pending is None:
+                        self._cond.wait()
+                        continue
+                    delay = next_write - time.monotonic()
+                    if delay <= 0 or self._urgent:
+                        break
+                    self._cond.wait(delay)
+                data = self._pending
+                self._pending = None
+                self._writing = True
+
+            written = False
+            error = None
+            try:
+                self._write(data)
+                written = True
+            except Exception as e:
+                error = e
+            finally:
+                # Even if the thread is dying, don't leave flush waiting
+                next_write = time.monotonic() + self.min_interval
+                with self._cond:
+                    self._writing = False
+                    if written:
+                        self.writes += 1
+                    else:
+                        self._failures += 1
+                        if error is not None:
+                            self._errors.append(error)
+                        if self._pending is None:
+                            self._failed = data
+                    self._cond.notify_all()
+
+    def _write(self, data):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
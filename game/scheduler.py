@@ -0,0 +1,86 @@
+"""Multi-rate system scheduler — game-state systems ticking at their own rates."""
+
+import time
+
+
+class _System:
+    def __init__(self, name, fn, period, priority, budget_ms, phase):
+        self.name = name
+        self.fn = fn
+        self.period = period            # seconds between runs, None = every tick
+        self.priority = priority
+        self.budget_ms = budget_ms
+        self.elapsed = 0.0              # time since the system last ran
+        self.wait = period * phase if period else 0.0
+        self.cost_ms = 0.0              # smoothed run time
+        self.runs = 0
+        self.overruns = 0               # runs that went over budget_ms
+        self.deferred = 0               # runs postponed by the tick budget
+
+
+class SystemScheduler:
+    """Runs registered systems, each at its own rate.
+
+    ``register(name, fn, hz)`` adds a system called as ``fn(elapsed)``
+    roughly *hz* times a second, where *elapsed* is the time since its
+    last run — so dt-based logic keeps the same totals at any rate.
+    ``hz=None`` runs the system on every tick (input, animation).
+
+    Systems run in priority order, highest first. Systems with the same
+    rate are staggered so they don't all land on the same tick. If
+    ``budget_ms`` is set and a tick has already spent that long, the
+    remaining rated systems are pushed to the next tick (their elapsed
+    time keeps growing, so nothing is lost). A system's own ``budget_ms``
+    only counts overruns, for profiling.
+    """
+
+    SMOOTHING = 0.2
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = budget_ms
+        self.systems = []
+
+    def register(self, name, fn, hz=None, priority=0, budget_ms=None):
+        period = 1.0 / hz if hz else None
+        same_rate = sum(1 for s in self.systems if s.period == period)
+        phase = (same_rate * 0.5) % 1.0
+        system = _System(name, fn, period, priority, budget_ms, phase)
+        self.systems.append(system)
+        # Stable sort keeps registration order within a priority
+        self.systems.sort(key=lambda s: -s.priority)
+        return system
+
+    def unregister(self, name):
+        self.systems = [s for s in self.systems if s.name != name]
+
+    def get(self, name):
+        for system in self.systems:
+            if system.name == name:
+                return system
+        return None
+
+    def tick(self, dt):
+        start = time.perf_counter()
+        for system in self.systems:
+            system.elapsed += dt
+            if system.period is not None:
+                system.wait -= dt
+                if system.wait > 0:
+                    continue
+                if self.budget_ms is not None and \
+                        (time.perf_counter() - start) * 1000 > self.budget_ms:
+                    system.deferred += 1
+                    continue
+                # Schedule from the due time, but never owe more than one run
+                system.wait = max(system.wait + system.period, 0.0)
+            self._run(system)
+
+    def _run(self, system):
+        t0 = time.perf_counter()
+        system.fn(system.elapsed)
+        cost = (time.perf_counter() - t0) * 1000
+        system.elapsed = 0.0
+        system.runs += 1
+        system.cost_ms += (cost - system.cost_ms) * self.SMOOTHING
+        if system.budget_ms is not None and cost > system.budget_ms:
+            system.overruns += 1
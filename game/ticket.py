@@ -20,6 +20,11 @@ class ScratchTicket:
         self.dragging = False
         self.drag_offset = (0, 0)
 
+        # Stable ID — assigned by TicketRegistry when the ticket enters the mat
+        self.ticket_id = None
+        # Bumped whenever the visible surface changes (scratching)
+        self.content_version = 0
+
         # Generate the prize
         self.prize = self._generate_prize()
 
@@ -153,6 +158,7 @@ class ScratchTicket:
                 pygame.draw.circle(self.scratch_surface, (0, 0, 0, 0), (offset_x, offset_y), small_radius)
 
             self.scratched = True
+            self.content_version += 1
             self._update_scratch_percent()
 
             # Return scratch particle info
@@ -272,6 +278,11 @@ class Match3Ticket:
         self.dragging = False
         self.drag_offset = (0, 0)
 
+        # Stable ID — assigned by TicketRegistry when the ticket enters the mat
+        self.ticket_id = None
+        # Bumped whenever the visible surface changes (scratching)
+        self.content_version = 0
+
         # Generate symbols for the 9 spots (3x3 grid)
         self.symbols = self._generate_symbols()
         self.prize = self._calculate_prize()
@@ -552,6 +563,7 @@ class Match3Ticket:
                 pygame.draw.circle(self.scratch_surface, (0, 0, 0, 0), (offset_x, offset_y), small_radius)
 
             self.scratched = True
+            self.content_version += 1
             self._update_cells_revealed()
 
             return {
@@ -594,7 +606,9 @@ class Match3Ticket:
 
     def is_complete(self):
         """Ticket is complete when all 9 cells have been revealed."""
-        return all(self.cells_revealed)
+        # ``revealed`` is latched by _update_cells_revealed once every cell is
+        # uncovered, so this stays O(1) for the per-frame automation checks.
+        return self.revealed
 
     def get_cells_revealed_count(self):
         """Get the number of cells revealed (for progress display)."""
@@ -712,6 +726,11 @@ class NumberMatchTicket:
         self.dragging = False
         self.drag_offset = (0, 0)
 
+        # Stable ID — assigned by TicketRegistry when the ticket enters the mat
+        self.ticket_id = None
+        # Bumped whenever the visible surface changes (scratching)
+        self.content_version = 0
+
         # Generate game data
         self.winning_numbers = self._generate_winning_numbers()
         self.grid_numbers = self._generate_grid_numbers()
@@ -1029,6 +1048,7 @@ class NumberMatchTicket:
                 pygame.draw.circle(self.scratch_surface, (0, 0, 0, 0), (ox, oy), sr)
 
             self.scratched = True
+            self.content_version += 1
             self._update_cells_revealed()
 
             return {
@@ -1072,7 +1092,7 @@ class NumberMatchTicket:
 
     def is_complete(self):
         """Ticket is complete when all cells are revealed."""
-        return all(self.cells_revealed)
+        return self.revealed
 
     def get_cells_revealed_count(self):
         return sum(self.cells_revealed)
@@ -4,6 +4,10 @@ import pygame
 import random
 import math
 from game.animations import Tween, TweenGroup, AnimationManager
+from game.ticket_registry import (
+    TicketRegistry, LIFECYCLE_QUEUED, LIFECYCLE_ON_MAT, LIFECYCLE_STASHED,
+    FLAG_DEALING, FLAG_SNAPPING, FLAG_DISSOLVING,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -25,38 +29,64 @@ MAT_PADDING = 10            # inset from mat edge when clamping tickets
 # RedeemBox — drop zone below the mat
 # ---------------------------------------------------------------------------
 class RedeemBox:
-    """Visual drop zone. Drag a completed ticket here to collect its prize."""
+    """Visual drop zone. Drag a completed ticket here to collect its prize,
+    or click it to collect every completed winner at once."""
+
+    # Outline thickness; the dashed edges sit on the rect's boundary
+    BORDER = 2
 
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.font = pygame.font.Font(None, 28)
         self.small_font = pygame.font.Font(None, 22)
+        # Pre-rendered fill + dashed border per hover state, labels by text
+        self._frames = {}
+        self._labels = {}
 
     def contains_point(self, pos):
         return self.rect.collidepoint(pos)
 
-    def draw(self, screen, is_hovering=False):
-        # Background
+    def _style(self, is_hovering):
+        """(fill, border, text) colours for the hover state."""
         if is_hovering:
-            bg_color = (40, 120, 40, 140)
-            border_color = (80, 220, 80)
-            text_color = (180, 255, 180)
-        else:
-            bg_color = (50, 55, 65, 100)
-            border_color = (100, 100, 120)
-            text_color = (160, 160, 170)
-
-        # Semi-transparent fill
-        surf = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        surf.fill(bg_color)
-        screen.blit(surf, self.rect.topleft)
-
-        # Dashed border
-        self._draw_dashed_rect(screen, border_color, self.rect, dash_len=10, gap=6, width=2)
+            return (40, 120, 40, 140), (80, 220, 80), (180, 255, 180)
+        return (50, 55, 65, 100), (100, 100, 120), (160, 160, 170)
+
+    def _frame(self, is_hovering):
+        frame = self._frames.get(is_hovering)
+        if frame is None:
+            bg_color, border_color, _ = self._style(is_hovering)
+            pad = self.BORDER
+            frame = pygame.Surface((self.rect.width + pad * 2, self.rect.height + pad * 2),
+                                   pygame.SRCALPHA)
+            local = pygame.Rect(pad, pad, self.rect.width, self.rect.height)
+            # Semi-transparent fill
+            frame.fill(bg_color, local)
+            # Dashed border
+            self._draw_dashed_rect(frame, border_color, local, dash_len=10, gap=6, width=2)
+            self._frames[is_hovering] = frame
+        return frame
+
+    def _label(self, label, is_hovering):
+        key = (label, is_hovering)
+        surf = self._labels.get(key)
+        if surf is None:
+            surf = self.font.render(label, True, self._style(is_hovering)[2])
+            self._labels[key] = surf
+        return surf
+
+    def draw(self, screen, is_hovering=False, waiting=0):
+        screen.blit(self._frame(is_hovering),
+                    (self.rect.x - self.BORDER, self.rect.y - self.BORDER))
 
         # Label
-        label = "DROP TO REDEEM" if not is_hovering else "RELEASE TO COLLECT!"
-        text_surf = self.font.render(label, True, text_color)
+        if is_hovering:
+            label = "RELEASE TO COLLECT!"
+        elif waiting > 1:
+            label = f"DROP TO REDEEM - CLICK TO COLLECT ALL ({waiting})"
+        else:
+            label = "DROP TO REDEEM"
+        text_surf = self._label(label, is_hovering)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -95,6 +125,79 @@ class RedeemBox:
             drawing = not drawing
 
 
+# ---------------------------------------------------------------------------
+# ZStack — ordered draw stack for mat tickets
+# ---------------------------------------------------------------------------
+class ZStack:
+    """Draw-ordered collection of mat tickets (first = bottom, last = top).
+
+    Backed by an insertion-ordered dict keyed by ``ticket_id``, so append,
+    remove and promote-to-top are O(1) and iteration walks draw order
+    (``reversed()`` walks top-down for hit-testing). Topmost-at-point
+    results are cached until the stack changes; call ``invalidate()`` after
+    moving a ticket or changing whether it can be hit.
+    """
+
+    MAX_CACHED_POINTS = 256
+
+    def __init__(self):
+        self._tickets = {}      # ticket_id -> ticket, in draw order
+        self._hit_cache = {}    # (x, y) -> ticket or None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __iter__(self):
+        return iter(self._tickets.values())
+
+    def __reversed__(self):
+        return reversed(self._tickets.values())
+
+    def __len__(self):
+        return len(self._tickets)
+
+    def __contains__(self, ticket):
+        return self._tickets.get(getattr(ticket, "ticket_id", None)) is ticket
+
+    def append(self, ticket):
+        """Push a ticket on top of the stack."""
+        self._tickets[ticket.ticket_id] = ticket
+        self.invalidate()
+
+    def remove(self, ticket):
+        del self._tickets[ticket.ticket_id]
+        self.invalidate()
+
+    def promote(self, ticket):
+        """Move *ticket* to the top. Returns True if the order changed."""
+        tid = ticket.ticket_id
+        if tid not in self._tickets or self.top() is ticket:
+            return False
+        del self._tickets[tid]
+        self._tickets[tid] = ticket
+        self.invalidate()
+        return True
+
+    def top(self):
+        return next(reversed(self._tickets.values()), None)
+
+    def invalidate(self):
+        if self._hit_cache:
+            self._hit_cache.clear()
+
+    def topmost_at(self, pos, resolve):
+        """Cached ``resolve(pos)`` — the hit-test result for *pos*."""
+        key = (int(pos[0]), int(pos[1]))
+        if key in self._hit_cache:
+            self.cache_hits += 1
+            return self._hit_cache[key]
+        self.cache_misses += 1
+        if len(self._hit_cache) >= self.MAX_CACHED_POINTS:
+            self._hit_cache.clear()
+        result = resolve(key)
+        self._hit_cache[key] = result
+        return result
+
+
 # ---------------------------------------------------------------------------
 # TicketMatManager
 # ---------------------------------------------------------------------------
@@ -102,25 +205,42 @@ class TicketMatManager:
     """Manages multi-ticket mat: dealing, dragging, redeeming, stashing.
 
     Tickets are freely positioned anywhere on the mat (no fixed slots).
-    The list order = draw order: last element is drawn on top.
+    ``mat_tickets`` is a ZStack: iteration order = draw order, last is on top.
     Touching / dragging a ticket promotes it to the top of the draw list.
     Only the topmost ticket at a given point can be scratched — no
     stacking exploits.
+
+    Every ticket that enters the mat is given a stable ID by the
+    ``TicketRegistry``; animation tags and per-ticket state are keyed by it.
     """
 
-    def __init__(self):
+    def __init__(self, camera=None):
         self.mat_rect = pygame.Rect(MAT_X, MAT_Y, MAT_W, MAT_H)
 
+        # Maps screen-space drag input into the world layer (None = identity)
+        self.camera = camera
+
         # Ticket lists  (mat_tickets order == z-order, last = top)
-        self.mat_tickets = []           # on the mat (max MAX_TICKETS_ON_MAT)
+        self.mat_tickets = ZStack()     # on the mat (max MAX_TICKETS_ON_MAT)
         self.ticket_queue = []          # waiting to be dealt
         self.stashed_tickets = []       # stored in ticket inventory
 
+        # Stable IDs + lifecycle / animation flags / alpha per ticket
+        self.registry = TicketRegistry()
+
         # Animation
         self.animations = AnimationManager()
-        self._dealing_set = set()       # tickets currently sliding in
-        self._dissolving = {}           # ticket id -> alpha (fading losers)
-        self._snapping = set()          # tickets currently snapping back
+        self._moving = {}               # ticket id -> TweenGroup driving x/y
+        self._fading = {}               # ticket id -> Tween driving alpha
+
+        # Automation queues (ordered dicts used as O(1) ordered sets),
+        # kept up to date on deal / complete / dissolve / drag events
+        self._pending_scratch = {}      # ticket id -> ticket still to be scratched
+        self._completed_winners = {}    # ticket id -> completed ticket with a prize
+
+        # Dirty-rect tracking: what each region looked like when last reported
+        self._drawn = {}                # ticket id -> (rect, draw state)
+        self._drawn_overlay = None
 
         # Drag state
         self.dragging_ticket = None
@@ -135,12 +255,16 @@ class TicketMatManager:
         redeem_y = self.mat_rect.bottom + 15
         self.redeem_box = RedeemBox(redeem_x, redeem_y, redeem_w, 60)
 
-        # Mat surface (static background — drawn once)
-        self.mat_surface = self._create_mat_surface()
+        # Mat surface (static background — made on first draw)
+        self.mat_surface = None
 
         # Queue count font
         self.queue_font = pygame.font.Font(None, 24)
 
+    def _is_busy(self, ticket):
+        """True while *ticket* is dealing in or dissolving out."""
+        return self.registry.is_busy(ticket.ticket_id)
+
     # ------------------------------------------------------------------
     # Mat surface (background)
     # ------------------------------------------------------------------
@@ -207,10 +331,35 @@ class TicketMatManager:
         ticket.y = max(min_y, min(ticket.y, max_y))
 
     def _promote_to_top(self, ticket):
-        """Move a ticket to the end of mat_tickets so it draws on top."""
-        if ticket in self.mat_tickets:
-            self.mat_tickets.remove(ticket)
-            self.mat_tickets.append(ticket)
+        """Move a ticket to the top of mat_tickets so it draws on top (O(1))."""
+        self.mat_tickets.promote(ticket)
+
+    def _enqueue(self, ticket):
+        """Put an idle mat ticket into the right automation queue."""
+        tid = ticket.ticket_id
+        if ticket not in self.mat_tickets or self.registry.is_busy(tid):
+            return
+        if not ticket.is_complete():
+            self._pending_scratch[tid] = ticket
+        elif ticket.get_prize() > 0 and ticket is not self.dragging_ticket:
+            self._completed_winners[tid] = ticket
+
+    def _dequeue(self, tid):
+        self._pending_scratch.pop(tid, None)
+        self._completed_winners.pop(tid, None)
+
+    def mark_complete(self, ticket):
+        """Move a ticket that has just been fully scratched out of the
+        scratch queue (and into the winners queue if it has a prize)."""
+        self._dequeue(ticket.ticket_id)
+        self._enqueue(ticket)
+
+    def _cancel_motion(self, tid):
+        """Stop any deal / snap tween that is moving ticket *tid*."""
+        if self._moving.pop(tid, None) is not None:
+            self.animations.cancel(f"deal_{tid}")
+            self.animations.cancel(f"snap_{tid}")
+        self.registry.clear_flag(tid, FLAG_DEALING | FLAG_SNAPPING)
 
     # ------------------------------------------------------------------
     # Add / deal tickets
@@ -218,30 +367,38 @@ class TicketMatManager:
 
     def add_ticket(self, ticket):
         """Add a newly purchased ticket. Deals onto mat if room, else queues."""
+        tid = self.registry.register(ticket)
         if len(self.mat_tickets) < MAX_TICKETS_ON_MAT:
             self._deal_to_mat(ticket)
         else:
             self.ticket_queue.append(ticket)
+            self.registry.set_lifecycle(tid, LIFECYCLE_QUEUED)
 
     def _deal_to_mat(self, ticket):
         """Place ticket on the mat with a slide-in animation to a random spot."""
+        tid = ticket.ticket_id
         self.mat_tickets.append(ticket)
+        self.registry.set_lifecycle(tid, LIFECYCLE_ON_MAT)
 
         target_x, target_y = self._pick_deal_position(ticket)
         start_x = self.mat_rect.right + 50  # start off-screen right
 
         ticket.set_position(start_x, target_y)
-        self._dealing_set.add(id(ticket))
+        self.registry.set_flag(tid, FLAG_DEALING)
 
         tween_x = Tween(start_x, target_x, DEAL_DURATION, "ease_out_back")
         tween_y = Tween(target_y, target_y, DEAL_DURATION, "linear")
         group = TweenGroup({"x": tween_x, "y": tween_y})
+        self._moving[tid] = group
 
         def on_deal_done():
             ticket.set_position(target_x, target_y)
-            self._dealing_set.discard(id(ticket))
+            self._moving.pop(tid, None)
+            self.registry.clear_flag(tid, FLAG_DEALING)
+            self.mat_tickets.invalidate()
+            self._enqueue(ticket)
 
-        self.animations.add(group, callback=on_deal_done, tag=f"deal_{id(ticket)}")
+        self.animations.add(group, callback=on_deal_done, tag=f"deal_{tid}")
 
     def _deal_next(self):
         """Deal the next queued ticket onto the mat if there's room."""
@@ -253,10 +410,29 @@ class TicketMatManager:
     # Remove tickets from mat
     # ------------------------------------------------------------------
 
-    def remove_ticket(self, ticket):
-        """Remove a ticket from the mat."""
+    def _take_off_mat(self, ticket):
+        """Detach a ticket from the mat and drop its animation state."""
         if ticket in self.mat_tickets:
             self.mat_tickets.remove(ticket)
+        tid = ticket.ticket_id
+        if tid is None:
+            return
+        self._dequeue(tid)
+        self._cancel_motion(tid)
+        if self._fading.pop(tid, None) is not None:
+            self.animations.cancel(f"dissolve_{tid}")
+        self.registry.clear_flag(tid, FLAG_DISSOLVING)
+
+    def remove_ticket(self, ticket):
+        """Remove a ticket from the mat."""
+        self.remove_tickets((ticket,))
+
+    def remove_tickets(self, tickets):
+        """Remove several tickets from the mat, then deal replacements in one pass."""
+        for ticket in tickets:
+            self._take_off_mat(ticket)
+            if ticket.ticket_id is not None:
+                self.registry.release(ticket.ticket_id)
         # Deal next from queue
         self._deal_next()
 
@@ -266,41 +442,60 @@ class TicketMatManager:
 
     def dissolve_ticket(self, ticket):
         """Start a fade-out animation for a $0 loser ticket."""
-        self._dissolving[id(ticket)] = 255.0  # start fully opaque
+        tid = ticket.ticket_id
+        self._dequeue(tid)
+        self.registry.set_flag(tid, FLAG_DISSOLVING)
+        self.mat_tickets.invalidate()
+        self.registry.alpha[tid] = 255.0  # start fully opaque
 
         tw = Tween(255, 0, DISSOLVE_DURATION, "ease_in_quad")
+        self._fading[tid] = tw
 
         def on_dissolve_done():
-            self._dissolving.pop(id(ticket), None)
+            self._fading.pop(tid, None)
             self.remove_ticket(ticket)
 
-        self.animations.add(tw, callback=on_dissolve_done, tag=f"dissolve_{id(ticket)}")
+        self.animations.add(tw, callback=on_dissolve_done, tag=f"dissolve_{tid}")
 
     # ------------------------------------------------------------------
     # Drag system
     # ------------------------------------------------------------------
 
+    def _to_world(self, pos):
+        return self.camera.screen_to_world(pos) if self.camera else pos
+
+    def _to_screen(self, pos):
+        return self.camera.world_to_screen(pos) if self.camera else pos
+
     def start_drag(self, mouse_pos):
         """Try to start dragging a ticket by its handle. Returns True if drag started.
-        Checks topmost ticket first (reversed list = top of z-order)."""
+        Checks topmost ticket first (reversed list = top of z-order).
+
+        *mouse_pos* is in screen space. A picked-up ticket leaves the world
+        layer and is held in screen coordinates until ``end_drag``.
+        """
         if self.dragging_ticket is not None:
             return False
 
+        world_pos = self._to_world(mouse_pos)
         # Check tickets in reverse order (topmost first)
         for ticket in reversed(self.mat_tickets):
             # Skip tickets that are currently animating
-            if id(ticket) in self._dealing_set or id(ticket) in self._dissolving:
+            if self._is_busy(ticket):
                 continue
-            if ticket.get_handle_rect().collidepoint(mouse_pos):
+            if ticket.get_handle_rect().collidepoint(world_pos):
                 self.dragging_ticket = ticket
                 ticket.dragging = True
+                ticket.set_position(*self._to_screen((ticket.x, ticket.y)))
                 ticket.drag_offset = (mouse_pos[0] - ticket.x, mouse_pos[1] - ticket.y)
                 self._drag_started = True
                 # Promote to top of draw order
                 self._promote_to_top(ticket)
+                self.mat_tickets.invalidate()
                 # Cancel any snap animation for this ticket
-                self.animations.cancel(f"reslot_{id(ticket)}")
-                self._snapping.discard(id(ticket))
+                self._cancel_motion(ticket.ticket_id)
+                # Held tickets can't be auto-collected
+                self._completed_winners.pop(ticket.ticket_id, None)
                 return True
         return False
 
@@ -330,6 +525,8 @@ class TicketMatManager:
         ticket.dragging = False
         self.dragging_ticket = None
         self._drag_started = False
+        self.mat_tickets.invalidate()
+        self._enqueue(ticket)
 
         # Check redeem box
         if self.redeem_box.contains_point(mouse_pos) and ticket.is_complete():
@@ -339,6 +536,9 @@ class TicketMatManager:
         if side_panel_rect and side_panel_rect.collidepoint(mouse_pos):
             return {"action": "stash", "ticket": ticket}
 
+        # Back into the world layer
+        ticket.set_position(*self._to_world((ticket.x, ticket.y)))
+
         # Clamp back into mat bounds (smooth snap)
         clamped_x = max(self.mat_rect.x + MAT_PADDING,
                         min(ticket.x, self.mat_rect.right - ticket.width - MAT_PADDING))
@@ -347,16 +547,20 @@ class TicketMatManager:
 
         if abs(ticket.x - clamped_x) > 2 or abs(ticket.y - clamped_y) > 2:
             # Animate snap to clamped position
+            tid = ticket.ticket_id
             tween_x = Tween(ticket.x, clamped_x, SNAP_DURATION, "ease_out_quad")
             tween_y = Tween(ticket.y, clamped_y, SNAP_DURATION, "ease_out_quad")
             group = TweenGroup({"x": tween_x, "y": tween_y})
-            self._snapping.add(id(ticket))
+            self._moving[tid] = group
+            self.registry.set_flag(tid, FLAG_SNAPPING)
 
             def on_snap():
                 ticket.set_position(clamped_x, clamped_y)
-                self._snapping.discard(id(ticket))
+                self._moving.pop(tid, None)
+                self.registry.clear_flag(tid, FLAG_SNAPPING)
+                self.mat_tickets.invalidate()
 
-            self.animations.add(group, callback=on_snap, tag=f"snap_{id(ticket)}")
+            self.animations.add(group, callback=on_snap, tag=f"snap_{tid}")
         else:
             ticket.set_position(clamped_x, clamped_y)
 
@@ -378,12 +582,15 @@ class TicketMatManager:
     def stash_ticket(self, ticket):
         """Move a ticket from mat to stashed list."""
         self.stashed_tickets.append(ticket)
-        self.remove_ticket(ticket)
+        self._take_off_mat(ticket)
+        self.registry.set_lifecycle(ticket.ticket_id, LIFECYCLE_STASHED)
+        self._deal_next()
 
     def unstash_ticket(self, ticket, mouse_pos):
         """Pull a stashed ticket back to the mat at the mouse position for dragging."""
         if ticket in self.stashed_tickets:
             self.stashed_tickets.remove(ticket)
+        tid = self.registry.register(ticket)
 
         # Place at mouse position and start dragging
         ticket.set_position(mouse_pos[0] - ticket.width // 2,
@@ -392,13 +599,16 @@ class TicketMatManager:
         # Add to mat if room, otherwise queue it
         if len(self.mat_tickets) < MAX_TICKETS_ON_MAT:
             self.mat_tickets.append(ticket)
+            self.registry.set_lifecycle(tid, LIFECYCLE_ON_MAT)
             self.dragging_ticket = ticket
             ticket.dragging = True
             ticket.drag_offset = (ticket.width // 2, ticket.handle_height // 2)
             self._drag_started = True
+            self._enqueue(ticket)
         else:
             # No room — just add to queue
             self.ticket_queue.append(ticket)
+            self.registry.set_lifecycle(tid, LIFECYCLE_QUEUED)
 
     # ------------------------------------------------------------------
     # Query helpers (z-order aware — topmost only)
@@ -407,9 +617,13 @@ class TicketMatManager:
     def get_ticket_at_point(self, pos):
         """Return the TOPMOST non-animating ticket whose body (below handle)
         contains *pos*. Only the top ticket is returned — stacked tickets
-        underneath are blocked, preventing multi-scratch exploits."""
+        underneath are blocked, preventing multi-scratch exploits.
+        Results are cached by the z-stack until a ticket moves or restacks."""
+        return self.mat_tickets.topmost_at(pos, self._hit_test)
+
+    def _hit_test(self, pos):
         for ticket in reversed(self.mat_tickets):
-            if id(ticket) in self._dealing_set or id(ticket) in self._dissolving:
+            if self._is_busy(ticket):
                 continue
             if ticket is self.dragging_ticket:
                 continue
@@ -429,24 +643,24 @@ class TicketMatManager:
         return None
 
     def auto_scratch_target(self):
-        """Return first non-complete, non-animating ticket on mat, or None."""
-        for ticket in self.mat_tickets:
-            if id(ticket) in self._dealing_set or id(ticket) in self._dissolving:
-                continue
+        """Return the oldest non-complete, non-animating ticket on mat, or None.
+        Reads the head of the pending-scratch queue."""
+        for ticket in self._pending_scratch.values():
             if not ticket.is_complete():
                 return ticket
+            # Completed outside mark_complete() — requeue and look again
+            self.mark_complete(ticket)
+            return self.auto_scratch_target()
         return None
 
     def get_first_complete_winner(self):
-        """Return first completed ticket with prize > 0 on the mat, or None."""
-        for ticket in self.mat_tickets:
-            if id(ticket) in self._dealing_set or id(ticket) in self._dissolving:
-                continue
-            if ticket is self.dragging_ticket:
-                continue
-            if ticket.is_complete() and ticket.get_prize() > 0:
-                return ticket
-        return None
+        """Return the oldest completed ticket with prize > 0 on the mat, or None.
+        Reads the head of the completed-winners queue."""
+        return next(iter(self._completed_winners.values()), None)
+
+    def get_completed_winners(self):
+        """Return every completed, idle ticket with prize > 0 (oldest first)."""
+        return list(self._completed_winners.values())
 
     def has_any_tickets(self):
         """True if any tickets exist on mat, queue, or stash."""
@@ -457,113 +671,62 @@ class TicketMatManager:
     # ------------------------------------------------------------------
 
     def update(self, dt):
-        """Advance all animations. Called once per frame."""
+        """Advance all animations. Called once per simulation step."""
         self.animations.update(dt)
 
         # Update positions of dealing/snapping tickets via their tweens
-        for entry_tween, _, tag in self.animations._entries:
-            if not hasattr(entry_tween, 'tweens'):
-                continue  # skip non-TweenGroup entries (dissolve tweens)
-            vals = entry_tween.get_values()
-            # Find the ticket this animation belongs to
-            if tag and tag.startswith(("deal_", "reslot_", "snap_")):
-                tid = int(tag.split("_", 1)[1])
-                for ticket in self.mat_tickets:
-                    if id(ticket) == tid:
-                        ticket.set_position(vals.get("x", ticket.x),
-                                            vals.get("y", ticket.y))
-                        break
+        if self._moving:
+            self.mat_tickets.invalidate()
+        for tid, group in self._moving.items():
+            ticket = self.registry.get(tid)
+            if ticket is not None:
+                vals = group.get_values()
+                ticket.set_position(vals["x"], vals["y"])
 
         # Update dissolve alpha
-        for entry_tween, _, tag in self.animations._entries:
-            if tag and tag.startswith("dissolve_"):
-                tid = int(tag.split("_", 1)[1])
-                if tid in self._dissolving:
-                    self._dissolving[tid] = max(0, entry_tween.get_value())
+        for tid, tween in self._fading.items():
+            self.registry.alpha[tid] = max(0, tween.get_value())
 
     # ------------------------------------------------------------------
     # Draw
     # ------------------------------------------------------------------
 
-    def draw(self, screen, shake_offset=(0, 0), drunk_offset=(0, 0), drunk_effect=None):
-        """Draw the mat, tickets, redeem box, and queue indicator.
+    def draw(self, screen):
+        """Draw the world layer and the UI overlay in one go."""
+        self.draw_world(screen)
+        self.draw_overlay(screen)
+
+    def draw_world(self, surface):
+        """Draw the mat, resting tickets and queue badge in world coordinates.
 
-        Tickets are drawn in list order (index 0 = bottom, last = top).
-        The dragged ticket is always drawn last (above everything).
+        The camera shifts the whole layer for shake and sway. Tickets are
+        drawn in z-order, bottom first; the dragged ticket is left to
+        ``draw_overlay``.
         """
-        final_ox = shake_offset[0] + drunk_offset[0]
-        final_oy = shake_offset[1] + drunk_offset[1]
+        self.draw_mat(surface)
+        self.draw_tickets(surface)
 
-        # Mat background
-        mat_x = self.mat_rect.x + final_ox
-        mat_y = self.mat_rect.y + final_oy
+    def draw_mat(self, surface):
+        """Draw the empty mat (static — the compositor flattens it)."""
+        if self.mat_surface is None:
+            self.mat_surface = self._create_mat_surface()
+        surface.blit(self.mat_surface, self.mat_rect.topleft)
 
-        if drunk_effect and drunk_effect.enabled:
-            drunk_effect.draw_double(screen, self.mat_surface, (mat_x, mat_y), "mat")
-        else:
-            screen.blit(self.mat_surface, (mat_x, mat_y))
-
-        # Redeem box (no shake on UI elements)
-        hovering = False
-        if self.dragging_ticket and self.dragging_ticket.is_complete():
-            ticket_center = (self.dragging_ticket.x + self.dragging_ticket.width // 2,
-                             self.dragging_ticket.y + self.dragging_ticket.height // 2)
-            hovering = self.redeem_box.contains_point(ticket_center)
-        self.redeem_box.draw(screen, is_hovering=hovering)
-
-        # Draw non-dragging tickets in z-order (index 0 = bottom)
+    def draw_tickets(self, surface):
+        """Draw resting tickets in z-order and the queue badge."""
         for ticket in self.mat_tickets:
             if ticket is self.dragging_ticket:
-                continue  # draw dragged ticket last
+                continue  # drawn in the overlay
 
-            tid = id(ticket)
+            tid = ticket.ticket_id
 
             # Dissolving ticket — draw with reduced alpha
-            if tid in self._dissolving:
-                alpha = int(self._dissolving[tid])
-                self._draw_ticket_with_alpha(screen, ticket, alpha, final_ox, final_oy, drunk_effect)
+            if self.registry.has_flag(tid, FLAG_DISSOLVING):
+                alpha = int(self.registry.alpha[tid])
+                self._draw_ticket_with_alpha(surface, ticket, alpha)
                 continue
 
-            # Normal ticket with shake/drunk offset
-            tx = ticket.x + final_ox
-            ty = ticket.y + final_oy
-
-            if drunk_effect and drunk_effect.enabled:
-                ticket_offset = drunk_effect.get_ticket_offset()
-                tx = ticket.x + final_ox * 0.8 + ticket_offset[0]
-                ty = ticket.y + final_oy * 0.8 + ticket_offset[1]
-
-                # Composite ticket surface
-                ticket_surface = pygame.Surface(
-                    (ticket.width, ticket.height), pygame.SRCALPHA)
-                ticket_surface.blit(ticket.base_surface, (0, 0))
-                ticket_surface.blit(ticket.scratch_surface, (0, 0))
-                drunk_effect.draw_double(screen, ticket_surface, (tx, ty), f"ticket_{tid}")
-
-                # Border
-                pygame.draw.rect(screen, (80, 60, 40),
-                                 (tx - 2, ty - 2, ticket.width + 4, ticket.height + 4),
-                                 4, border_radius=12)
-
-                # Handle
-                handle_surf = pygame.Surface((ticket.width, ticket.handle_height), pygame.SRCALPHA)
-                handle_surf.fill((0, 0, 0, 60))
-                screen.blit(handle_surf, (tx, ty))
-                for i in range(3):
-                    ly = ty + 9 + i * 6
-                    pygame.draw.line(screen, (180, 180, 180),
-                                     (tx + ticket.width // 2 - 20, ly),
-                                     (tx + ticket.width // 2 + 20, ly), 1)
-            else:
-                # Save original pos, set offset pos, draw, restore
-                orig_x, orig_y = ticket.x, ticket.y
-                ticket.set_position(tx, ty)
-                ticket.draw(screen)
-                ticket.set_position(orig_x, orig_y)
-
-        # Draw dragging ticket on top (no shake offset — follows mouse)
-        if self.dragging_ticket:
-            self.dragging_ticket.draw(screen)
+            ticket.draw(surface)
 
         # Queue count badge
         if self.ticket_queue:
@@ -571,14 +734,72 @@ class TicketMatManager:
             badge_surf = self.queue_font.render(badge_text, True, (200, 200, 200))
             badge_x = self.mat_rect.right - badge_surf.get_width() - 15
             badge_y = self.mat_rect.bottom - 25
-            screen.blit(badge_surf, (badge_x + final_ox, badge_y + final_oy))
+            surface.blit(badge_surf, (badge_x, badge_y))
 
-    def _draw_ticket_with_alpha(self, screen, ticket, alpha, ox, oy, drunk_effect):
+    def draw_overlay(self, screen):
+        """Draw the redeem box and the dragged ticket (no shake or sway)."""
+        hovering = False
+        if self.dragging_ticket and self.dragging_ticket.is_complete():
+            ticket_center = (self.dragging_ticket.x + self.dragging_ticket.width // 2,
+                             self.dragging_ticket.y + self.dragging_ticket.height // 2)
+            hovering = self.redeem_box.contains_point(ticket_center)
+        self.redeem_box.draw(screen, is_hovering=hovering,
+                             waiting=len(self._completed_winners))
+
+        # Dragged ticket on top (follows the mouse)
+        if self.dragging_ticket:
+            self.dragging_ticket.draw(screen)
+
+    # ---- dirty rects ----
+
+    def _badge_rect(self):
+        return pygame.Rect(self.mat_rect.right - 200, self.mat_rect.bottom - 30, 200, 30)
+
+    def ticket_rects(self):
+        """Drawn extent of every ticket on the mat (border included)."""
+        return [ticket.get_rect().inflate(8, 8) for ticket in self.mat_tickets]
+
+    def dirty_rects(self):
+        """Rects (in unshifted world / screen space) that changed since the
+        last call: tickets that moved, scratched, faded, restacked, arrived
+        or left, plus the queue badge and redeem box when their state
+        changed."""
+        rects = []
+        drawn = {}
+        for z, ticket in enumerate(self.mat_tickets):
+            tid = ticket.ticket_id
+            # Border is drawn 2px outside the ticket, 4px wide
+            rect = ticket.get_rect().inflate(8, 8)
+            state = (z, ticket.content_version, int(self.registry.alpha[tid]),
+                     ticket is self.dragging_ticket)
+            previous = self._drawn.pop(tid, None)
+            if previous is None:
+                rects.append(rect)
+            elif previous[0] != rect or previous[1] != state:
+                rects.append(previous[0])
+                rects.append(rect)
+            drawn[tid] = (rect, state)
+        # Whatever is left has left the mat
+        rects.extend(rect for rect, _ in self._drawn.values())
+        self._drawn = drawn
+
+        hovering = False
+        if self.dragging_ticket and self.dragging_ticket.is_complete():
+            hovering = self.redeem_box.contains_point(self.dragging_ticket.get_rect().center)
+        overlay = (len(self.ticket_queue), hovering, len(self._completed_winners))
+        if overlay != self._drawn_overlay:
+            if self._drawn_overlay is None or overlay[0] != self._drawn_overlay[0]:
+                rects.append(self._badge_rect())
+            rects.append(self.redeem_box.rect.inflate(4, 4))
+            self._drawn_overlay = overlay
+        return rects
+
+    def _draw_ticket_with_alpha(self, screen, ticket, alpha):
         """Draw a ticket with overall alpha (for dissolve)."""
         if alpha <= 0:
             return
-        tx = ticket.x + ox
-        ty = ticket.y + oy
+        tx = ticket.x
+        ty = ticket.y
 
         # Composite into temp surface then apply alpha
         temp = pygame.Surface((ticket.width + 4, ticket.height + 4), pygame.SRCALPHA)
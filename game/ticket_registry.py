@@ -0,0 +1,116 @@
+"""Central ticket registry — stable integer IDs and compact per-ticket state."""
+
+import numpy as np
+
+
+# Lifecycle states (stored in TicketRegistry.lifecycle)
+LIFECYCLE_NEW = 0
+LIFECYCLE_QUEUED = 1
+LIFECYCLE_ON_MAT = 2
+LIFECYCLE_STASHED = 3
+LIFECYCLE_REMOVED = 4
+
+LIFECYCLE_NAMES = {
+    LIFECYCLE_NEW: "new",
+    LIFECYCLE_QUEUED: "queued",
+    LIFECYCLE_ON_MAT: "on_mat",
+    LIFECYCLE_STASHED: "stashed",
+    LIFECYCLE_REMOVED: "removed",
+}
+
+# Animation flags (bitmask stored in TicketRegistry.flags)
+FLAG_DEALING = 1
+FLAG_SNAPPING = 2
+FLAG_DISSOLVING = 4
+
+# Tickets with any of these flags can't be scratched, dragged or auto-collected
+BUSY_FLAGS = FLAG_DEALING | FLAG_DISSOLVING
+
+
+class TicketRegistry:
+    """Hands out monotonically increasing ticket IDs and keeps per-ticket
+    state (lifecycle, animation flags, alpha) in arrays indexed by that ID.
+
+    IDs are never reused, so they are safe to use as dictionary keys,
+    animation tags and save data — unlike ``id(ticket)``, which CPython
+    recycles once a ticket is garbage collected.
+    """
+
+    def __init__(self, capacity=64):
+        self._tickets = {}  # ticket_id -> ticket (live tickets only)
+        self._next_id = 0
+        self.lifecycle = np.zeros(capacity, dtype=np.uint8)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.alpha = np.full(capacity, 255.0, dtype=np.float32)
+
+    def _ensure_capacity(self, size):
+        capacity = len(self.lifecycle)
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+        extra = new_capacity - capacity
+        self.lifecycle = np.concatenate([self.lifecycle, np.zeros(extra, dtype=np.uint8)])
+        self.flags = np.concatenate([self.flags, np.zeros(extra, dtype=np.uint8)])
+        self.alpha = np.concatenate([self.alpha, np.full(extra, 255.0, dtype=np.float32)])
+
+    # ---- registration ----
+
+    def register(self, ticket):
+        """Assign *ticket* a new ID (if it doesn't have one) and return it."""
+        tid = getattr(ticket, "ticket_id", None)
+        if tid is not None and tid in self._tickets:
+            return tid
+        tid = self._next_id
+        self._next_id += 1
+        self._ensure_capacity(tid + 1)
+        ticket.ticket_id = tid
+        self._tickets[tid] = ticket
+        self.lifecycle[tid] = LIFECYCLE_NEW
+        self.flags[tid] = 0
+        self.alpha[tid] = 255.0
+        return tid
+
+    def release(self, tid):
+        """Forget a ticket that has left the game (redeemed / dissolved)."""
+        self._tickets.pop(tid, None)
+        self.lifecycle[tid] = LIFECYCLE_REMOVED
+        self.flags[tid] = 0
+
+    def get(self, tid):
+        return self._tickets.get(tid)
+
+    def __contains__(self, tid):
+        return tid in self._tickets
+
+    def __len__(self):
+        return len(self._tickets)
+
+    # ---- state ----
+
+    def set_lifecycle(self, tid, state):
+        self.lifecycle[tid] = state
+
+    def set_flag(self, tid, flag):
+        self.flags[tid] |= flag
+
+    def clear_flag(self, tid, flag):
+        self.flags[tid] &= ~flag & 0xFF
+
+    def has_flag(self, tid, flag):
+        return bool(self.flags[tid] & flag)
+
+    def is_busy(self, tid):
+        """True while the ticket is dealing in or dissolving out."""
+        return bool(self.flags[tid] & BUSY_FLAGS)
+
+    def snapshot(self):
+        """Plain-data view of every live ticket's state (JSON serialisable)."""
+        return {
+            tid: {
+                "ticket_type": ticket.ticket_type,
+                "lifecycle": LIFECYCLE_NAMES[int(self.lifecycle[tid])],
+                "flags": int(self.flags[tid]),
+                "alpha": float(self.alpha[tid]),
+            }
+            for tid, ticket in self._tickets.items()
+        }
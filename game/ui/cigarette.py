@@ -1,5 +1,9 @@
 import pygame
 
+from game.particles import Emitter
+
+SMOKE_RATE = 120  # particles per second
+
 
 class Cigarette:
     def __init__(
@@ -31,20 +35,19 @@ class Cigarette:
 
         # Blink setup
         self.blink_interval = 500  # ms
-        self.last_blink = pygame.time.get_ticks()
+        self.blink_timer = 0
         self.show_dot = True
 
-        # Scale images ONCE
+        # Scale images ONCE, on first draw; the layout (and where smoke
+        # spawns) only needs their sizes
+        self.source_images = (idle_image, smoking_image)
+        self.scale = scale
+        self.idle_image = None
+        self.smoking_image = None
+
         idle_w = int(idle_image.get_width() * scale)
         idle_h = int(idle_image.get_height() * scale)
-
-        smoke_w = int(smoking_image.get_width() * scale)
-        smoke_h = int(smoking_image.get_height() * scale)
-
-        self.idle_image = pygame.transform.smoothscale(idle_image, (idle_w, idle_h))
-        self.smoking_image = pygame.transform.smoothscale(smoking_image, (smoke_w, smoke_h))
-
-        self.image_rect = self.idle_image.get_rect(topleft=(x, y))
+        self.image_rect = pygame.Rect(x, y, idle_w, idle_h)
 
         # Frame rect
         self.frame_rect = pygame.Rect(
@@ -54,12 +57,26 @@ class Cigarette:
             self.image_rect.height + self.padding * 2
         )
 
-        # Inner panel surface
+        # Inner panel surface, built with the images
+        self.panel_surface = None
+
+        # Smoke is emitted by time, not per draw call
+        self.smoke_emitter = particle_system.add_emitter(
+            Emitter(particle_system.add_smoke, SMOKE_RATE, enabled=False)
+        )
+
+    def _build(self):
+        """Scale the images and make the panel."""
+        scaled = []
+        for image in self.source_images:
+            size = (int(image.get_width() * self.scale), int(image.get_height() * self.scale))
+            scaled.append(pygame.transform.smoothscale(image, size))
+        self.idle_image, self.smoking_image = scaled
+
         self.panel_surface = pygame.Surface(
             (self.frame_rect.width, self.frame_rect.height),
             pygame.SRCALPHA
         )
-
         self.panel_surface.fill((0, 0, 0, self.panel_alpha))
 
     def start_smoking(self):
@@ -68,16 +85,27 @@ class Cigarette:
     def stop_smoking(self):
         self.is_smoking = False
 
-    def update_blink(self):
-        now = pygame.time.get_ticks()
-
-        if now - self.last_blink > self.blink_interval:
+    def update(self, dt, visible=True):
+        """Advance the blink and point the smoke emitter at the cigarette."""
+        self.blink_timer += dt * 1000
+        if self.blink_timer > self.blink_interval:
             self.show_dot = not self.show_dot
-            self.last_blink = now
+            self.blink_timer = 0
 
-    def draw(self, screen, remaining=None, total=None):
-        self.update_blink()
+        self.smoke_emitter.enabled = visible
+        if self.is_smoking:
+            self.smoke_emitter.move_to(self.image_rect.right - 50, self.image_rect.top + 65)
+        else:
+            self.smoke_emitter.move_to(self.image_rect.right - 200, self.image_rect.top + 200)
+
+    def get_bounds(self):
+        """Screen rect covering the header, panel, caption and timer bar."""
+        return pygame.Rect(self.frame_rect.x - 2, self.frame_rect.y - 24,
+                           self.frame_rect.width + 4, self.frame_rect.height + 64)
 
+    def draw(self, screen, remaining=None, total=None):
+        if self.idle_image is None:
+            self._build()
         image = self.smoking_image if self.is_smoking else self.idle_image
 
         # ----- LIVE HEADER -----
@@ -115,17 +143,6 @@ class Cigarette:
         text_rect = text_surface.get_rect(
             midtop=(self.frame_rect.centerx, self.frame_rect.bottom + 6)
         )
-        if self.is_smoking:
-            self.particle_system.add_smoke(
-                self.image_rect.right - 50,
-                self.image_rect.top + 65
-            )
-        if not self.is_smoking:
-            self.particle_system.add_smoke(
-                self.image_rect.right - 200,
-                self.image_rect.top+ 200
-            )
-
         screen.blit(text_surface, text_rect)
 
         # ----- TIMER BAR -----
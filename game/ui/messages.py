@@ -22,30 +22,35 @@ class MessagePopup:
             if msg["timer"] <= 0:
                 self.messages.remove(msg)
 
-    def draw(self, screen, center_x, center_y):
+    def _layout(self, center_x, center_y):
+        """Yield (message, centre) pairs in draw order."""
         y_offset = 0
         for msg in self.messages:
             if msg['flag'] == "AMOUNT_TEXT":
-                text_surface = self.font.render(msg["text"], True, msg["color"])
-                text_surface.set_alpha(msg["alpha"])
-                rect = text_surface.get_rect(center=(center_x + 50, center_y + 120 + y_offset))
-                screen.blit(text_surface, rect)
-                y_offset -= 50
+                center = (center_x + 50, center_y + 120 + y_offset)
             elif msg['flag'] == "WIN_PRIZE":
-                text_surface = self.font.render(msg["text"], True, msg["color"])
-                text_surface.set_alpha(msg["alpha"])
-                rect = text_surface.get_rect(center=(center_x+50, center_y + 150 + y_offset))
-                screen.blit(text_surface, rect)
-                y_offset -= 50
+                center = (center_x + 50, center_y + 150 + y_offset)
             elif msg['flag'] == "TRY_AGAIN":
-                text_surface = self.font.render(msg["text"], True, msg["color"])
-                text_surface.set_alpha(msg["alpha"])
-                rect = text_surface.get_rect(center=(center_x, center_y - 120 + y_offset))
-                screen.blit(text_surface, rect)
-                y_offset -= 50
+                center = (center_x, center_y - 120 + y_offset)
             else:
-                text_surface = self.font.render(msg["text"], True, msg["color"])
-                text_surface.set_alpha(msg["alpha"])
-                rect = text_surface.get_rect(center=(center_x, center_y - 100 + y_offset))
-                screen.blit(text_surface, rect)
-                y_offset -= 50
+                center = (center_x, center_y - 100 + y_offset)
+            y_offset -= 50
+            yield msg, center
+
+    def get_bounds(self, center_x, center_y):
+        """Rect covering every message on screen, or None."""
+        rects = []
+        for msg, center in self._layout(center_x, center_y):
+            rect = pygame.Rect((0, 0), self.font.size(msg["text"]))
+            rect.center = center
+            rects.append(rect)
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
+    def draw(self, screen, center_x, center_y):
+        for msg, center in self._layout(center_x, center_y):
+            text_surface = self.font.render(msg["text"], True, msg["color"])
+            text_surface.set_alpha(msg["alpha"])
+            rect = text_surface.get_rect(center=center)
+            screen.blit(text_surface, rect)
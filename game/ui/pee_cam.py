@@ -1,4 +1,5 @@
 import pygame
+from game.config import load_image
 
 
 class PeeCam:
@@ -13,23 +14,12 @@ class PeeCam:
         self.frame_size = frame_size
         self.animation_speed = animation_speed  # seconds per frame
 
-        # Load and slice spritesheet
-        sheet = pygame.image.load(spritesheet_path).convert_alpha()
-        sheet_width = sheet.get_width()
-        num_frames = sheet_width // frame_size
-
-        self.frames = []
+        # The sheet's width sets the frame count (and so how long the
+        # animation plays); frames are sliced and scaled on first draw
+        self.sheet = load_image(spritesheet_path)
+        self.num_frames = self.sheet.get_width() // frame_size
+        self.frames = None
         scaled_size = int(frame_size * scale)
-        for i in range(num_frames):
-            frame_surf = sheet.subsurface(pygame.Rect(
-                i * frame_size, 0, frame_size, frame_size
-            ))
-            frame_surf = pygame.transform.smoothscale(
-                frame_surf, (scaled_size, scaled_size)
-            )
-            self.frames.append(frame_surf)
-
-        self.num_frames = len(self.frames)
         self.scaled_size = scaled_size
 
         # Animation state
@@ -59,18 +49,31 @@ class PeeCam:
             self.image_rect.height + self.padding * 2
         )
 
-        # Dark panel surface
-        self.panel_surface = pygame.Surface(
-            (self.frame_rect.width, self.frame_rect.height),
-            pygame.SRCALPHA
-        )
-        self.panel_surface.fill((0, 0, 0, self.panel_alpha))
+        # Dark panel surface, built with the frames
+        self.panel_surface = None
 
         # Blink setup for REC dot
         self.blink_interval = 500  # ms
         self.last_blink = pygame.time.get_ticks()
         self.show_dot = True
 
+    def _build(self):
+        """Slice and scale the frames and make the panel."""
+        size = self.frame_size
+        self.frames = []
+        for i in range(self.num_frames):
+            frame_surf = self.sheet.subsurface(pygame.Rect(i * size, 0, size, size))
+            frame_surf = pygame.transform.smoothscale(
+                frame_surf, (self.scaled_size, self.scaled_size)
+            )
+            self.frames.append(frame_surf)
+
+        self.panel_surface = pygame.Surface(
+            (self.frame_rect.width, self.frame_rect.height),
+            pygame.SRCALPHA
+        )
+        self.panel_surface.fill((0, 0, 0, self.panel_alpha))
+
     def start(self):
         """Start playing the animation from the beginning."""
         self.current_frame = 0
@@ -110,11 +113,18 @@ class PeeCam:
             self.show_dot = not self.show_dot
             self.last_blink = now
 
+    def get_bounds(self):
+        """Screen rect covering the header, panel, caption and timer bar."""
+        return pygame.Rect(self.frame_rect.x - 2, self.frame_rect.y - 24,
+                           self.frame_rect.width + 4, self.frame_rect.height + 64)
+
     def draw(self, screen):
         """Draw the pee cam panel with animation, red border, and LIVE header."""
         if not self.playing and not self.finished:
             return
 
+        if self.frames is None:
+            self._build()
         self._update_blink()
 
         # ----- LIVE HEADER -----
@@ -1,4 +1,5 @@
 import pygame
+from game.config import load_image
 from game.ui.button import Button
 
 
@@ -31,7 +32,9 @@ class SideMenuTrigger:
         self.clicked = mouse_clicked and self.hovered
         return was_clicked
 
-    def draw(self, screen):
+    def draw(self, screen, origin=(0, 0)):
+        """Draw the trigger; *origin* is the target surface's screen position."""
+        rect = self.rect.move(-origin[0], -origin[1])
         if self.active:
             color = self.hover_color
         elif self.hovered:
@@ -41,27 +44,27 @@ class SideMenuTrigger:
             color = self.color
 
         # Draw background
-        pygame.draw.rect(screen, color, self.rect, border_radius=6)
+        pygame.draw.rect(screen, color, rect, border_radius=6)
         # Border
         border_color = tuple(max(0, c - 30) for c in color)
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=6)
+        pygame.draw.rect(screen, border_color, rect, 2, border_radius=6)
 
         # Active indicator bar on left edge
         if self.active:
-            bar = pygame.Rect(self.rect.x, self.rect.y + 4,
-                              3, self.rect.height - 8)
+            bar = pygame.Rect(rect.x, rect.y + 4,
+                              3, rect.height - 8)
             pygame.draw.rect(screen, (255, 255, 255), bar)
 
         # Icon character centred
         icon_surf = self.icon_font.render(self.icon_text, True, (255, 255, 255))
-        icon_rect = icon_surf.get_rect(center=(self.rect.centerx,
-                                                self.rect.centery - 8))
+        icon_rect = icon_surf.get_rect(center=(rect.centerx,
+                                                rect.centery - 8))
         screen.blit(icon_surf, icon_rect)
 
         # Tiny label below icon
         label_surf = self.font.render(self.label, True, (220, 220, 220))
-        label_rect = label_surf.get_rect(center=(self.rect.centerx,
-                                                  self.rect.centery + 14))
+        label_rect = label_surf.get_rect(center=(rect.centerx,
+                                                  rect.centery + 14))
         screen.blit(label_surf, label_rect)
 
 
@@ -96,19 +99,11 @@ class SideMenuPanel:
         self.is_open = False
         self.is_animating = False
 
-        # Background image (optional)
+        # Background image (optional) and the panel surface (reused each
+        # frame) are made on first draw
+        self.bg_image_path = bg_image_path
         self.bg_image = None
-        if bg_image_path:
-            try:
-                img = pygame.image.load(bg_image_path).convert_alpha()
-                self.bg_image = pygame.transform.smoothscale(
-                    img, (panel_width, screen_height))
-            except Exception:
-                self.bg_image = None
-
-        # Panel surface (reused each frame)
-        self.surface = pygame.Surface(
-            (panel_width, screen_height), pygame.SRCALPHA)
+        self.surface = None
 
         # Scroll state
         self.scroll_offset = 0
@@ -145,6 +140,20 @@ class SideMenuPanel:
             self.is_animating = (self.current_x != target)
         else:
             self.is_animating = False
+        self.layout()
+
+    def layout(self):
+        """Position the buttons for the current slide and scroll offset.
+
+        Done here rather than in ``draw`` so clicks hit the right buttons
+        even when nothing is drawn (headless games, replays).
+        """
+        panel_x = int(self.current_x)
+        self.close_btn.rect.x = panel_x + self.panel_width - 36
+        top = self.HEADER_HEIGHT + self.SCROLL_TOP_PAD - self.scroll_offset
+        for idx, btn in enumerate(self.buttons):
+            btn.rect.x = panel_x + self.BTN_PADDING_X
+            btn.rect.y = top + idx * self.BTN_SPACING
 
     # ---- hit testing ----
 
@@ -168,16 +177,30 @@ class SideMenuPanel:
 
     # ---- drawing ----
 
+    def _build_surfaces(self):
+        if self.bg_image_path:
+            try:
+                img = load_image(self.bg_image_path)
+                self.bg_image = pygame.transform.smoothscale(
+                    img, (self.panel_width, self.panel_height))
+            except Exception:
+                self.bg_image = None
+        self.surface = pygame.Surface(
+            (self.panel_width, self.panel_height), pygame.SRCALPHA)
+
     def draw(self, screen):
         # Don't draw if fully hidden (or very close)
         if self.current_x >= self.closed_x - 1 and not self.is_open:
             return
 
+        self.layout()
         panel_x = int(self.current_x)
         panel_rect = pygame.Rect(panel_x, 0,
                                  self.panel_width, self.panel_height)
 
         # --- glass background ---
+        if self.surface is None:
+            self._build_surfaces()
         self.surface.fill((0, 0, 0, 0))  # clear
         if self.bg_image:
             self.surface.blit(self.bg_image, (0, 0))
@@ -201,7 +224,6 @@ class SideMenuPanel:
         screen.blit(title_surf, (panel_x + 14, 14))
 
         # --- close button ---
-        self.close_btn.rect.x = panel_x + self.panel_width - 36
         self.close_btn.draw(screen)
 
         # --- scrollable content area ---
@@ -212,11 +234,6 @@ class SideMenuPanel:
         screen.set_clip(clip)
 
         for idx, btn in enumerate(self.buttons):
-            # Position button in screen space
-            btn.rect.x = panel_x + self.BTN_PADDING_X
-            btn.rect.y = (scroll_top + self.SCROLL_TOP_PAD
-                          + idx * self.BTN_SPACING
-                          - self.scroll_offset)
             btn.draw(screen)
 
             # Description text below button
@@ -282,6 +299,10 @@ class SideMenuManager:
         self.triggers = {}
         self.panels = {}
 
+        # Pre-rendered trigger bar, rebuilt when a hover/active state changes
+        self._trigger_bar = None
+        self._trigger_bar_state = None
+
         y = 100  # start below the HUD stat bars
         for key, label, icon, color, hover_color in menu_defs:
             trigger = SideMenuTrigger(
@@ -349,13 +370,38 @@ class SideMenuManager:
             if panel.contains_point(mouse_pos):
                 panel.handle_scroll(scroll_y)
 
+    def get_trigger_bounds(self):
+        rects = [t.rect for t in self.triggers.values()]
+        return rects[0].unionall(rects[1:])
+
+    def get_trigger_state(self):
+        return tuple((t.hovered, t.active) for t in self.triggers.values())
+
+    def get_panel_bounds(self):
+        """Rect covering every panel that's at least partly on screen, or None."""
+        rects = [p.get_panel_rect() for p in self.panels.values()
+                 if p.current_x < p.closed_x]
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
     def draw(self, screen):
         # Panels first (behind triggers)
         for panel in self.panels.values():
             panel.draw(screen)
         # Triggers on top
-        for trigger in self.triggers.values():
-            trigger.draw(screen)
+        self._draw_trigger_bar(screen)
+
+    def _draw_trigger_bar(self, screen):
+        bounds = self.get_trigger_bounds()
+        state = self.get_trigger_state()
+        if self._trigger_bar is None or state != self._trigger_bar_state:
+            bar = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            for trigger in self.triggers.values():
+                trigger.draw(bar, origin=bounds.topleft)
+            self._trigger_bar = bar
+            self._trigger_bar_state = state
+        screen.blit(self._trigger_bar, bounds.topleft)
 
     # ---- close button check ----
 
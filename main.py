@@ -2,8 +2,11 @@ import pygame
 import sys
 import random
 import math
+import json
+import argparse
 
-from game.config import TICKET_TYPES, UPGRADES, ITEMS, LEVEL_CONFIG, PEE_CONFIG, load_symbol_images, load_ticket_images
+from game.config import (TICKET_TYPES, UPGRADES, ITEMS, LEVEL_CONFIG, PEE_CONFIG,
+                         load_symbol_images, load_ticket_images, load_image)
 from game.ticket import ScratchTicket, create_ticket
 from game.player import Player
 from game.ui import (HUD, MessagePopup, TicketShopPopup, UpgradeShopPopup,
@@ -11,6 +14,14 @@ from game.ui import (HUD, MessagePopup, TicketShopPopup, UpgradeShopPopup,
                      StatBar, Cigarette, TicketInventoryPopup, PeeCam, SideMenuManager)
 from game.effects import DrunkEffect
 from game.particles import ParticleSystem, ScreenShake
+from game.celebration import CelebrationDirector, tier_for
+from game.camera import Camera
+from game.render import DirtyRectRenderer
+from game.scheduler import SystemScheduler
+from game.input import InputState
+from game.profiler import FrameProfiler
+from game.replay import InputRecorder, InputReplay, play_headless
+from game.compositor import Compositor, STATIC, ON_CHANGE, PER_FRAME
 from game.pee_minigame import PeeMinigame
 from game.ticket_mat import TicketMatManager
 
@@ -21,29 +32,77 @@ pygame.init()
 SCREEN_WIDTH = 1800
 SCREEN_HEIGHT = 900
 FPS = 60
+SAVE_FILE = "savegame.json"
+
+# Fixed-step simulation: logic always advances in SIM_DT steps, independent
+# of the render rate. After a hitch at most MAX_SIM_STEPS run in one frame
+# and the rest of the backlog is dropped (the game slows down briefly
+# instead of spiralling).
+SIM_HZ = 120
+SIM_DT = 1.0 / SIM_HZ
+MAX_SIM_STEPS = 8
+# Once a step has spent this long, lower-rate systems wait for the next one
+SYSTEM_BUDGET_MS = 4
 
 # Colors
 BG_COLOR = (35, 40, 50)
 COUNTER_COLOR = (55, 60, 70)
 
+# Fixed screen-space HUD regions (for dirty-rect tracking)
+HUD_RECT = pygame.Rect(SCREEN_WIDTH // 2 - 450, 0, 900, 80)
+LEVEL_TEXT_POS = (255, 115)
+LEVEL_TEXT_RECT = pygame.Rect(LEVEL_TEXT_POS, (80, 20))
+
 
 
 class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Gas Station Lotto")
+    """The game. ``Game(headless=True)`` runs the same simulation with no
+    window and nothing drawn — no display mode, screen, layers or
+    renderer are created, and ``draw`` does nothing. Panels, backgrounds,
+    scaled sprites and the particle atlas are built on first draw, so
+    they never exist headless. Some images are still loaded: ticket art
+    and symbols (tickets render their faces and scratch layers, which
+    scratching reads) and the cigarette / pee-cam source images, whose
+    sizes set where smoke spawns and how long the pee cam plays.
+
+    Drive a headless game by setting ``game.input`` and calling ``step``
+    / ``simulate``. *persist* controls loading and saving progress; by
+    default only a windowed game does. *seed* seeds the game's random
+    numbers, for repeatable runs.
+    """
+
+    def __init__(self, headless=False, persist=None, seed=None):
+        self.headless = headless
+        if seed is not None:
+            random.seed(seed)
+        if persist is None:
+            persist = not headless
+        save_file = SAVE_FILE if persist else None
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Gas Station Lotto")
         self.clock = pygame.time.Clock()
         self.running = True
+        # Mouse / keys the simulation reads (polled each frame when windowed)
+        self.input = InputState()
 
         # Load images now that display exists
         load_symbol_images()
         load_ticket_images()
 
         # Game objects
-        self.player = Player()
+        self.player = Player(save_file=save_file)
+
+        # Drunk effect (debug)
+        self.drunk = DrunkEffect()
+        # Shake + sway live on the camera, which the mat maps drag input through
+        self.screen_shake = ScreenShake()
+        self.camera = Camera(self.screen_shake, self.drunk)
 
         # Multi-ticket mat system (replaces single current_ticket + ticket_queue)
-        self.mat = TicketMatManager()
+        self.mat = self._create_mat()
 
         # UI - Popup menus (kept as reference, no longer opened)
         self.ticket_shop = TicketShopPopup(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -74,13 +133,11 @@ class Game:
         self.pee_bar = StatBar(self.player,50,140,200,25,("current_bladder","max_bladder"),color=(255,255,0))
         self.level_font = pygame.font.Font(None, 22)
         # Effects
-        self.particles = ParticleSystem()
-        self.screen_shake = ScreenShake()
-        # Drunk effect (debug)
-        self.drunk = DrunkEffect()
+        self.particles = ParticleSystem(seed=seed)
+        self.celebrations = CelebrationDirector(self.particles, self.screen_shake)
         # Cigarette
-        self.cig_idle = pygame.image.load("assets/sprites/cig_idle.png").convert_alpha()
-        self.cig_smoking = pygame.image.load("assets/sprites/cig_smoking.png").convert_alpha()
+        self.cig_idle = load_image("assets/sprites/cig_idle.png")
+        self.cig_smoking = load_image("assets/sprites/cig_smoking.png")
 
         self.cigarette = Cigarette(
             self.cig_idle,
@@ -91,7 +148,8 @@ class Game:
         )
 
         # Pee minigame
-        self.pee_minigame = PeeMinigame(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.pee_minigame = PeeMinigame(SCREEN_WIDTH, SCREEN_HEIGHT,
+                                        stamp_atlas=self.particles.stamps)
         self.pee_minigame_active = False
 
         # Pee accident cam (plays when bladder full for too long)
@@ -111,18 +169,76 @@ class Game:
         self.auto_collect_timer = 0
         self.game_lost = False
 
+        # Fixed-step clock: unsimulated time, and how far rendering sits
+        # between the last two steps (0..1) for interpolation
+        self.sim_accumulator = 0.0
+        self.render_alpha = 1.0
+
+        # Game-state systems, each ticking at its own rate
+        self.scheduler = SystemScheduler(budget_ms=SYSTEM_BUDGET_MS)
+        self._register_systems()
+
         # Track mouse state for click detection
         self.mouse_was_pressed = False
-
-        # Create background
-        self.background = self._create_background()
+        # Input is sampled once per frame but may feed several steps; a
+        # held mouse scratches on the first of them only
+        self.scratch_due = False
+
+        if not headless:
+            # Create background
+            self.background = self._create_background()
+            self.world_surface = None
+            self._build_layers()
+
+            # Dirty-rect presentation
+            self.renderer = DirtyRectRenderer((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._watch_dirty_regions()
+
+        # Frame profiler overlay (F3)
+        self.profiler = FrameProfiler((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._register_profiling()
         # Debug variable
 
+    def _create_mat(self):
+        """Create the ticket mat."""
+        return TicketMatManager(camera=self.camera)
+
+    def _build_layers(self):
+        """Named draw layers: world layers go through the camera, UI doesn't."""
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.world_layers = Compositor(size)
+        self.world_layers.add_layer("background", lambda s: s.blit(self.background, (0, 0)), STATIC)
+        self.world_layers.add_layer("mat", lambda s: self.mat.draw_mat(s), STATIC)
+        self.world_layers.add_layer("tickets", lambda s: self.mat.draw_tickets(s), PER_FRAME)
+
+        self.ui_layers = Compositor(size)
+        # Redeem box + dragged ticket
+        self.ui_layers.add_layer("overlay", lambda s: self.mat.draw_overlay(s), PER_FRAME)
+        self.ui_layers.add_layer("hud", self._draw_hud, ON_CHANGE, key=self._hud_key)
+        self.ui_layers.add_layer("fx", self._draw_fx, PER_FRAME)
+        # Side menus (triggers + panels, on top of game)
+        self.ui_layers.add_layer("menus", lambda s: self.side_menus.draw(s), PER_FRAME)
+
+    def _hud_key(self):
+        """Everything the HUD layer shows; it's re-rendered when this changes."""
+        p = self.player
+        pee_btn = self.main_buttons.pee_btn
+        return (round(p.money, 2), p.tickets_scratched, int(p.total_earned), p.biggest_win,
+                p.player_level, pee_btn.enabled, pee_btn.hovered,
+                tuple(int(bar.rect.width * bar.get_percent()) for bar in
+                      (self.hunger_bar, self.morale_bar, self.xp_bar, self.pee_bar)))
+
+    def _world_buffer(self):
+        """Off-screen world layer the camera presents."""
+        if self.world_surface is None:
+            self.world_surface = pygame.Surface(self.screen.get_size()).convert()
+        return self.world_surface
+
     def _create_background(self):
         """Create static background."""
 
         # LOAD pixel art background instead of drawing it
-        bg_image = pygame.image.load("assets/background/temp_bg.png").convert()
+        bg_image = load_image("assets/background/temp_bg.png", alpha=False)
         bg = pygame.transform.scale(bg_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
         return bg
 
@@ -142,11 +258,13 @@ class Game:
             return True
         return False
 
-    def handle_scratch(self, mouse_pos, ticket=None):
-        """Scratch the given ticket (or auto-detected from mouse position).
-        Only the topmost ticket at the point can be scratched (z-order blocking)."""
+    def handle_scratch(self, world_pos, ticket=None):
+        """Scratch the given ticket (or auto-detected from the point).
+        *world_pos* is in world coordinates — map mouse input through the
+        camera first. Only the topmost ticket at the point can be scratched
+        (z-order blocking)."""
         if ticket is None:
-            ticket = self.mat.get_ticket_at_point(mouse_pos)
+            ticket = self.mat.get_ticket_at_point(world_pos)
         if ticket is None or ticket.is_complete():
             return
 
@@ -155,20 +273,7 @@ class Game:
 
         radius = self.player.get_scratch_radius()
 
-        mx, my = mouse_pos
-
-        # Same offsets used in draw()
-        shake_offset = self.screen_shake.get_offset()
-
-        if self.drunk.enabled:
-            drunk_offset = self.drunk.get_offset()
-            ticket_offset = self.drunk.get_ticket_offset()
-
-            mx -= (shake_offset[0] + drunk_offset[0]) * 0.4 + ticket_offset[0]
-            my -= (shake_offset[1] + drunk_offset[1]) * 0.4 + ticket_offset[1]
-        else:
-            mx -= shake_offset[0]
-            my -= shake_offset[1]
+        mx, my = world_pos
 
         result = ticket.scratch(mx, my, radius)
 
@@ -186,6 +291,7 @@ class Game:
 
     def _handle_ticket_complete(self, ticket):
         """Handle when a ticket is fully scratched."""
+        self.mat.mark_complete(ticket)
         prize = ticket.get_prize()
         self.player.scratch_ticket()
 
@@ -202,47 +308,9 @@ class Game:
             ticket_center_x = ticket.x + ticket.width // 2
             ticket_center_y = ticket.y + ticket.height // 2
 
-            # $1000+ JACKPOT
-            if prize >= 1000:
-                self.particles.add_big_win_particles(ticket_center_x, ticket_center_y, prize)
-                self.screen_shake.shake(48, 1.2)
-                self.player.gain_morale(400)
-
-            # $500+
-            elif prize >= 500:
-                self.particles.add_big_win_particles(ticket_center_x, ticket_center_y, prize)
-                self.screen_shake.shake(40, 0.9)
-                self.player.gain_morale(250)
-
-            # $250+
-            elif prize >= 250:
-                self.particles.add_big_win_particles(ticket_center_x, ticket_center_y, prize)
-                self.screen_shake.shake(32, 0.7)
-                self.player.gain_morale(180)
-
-            # $100+
-            elif prize >= 100:
-                self.particles.add_big_win_particles(ticket_center_x, ticket_center_y, prize)
-                self.screen_shake.shake(22, 0.55)
-                self.player.gain_morale(120)
-
-            # $50+
-            elif prize >= 50:
-                self.particles.add_win_particles(ticket_center_x, ticket_center_y, prize, 80)
-                self.screen_shake.shake(14, 0.4)
-                self.player.gain_morale(70)
-
-            # $25+
-            elif prize >= 25:
-                self.particles.add_win_particles(ticket_center_x, ticket_center_y, prize, 50)
-                self.screen_shake.shake(8, 0.3)
-                self.player.gain_morale(50)
-
-            # Small wins
-            else:
-                self.particles.add_win_particles(ticket_center_x, ticket_center_y, prize, 20)
-                self.screen_shake.shake(4, 0.18)
-                self.player.gain_morale(15)
+            # Particles and shake are merged with any other wins this moment
+            self.celebrations.add_win(prize, ticket_center_x, ticket_center_y)
+            self.player.gain_morale(tier_for(prize)["morale"])
 
         else:
             self.messages.add_message("Try again!", (255, 150, 100), flag="TRY_AGAIN")
@@ -253,17 +321,39 @@ class Game:
 
     def _redeem_ticket(self, ticket):
         """Redeem a completed ticket dropped on the redeem box."""
-        prize = ticket.get_prize()
-        if prize > 0:
-            self.player.earn(prize)
-            self.messages.add_message(f"+${prize}", (100, 255, 100), 1.0, flag="AMOUNT_TEXT")
+        self._redeem_tickets([ticket])
+
+    def _redeem_tickets(self, tickets):
+        """Redeem completed tickets as one transaction: pay out the summed
+        prizes, deal replacements in one pass, rebuild unlock-dependent UI
+        once and save once."""
+        if not tickets:
+            return
+        total = 0
+        for ticket in tickets:
+            prize = ticket.get_prize()
+            if prize > 0:
+                self.player.earn(prize)
+                total += prize
+        if total > 0:
+            if len(tickets) > 1:
+                text = f"+${total} ({len(tickets)} tickets)"
+            else:
+                text = f"+${total}"
+            self.messages.add_message(text, (100, 255, 100), 1.0, flag="AMOUNT_TEXT")
 
-        self.mat.remove_ticket(ticket)
+        self.mat.remove_tickets(tickets)
         self.player.save_game()
 
         # Update shop buttons for unlocks
         self.ticket_shop.setup_buttons(TICKET_TYPES, self.player.get_unlocked_tickets())
 
+    def redeem_all_winners(self):
+        """Redeem every completed winner on the mat. Returns how many were redeemed."""
+        winners = self.mat.get_completed_winners()
+        self._redeem_tickets(winners)
+        return len(winners)
+
     def _stash_ticket(self, ticket):
         """Stash a ticket to the ticket inventory (shrink+fly)."""
         self.mat.stash_ticket(ticket)
@@ -276,16 +366,13 @@ class Game:
         if speed == 0 or target is None:
             return
 
-        self.auto_scratch_timer += dt
         interval = 1.0 / speed
+        self.auto_scratch_timer += dt
 
-        while self.auto_scratch_timer >= interval:
-            self.auto_scratch_timer -= interval
-
-            # Re-check target each scratch (might have completed)
-            target = self.mat.auto_scratch_target()
-            if target is None:
-                break
+        if self.auto_scratch_timer >= interval:
+            # Keep the leftover so the rate holds, but bank at most one
+            # more scratch (no burst after a hitch)
+            self.auto_scratch_timer = min(self.auto_scratch_timer - interval, interval)
 
             x = target.x + random.randint(30, target.width - 30)
             y = target.y + random.randint(50, target.height - 30)
@@ -293,7 +380,8 @@ class Game:
             self.handle_scratch((x, y), ticket=target)
 
     def auto_collect(self, dt):
-        """Handle auto-collecting: auto-redeem first completed winner on mat."""
+        """Handle auto-collecting: once the delay has passed since a winner
+        appeared, redeem every completed winner on the mat in one batch."""
         delay = self.player.get_auto_collect_delay()
         if delay is None:
             return
@@ -307,7 +395,7 @@ class Game:
 
         if self.auto_collect_timer >= delay:
             self.auto_collect_timer = 0
-            self._redeem_ticket(winner)
+            self.redeem_all_winners()
     def check_for_lose_condition(self):
         if self.player.morale <= 0:
             self.game_lost = True
@@ -378,24 +466,16 @@ class Game:
                 self.side_menus.setup_inventory(self.player)
         elif key == "ticket_inventory":
             # Stashed ticket pulled out — unstash and start dragging
-            self.mat.unstash_ticket(value, pygame.mouse.get_pos())
+            self.mat.unstash_ticket(value, self.input.mouse_pos)
             self.side_menus.close_active()
             self.side_menus.setup_ticket_inventory(
                 self.mat.mat_tickets, self.mat.ticket_queue, self.mat.stashed_tickets)
 
     def update(self, dt):
-        """Update game state."""
-        mouse_pos = pygame.mouse.get_pos()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-
-        # Detect click (mouse down this frame, wasn't down last frame)
-        mouse_clicked = mouse_pressed and not self.mouse_was_pressed
-        # Detect release (was pressed last frame, not pressed now)
-        mouse_released = not mouse_pressed and self.mouse_was_pressed
-
+        """Advance one simulation step."""
         # Pee minigame takes over entirely
         if self.pee_minigame_active:
-            result = self.pee_minigame.update(pygame.key.get_pressed(), dt)
+            result = self.pee_minigame.update(self.input, dt)
             if result is not None:
                 accuracy = result["accuracy"]
                 xp_reward = int(accuracy * PEE_CONFIG["xp_per_accuracy_point"])
@@ -408,17 +488,42 @@ class Game:
                     self.messages.add_message("Relief!", (100, 255, 200))
                 self.pee_minigame_active = False
                 self.player.save_game()
-            self.mouse_was_pressed = mouse_pressed
+            self.mouse_was_pressed = self.input.mouse_pressed
             return
 
+        self.scheduler.tick(dt)
+
+    # ------------------------------------------------------------------
+    # Systems (see _register_systems)
+    # ------------------------------------------------------------------
+
+    def _register_systems(self):
+        """Game-state systems and their tick rates."""
+        sched = self.scheduler
+        sched.register("animation", self._update_animation, priority=100)
+        sched.register("input", self._update_input, priority=90)
+        # Every step: a coarser tick shifts the auto-collect delay by up to a tick
+        sched.register("automation", self._update_automation, priority=50)
+        sched.register("stats", self._update_stats, hz=10, priority=40)
+        sched.register("effects", self._update_effects, priority=10)
+
+    def _update_animation(self, dt):
         # === MAT ANIMATIONS (always run) ===
         self.mat.update(dt)
 
-        # === SIDE MENU SYSTEM (non-blocking) ===
-
-        # 1. Animate panels every frame
+        # Animate side panels
         self.side_menus.animate_all(dt)
 
+    def _update_input(self, dt):
+        """Side menus, dragging, scratching, smoking and the pee button."""
+        mouse_pos = self.input.mouse_pos
+        mouse_pressed = self.input.mouse_pressed
+        # Click / release edges against last step's button state
+        mouse_clicked = mouse_pressed and not self.mouse_was_pressed
+        mouse_released = not mouse_pressed and self.mouse_was_pressed
+
+        # === SIDE MENU SYSTEM (non-blocking) ===
+
         # 2. Check trigger clicks (toggle / swap panels)
         triggered = self.side_menus.update_triggers(mouse_pos, mouse_clicked)
         if triggered:
@@ -438,7 +543,10 @@ class Game:
         if not mouse_in_menu:
             # --- DRAG SYSTEM ---
             if mouse_clicked and not self.mat.is_dragging:
-                self.mat.start_drag(mouse_pos)
+                if not self.mat.start_drag(mouse_pos):
+                    # Clicking the redeem box collects every finished winner
+                    if self.mat.redeem_box.contains_point(mouse_pos):
+                        self.redeem_all_winners()
 
             if mouse_pressed and self.mat.is_dragging:
                 self.mat.update_drag(mouse_pos)
@@ -458,9 +566,10 @@ class Game:
                     elif drag_result["action"] == "stash":
                         self._stash_ticket(drag_result["ticket"])
 
-            # --- SCRATCHING (only when NOT dragging) ---
-            if mouse_pressed and not self.mat.is_dragging:
-                self.handle_scratch(mouse_pos)
+            # --- SCRATCHING (only when NOT dragging, once per frame) ---
+            if mouse_pressed and not self.mat.is_dragging and self.scratch_due:
+                self.scratch_due = False
+                self.handle_scratch(self.camera.screen_to_world(mouse_pos))
 
             # PEE action button
             if mouse_clicked:
@@ -469,9 +578,29 @@ class Game:
                         self.pee_minigame.start(self.player)
                         self.pee_minigame_active = True
 
-        # Auto mechanics (always run)
+        self._update_smoking(dt)
+        self.mouse_was_pressed = mouse_pressed
+
+    def _update_smoking(self, dt):
+        """Hold SPACE to puff while the smoking effect is active."""
+        if self.player.has_effect("smoking") and self.input.key_down(pygame.K_SPACE):
+            self.cigarette.start_smoking()
+            if self.player.morale < self.player.morale_cap:
+                self.player.morale += 15 * dt  # morale gain while smoking
+            # XP from smoking
+            if self.player.gain_xp(LEVEL_CONFIG["xp_sources"]["smoking_per_second"] * dt):
+                self.messages.add_message(f"LEVEL UP! Lv.{self.player.player_level}", (255, 255, 100))
+            # Drain cigarette faster while actively puffing
+            self.player.active_effects["smoking"] -= dt * 1.5
+        else:
+            self.cigarette.stop_smoking()
+
+    def _update_automation(self, dt):
         self.auto_scratch(dt)
         self.auto_collect(dt)
+
+    def _update_stats(self, dt):
+        """Effects, hunger, morale, bladder, the lose check and save errors."""
         self.player.decay_active_effects(dt)
         self.player.drain_hunger(dt)
         self.player.passive_morale_drain(dt)
@@ -491,18 +620,9 @@ class Game:
         elif not bladder_full:
             self.pee_accident_timer = 0.0
 
-        # Update pee accident animation
-        if self.pee_accident_active:
-            anim_done = self.pee_cam.update(dt)
-            if anim_done:
-                # Animation finished — set game over, drain bladder
-                self.game_lost = True
-                self.player.current_bladder = 0
-                self.pee_accident_active = False
-                self.pee_cam.stop()
-                self.messages.add_message("You peed yourself!", (255, 80, 80))
-
         self.check_for_lose_condition()
+        for error in self.player.take_save_errors():
+            self.messages.add_message(f"Save failed: {error}", (255, 100, 100))
         # Drive drunk visuals from active effects
         drunk_active = self.player.active_effects.get("drunk", 0) > 0
 
@@ -510,155 +630,348 @@ class Game:
             self.drunk.enabled = True  # start effect (keep time running)
         elif (not drunk_active) and self.drunk.enabled:
             self.drunk.enabled = False  # stop effect
-            self.drunk.time = 0.0  # optional: reset sway phase
-            if hasattr(self.drunk, "ghost_trails"):
-                self.drunk.ghost_trails.clear()  # optional: clear smear history
-            if hasattr(self.drunk, "ghost_positions"):
-                self.drunk.ghost_positions.clear()  # optional: clear old ghost positions
-            if hasattr(self.drunk, "ghost_cache"):
-                self.drunk.ghost_cache.clear()  # optional: rebuild caches next time
+            self.drunk.reset()
 
         # Stop cigarette if smoking effect expired
         if not self.player.has_effect("smoking"):
             self.cigarette.stop_smoking()
 
+    def _update_effects(self, dt):
+        # Update pee accident animation
+        if self.pee_accident_active:
+            anim_done = self.pee_cam.update(dt)
+            if anim_done:
+                # Animation finished — set game over, drain bladder
+                self.game_lost = True
+                self.player.current_bladder = 0
+                self.pee_accident_active = False
+                self.pee_cam.stop()
+                self.messages.add_message("You peed yourself!", (255, 80, 80))
+
+        self.cigarette.update(dt, visible=self.player.has_effect("smoking"))
+
         # Update effects
+        self.celebrations.update(dt)
         self.particles.update(dt)
         self.screen_shake.update(dt)
         self.messages.update(dt)
         # if drunk on update drunk
         self.drunk.update(dt)
-
-        self.mouse_was_pressed = mouse_pressed
+        self.camera.update()
+
+    def step(self, frame_dt):
+        """Run the fixed-step updates owed for *frame_dt* seconds."""
+        self.sim_accumulator += frame_dt
+        self.scratch_due = True
+        steps = 0
+        while self.sim_accumulator >= SIM_DT and steps < MAX_SIM_STEPS:
+            self.update(SIM_DT)
+            self.sim_accumulator -= SIM_DT
+            steps += 1
+        if steps == MAX_SIM_STEPS:
+            # Hitch: drop the backlog rather than catch up next frame
+            self.sim_accumulator = min(self.sim_accumulator, SIM_DT * 0.999)
+        self.render_alpha = self.sim_accumulator / SIM_DT
+        return steps
+
+    def simulate(self, frames, dt=SIM_DT, policy=None):
+        """Advance *frames* frames of *dt* seconds without drawing.
+
+        *policy(game)* runs before each frame and may set ``game.input``
+        or call game actions (buy, redeem, ...). Returns the number of
+        simulation steps run.
+        """
+        steps = 0
+        for _ in range(frames):
+            if policy is not None:
+                policy(self)
+            steps += self.step(dt)
+        return steps
 
     def draw(self):
         """Draw the game."""
+        if self.headless:
+            return
         # Pee minigame takes over the screen
         if self.pee_minigame_active:
             self.pee_minigame.draw(self.screen)
             pygame.display.flip()
+            self.renderer.force_full()  # everything is stale when we return
             return
 
-        shake_offset = self.screen_shake.get_offset()
-        drunk_offset = self.drunk.get_offset()
+        # Shake, sway and drunk vision move every pixel: redraw everything
+        self.renderer.mark_many(self.mat.dirty_rects())
+        if self.profiler.needs_redraw():
+            self.renderer.mark(self.profiler.rect)
+        moving = self.camera.is_moving or self.drunk.enabled
+        full, regions = self.renderer.begin_frame(force_full=moving)
 
-        self.screen.blit(self.background, (0, 0))
+        if full:
+            self._compose()
+            self.profiler.draw(self.screen)
+        else:
+            for region in regions:
+                self._compose(region)
+                # The overlay is translucent: only repaint it over fresh pixels
+                self.screen.set_clip(region)
+                self.profiler.draw(self.screen)
+                self.screen.set_clip(None)
+        self.renderer.present(full, regions)
+
+    def _compose(self, clip=None):
+        """Draw the frame, limited to *clip* when given (camera is still)."""
+        # World layer (background, mat, tickets) is drawn unshifted off-screen,
+        # then the camera presents it with shake / sway (and drunk vision)
+        world = self._world_buffer()
+        world.set_clip(clip)
+        self.world_layers.compose(world)
+        world.set_clip(None)
+        if clip is None:
+            self.camera.present(self.screen, world, BG_COLOR)
+        else:
+            self.screen.blit(world, clip, clip)
 
-        # Draw ticket mat (mat background + tickets + redeem box)
-        self.mat.draw(self.screen, shake_offset, drunk_offset, self.drunk)
+        self.screen.set_clip(clip)
+        self.ui_layers.compose(self.screen)
+        self.screen.set_clip(None)
 
-        # Draw HUD
-        self.hud.draw(self.screen, self.player)
+    def _draw_hud(self, surface):
+        self.hud.draw(surface, self.player)
         # Draw Morale Bar
-        self.morale_bar.draw(self.screen)
+        self.morale_bar.draw(surface)
 
         # Draw Hunger Bar
-        self.hunger_bar.draw(self.screen)
+        self.hunger_bar.draw(surface)
         # Draw XP Bar
-        self.xp_bar.draw(self.screen)
+        self.xp_bar.draw(surface)
         lvl_text = self.level_font.render(f"LVL {self.player.player_level}", True, (220, 200, 120))
-        self.screen.blit(lvl_text, (255, 115))
+        surface.blit(lvl_text, LEVEL_TEXT_POS)
         # Draw Pee Bar
-        self.pee_bar.draw(self.screen)
+        self.pee_bar.draw(surface)
         # Draw PEE button only (COLLECT phased out)
         if self.main_buttons.pee_btn.enabled:
-            self.main_buttons.pee_btn.draw(self.screen)
+            self.main_buttons.pee_btn.draw(surface)
 
-        # Draw particles
-        self.particles.draw(self.screen)
+    def _draw_fx(self, surface):
+        # Draw particles (interpolated between the last two steps)
+        self.particles.draw(surface, self.render_alpha)
 
         # Draw messages
-        self.messages.draw(self.screen, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.messages.draw(surface, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         if self.player.has_effect("smoking"):
             remaining = self.player.active_effects.get("smoking", 0)
-            self.cigarette.draw(self.screen, remaining=remaining, total=45)
+            self.cigarette.draw(surface, remaining=remaining, total=45)
 
         # Draw pee accident cam
         if self.pee_accident_active or self.pee_cam.finished:
-            self.pee_cam.draw(self.screen)
-
-        # Draw side menus (triggers + panels, on top of game)
-        self.side_menus.draw(self.screen)
+            self.pee_cam.draw(surface)
+
+    def _watch_dirty_regions(self):
+        """Register the screen-space widgets whose changes trigger a redraw."""
+        r = self.renderer
+        p = self.player
+        r.watch(lambda: HUD_RECT,
+                lambda: (round(p.money, 2), p.tickets_scratched,
+                         int(p.total_earned), p.biggest_win))
+        for bar in (self.hunger_bar, self.morale_bar, self.xp_bar, self.pee_bar):
+            r.watch(lambda bar=bar: bar.rect.inflate(6, 6),
+                    lambda bar=bar: int(bar.rect.width * bar.get_percent()))
+        r.watch(lambda: LEVEL_TEXT_RECT, lambda: p.player_level)
+        pee_btn = self.main_buttons.pee_btn
+        r.watch(lambda: pee_btn.rect if pee_btn.enabled else None,
+                lambda: pee_btn.hovered)
+        r.watch(self.particles.bounds)
+        r.watch(lambda: self.messages.get_bounds(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+                if self.messages.messages else None)
+        r.watch(lambda: self.cigarette.get_bounds() if p.has_effect("smoking") else None)
+        r.watch(lambda: self.pee_cam.get_bounds()
+                if self.pee_accident_active or self.pee_cam.finished else None)
+        r.watch(self.side_menus.get_trigger_bounds, self.side_menus.get_trigger_state)
+        r.watch(self.side_menus.get_panel_bounds)
+
+        # Rounded widgets that must be redrawn whole when a region touches them
+        r.add_solid(lambda: self.mat.ticket_rects())
+        r.add_solid(lambda: [bar.rect.inflate(6, 6) for bar in
+                             (self.hunger_bar, self.morale_bar, self.xp_bar, self.pee_bar)])
+        r.add_solid(lambda: [pee_btn.rect, self.mat.redeem_box.rect.inflate(4, 4)]
+                    + [t.rect for t in self.side_menus.triggers.values()])
+
+    def _register_profiling(self):
+        """Phases and counters shown by the F3 profiler overlay."""
+        prof = self.profiler
+        for name in ("input", "automation", "stats"):
+            prof.time(self.scheduler.get(name), "fn", name)
+        prof.time(lambda: self.mat, "update", "mat update")
+        prof.time(self.side_menus, "animate_all", "side menus")
+        prof.time(self.particles, "update", "particles update")
+        if not self.headless:
+            prof.time(self.world_layers, "compose", "world (mat draw)")
+            prof.time(self.world_layers.layer("tickets"), "draw", "tickets layer")
+            prof.time(self.camera, "present", "camera / drunk")
+            prof.time(self.ui_layers.layer("hud"), "draw", "hud render")
+            prof.time(self.ui_layers.layer("fx"), "draw", "fx (particles)")
+            prof.time(self.ui_layers.layer("menus"), "draw", "menus")
+            prof.time(self.renderer, "present", "present / flip")
+        prof.gauge("particles", lambda: self.particles.count)
+        prof.gauge("tickets on mat", lambda: len(self.mat.mat_tickets))
+        prof.gauge("tickets queued", lambda: len(self.mat.ticket_queue))
+        prof.count(self.particles.stamps, "get", "stamp lookups")
+        prof.count(self.particles.stamps, "_build", "stamp builds")
+        prof.hit_rate("stamp cache", "stamp lookups", "stamp builds")
+
+    def handle_event(self, event):
+        """React to one pygame event."""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.MOUSEWHEEL:
+            # Side menu scroll
+            self.side_menus.handle_scroll(event.y, self.input.mouse_pos)
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            # Handle drag release via event (backup — also handled in update)
+            if self.mat.is_dragging:
+                side_panel_rect = None
+                if self.side_menus.active_panel_key == "ticket_inventory":
+                    panel = self.side_menus.panels["ticket_inventory"]
+                    if panel.is_open:
+                        side_panel_rect = panel.get_panel_rect()
 
-        pygame.display.flip()
+                drag_result = self.mat.end_drag(self.input.mouse_pos, side_panel_rect)
+                if drag_result:
+                    if drag_result["action"] == "redeem":
+                        self._redeem_ticket(drag_result["ticket"])
+                    elif drag_result["action"] == "stash":
+                        self._stash_ticket(drag_result["ticket"])
 
-    def run(self):
-        """Main game loop."""
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                # Cancel drag first
+                if self.mat.is_dragging:
+                    self.mat.cancel_drag()
+                # Cancel pee minigame
+                elif self.pee_minigame_active:
+                    self.pee_minigame.cancel()
+                    self.pee_minigame_active = False
+                # Close side menu panel
+                elif self.side_menus.active_panel_key:
+                    self.side_menus.close_active()
+                else:
+                    self.running = False
+            elif event.key == pygame.K_r:
+                # Reset game (debug)
+                self.player.reset_game()
+                self.mat = self._create_mat()
+                if not self.headless:
+                    self.world_layers.invalidate("mat")
+                self.profiler.refresh()
+                self.celebrations.cancel()
+                self.auto_collect_timer = 0
+                self.ticket_shop.setup_buttons(TICKET_TYPES, self.player.get_unlocked_tickets())
+                self.upgrade_shop.setup_buttons(UPGRADES, self.player)
+                self.messages.add_message("Game Reset!", (255, 100, 100))
+
+            elif event.key == pygame.K_c:
+                # Collect all completed winners
+                self.redeem_all_winners()
+
+            elif event.key == pygame.K_F3:
+                # Frame profiler overlay
+                self.profiler.toggle()
+                if not self.headless:
+                    self.renderer.force_full()
+
+            elif event.key == pygame.K_d:
+                # Press D to test things :)
+                self.player.current_hunger -= 10
+
+    def frame(self, dt, work_ms, events):
+        """One frame: *events*, then the steps owed for *dt*, then drawing.
+
+        *work_ms* is the previous frame's work time, for the particle
+        governor. ``game.input`` must already hold this frame's state.
+        """
+        # Let particle emission back off when frames run over budget
+        self.particles.governor.report_frame(work_ms, dt)
+        for event in events:
+            self.handle_event(event)
+
+        profiling = self.profiler.enabled
+        if profiling:
+            self.profiler.begin_frame()
+        self.step(dt)
+        self.draw()
+        if profiling:
+            self.profiler.end_frame(dt)
+
+    def run(self, recorder=None, replay=None):
+        """Main game loop.
+
+        With an ``InputRecorder`` the session's input is recorded as it is
+        played. With an ``InputReplay`` a recorded session is played back
+        instead of reading the devices; closing the window or Escape stops
+        it and F3 still toggles the profiler.
+        """
+        if replay is not None:
+            replay.start(self)
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
-            #Control Handler
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif event.type == pygame.MOUSEWHEEL:
-                    # Side menu scroll
-                    self.side_menus.handle_scroll(event.y, pygame.mouse.get_pos())
-
-                elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-                    # Handle drag release via event (backup — also handled in update)
-                    if self.mat.is_dragging:
-                        side_panel_rect = None
-                        if self.side_menus.active_panel_key == "ticket_inventory":
-                            panel = self.side_menus.panels["ticket_inventory"]
-                            if panel.is_open:
-                                side_panel_rect = panel.get_panel_rect()
-
-                        drag_result = self.mat.end_drag(pygame.mouse.get_pos(), side_panel_rect)
-                        if drag_result:
-                            if drag_result["action"] == "redeem":
-                                self._redeem_ticket(drag_result["ticket"])
-                            elif drag_result["action"] == "stash":
-                                self._stash_ticket(drag_result["ticket"])
-
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        # Cancel drag first
-                        if self.mat.is_dragging:
-                            self.mat.cancel_drag()
-                        # Cancel pee minigame
-                        elif self.pee_minigame_active:
-                            self.pee_minigame.cancel()
-                            self.pee_minigame_active = False
-                        # Close side menu panel
-                        elif self.side_menus.active_panel_key:
-                            self.side_menus.close_active()
-                        else:
-                            self.running = False
-                    elif event.key == pygame.K_r:
-                        # Reset game (debug)
-                        self.player.reset_game()
-                        self.mat = TicketMatManager()
-                        self.auto_collect_timer = 0
-                        self.ticket_shop.setup_buttons(TICKET_TYPES, self.player.get_unlocked_tickets())
-                        self.upgrade_shop.setup_buttons(UPGRADES, self.player)
-                        self.messages.add_message("Game Reset!", (255, 100, 100))
-
-                    elif event.key == pygame.K_d:
-                        # Press D to test things :)
-                        self.player.current_hunger -= 10
-
-                keys = pygame.key.get_pressed()
-
-                if self.player.has_effect("smoking") and keys[pygame.K_SPACE]:
-                    self.cigarette.start_smoking()
-                    if self.player.morale < self.player.morale_cap:
-                        self.player.morale += 15 * dt  # morale gain while smoking
-                    # XP from smoking
-                    if self.player.gain_xp(LEVEL_CONFIG["xp_sources"]["smoking_per_second"] * dt):
-                        self.messages.add_message(f"LEVEL UP! Lv.{self.player.player_level}", (255, 255, 100))
-                    # Drain cigarette faster while actively puffing
-                    self.player.active_effects["smoking"] -= dt * 1.5
-                else:
-                    self.cigarette.stop_smoking()
-
-            self.update(dt)
-            self.draw()
+            work_ms = self.clock.get_rawtime()
+            events = pygame.event.get()
+            if replay is not None:
+                for event in events:
+                    if event.type == pygame.QUIT or \
+                            (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                        self.running = False
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.handle_event(event)
+                if replay.done or not self.running:
+                    break
+                dt, work_ms, events = replay.next_frame(self.input)
+            else:
+                self.input.poll()
+                if recorder is not None:
+                    recorder.record(dt, work_ms, events, self.input)
+            self.frame(dt, work_ms, events)
 
+        if replay is not None and replay.done:
+            print("replay in sync" if replay.matches(self) else "replay OUT OF SYNC")
         self.player.save_game()
+        if not self.player.close_save():
+            errors = self.player.take_save_errors()
+            print(f"Could not save the game: {errors[-1] if errors else 'timed out'}", file=sys.stderr)
+        if recorder is not None:
+            recorder.save(self)
         pygame.quit()
         sys.exit()
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gas Station Lotto")
+    parser.add_argument("--record", metavar="FILE", help="record this session's input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recorded session")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay: no window, run flat out and print frame timings")
+    parser.add_argument("--seed", type=int, help="random seed (recordings pick one if not given)")
+    args = parser.parse_args(argv)
+    if args.record and args.replay:
+        parser.error("--record and --replay can't be combined")
+    if args.headless and not args.replay:
+        parser.error("--headless needs --replay")
+
+    if args.replay:
+        replay = InputReplay(args.replay)
+        game = Game(headless=args.headless, persist=False, seed=replay.seed)
+        if args.headless:
+            print(json.dumps(play_headless(game, replay), indent=2))
+            return
+        game.run(replay=replay)
+    elif args.record:
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+        game = Game(seed=seed)
+        game.run(recorder=InputRecorder(args.record, game, seed))
+    else:
+        Game(seed=args.seed).run()
+
+
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    main()